@@ -1,7 +1,27 @@
 from .typed import typed
+from .aggregation import WarningAggregator
+from .plan import plan_statistics, warmup, warmup_in_background
+from .plan_cache import disable_plan_cache, enable_plan_cache
+from .budget import Budget, request_budget
+from .explain import explain
+from .checked import checked, CheckedDict, CheckedList, CheckedSet
+from .import_hook import install, uninstall
+from .hooks import register_hook, unregister_hook, ValidationHook
+from .constraints import Constraint, Gt, Ge, Lt, Le, MinLen, MaxLen, Regex
+from .shadow import ShadowValidator
+from .profiling import disable_profiling, enable_profiling, replay
+from .stats import disable_statistics, enable_statistics, read_statistics
+from .sinks import (
+    ViolationSink,
+    LoggingSink,
+    RingBufferSink,
+    JSONLinesFileSink,
+    BatchingDispatcher,
+)
 from .violations import (
     RuntimeTypingViolation,
     ComplexRuntimeTypingViolation,
     RuntimeTypingError,
+    RuntimeTypingNameError,
     RuntimeTypingWarning,
 )
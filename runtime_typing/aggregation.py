@@ -0,0 +1,194 @@
+"""Aggregation of repeated violations into periodic warnings."""
+
+import atexit
+import os
+
+from collections import OrderedDict
+from threading import Lock, Timer
+from time import monotonic
+from typing import TYPE_CHECKING, Hashable, Optional, Tuple, Type
+from warnings import warn_explicit
+from weakref import WeakSet
+
+from runtime_typing.sinks import ViolationSink
+from runtime_typing.violations import RuntimeTypingWarning
+
+if TYPE_CHECKING:
+    from runtime_typing.violations import RuntimeTypingViolationBase
+
+
+def violation_key(violation: "RuntimeTypingViolationBase") -> Hashable:
+    """Key identifying repetitions of the same violation.
+
+    Violations are the same if they occur on the same function and parameter, with the same expectation and the same type of the actual value. Violations at different indices or keys of mappings within the parameter (i.e. with the same `pattern`) are the same, too.
+    """
+    if hasattr(violation, "violations"):
+        return tuple(violation_key(v) for v in violation.violations)
+
+    obj = violation.obj
+    got = violation.got
+
+    return (
+        getattr(obj, "__module__", None),
+        getattr(obj, "__qualname__", None),
+        violation.pattern,
+        violation.category,
+        repr(violation.expected),
+        got if isinstance(got, type) else type(got),
+    )
+
+
+def violation_location(violation: "RuntimeTypingViolationBase") -> Tuple[str, int]:
+    """File name and line number of the function the violation occurred on."""
+    while hasattr(violation, "violations"):
+        violation = violation.violations[0]
+
+    code = getattr(violation.obj, "__code__", None)
+    if code is None:
+        return __file__, 0
+
+    return code.co_filename, code.co_firstlineno
+
+
+class WarningAggregator(ViolationSink):
+    """Throw warnings for violations, aggregating repetitions.
+
+    The first occurrence of a violation is warned immediately. Repetitions are counted and warned as a summary with counts, at most once per `interval`: with the next violation after the interval, or by a timer if no violation follows, and at the exit of the interpreter for what is still pending. Warnings are thrown by `warnings.warn_explicit` without a registry, so that the `__warningregistry__` of the warning module does not grow with every distinct message.
+
+    Parameters
+    ----------
+
+    interval
+        Minimum time (in seconds) between two summaries. Default: `60.0`
+
+    max_keys
+        Maximum number of distinct violations tracked. The least recently seen violations are evicted; their pending repetitions are summarized as evicted. Default: `1024`
+
+    category
+        The warning category. Default: `runtime_typing.RuntimeTypingWarning`
+    """
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        max_keys: int = 1024,
+        category: Type[Warning] = RuntimeTypingWarning,
+    ) -> None:
+        self.interval = interval
+        self.max_keys = max_keys
+        self.category = category
+
+        self._table = OrderedDict()
+        self._evicted = 0
+        self._lock = Lock()
+        self._last_summary = monotonic()
+        self._timer = None
+        _aggregators.add(self)
+
+    def emit(self, violation: "RuntimeTypingViolationBase") -> None:
+        key = violation_key(violation)
+
+        with self._lock:
+            entry = self._table.get(key)
+            if entry is None:
+                self._table[key] = [violation.message, 0]
+                if len(self._table) > self.max_keys:
+                    _, (_, pending) = self._table.popitem(last=False)
+                    self._evicted += pending
+                first_occurrence = True
+            else:
+                entry[1] += 1
+                self._table.move_to_end(key)
+                first_occurrence = False
+                self._schedule()
+
+            summary = None
+            if monotonic() - self._last_summary >= self.interval:
+                summary = self._take_summary()
+
+        if first_occurrence:
+            filename, lineno = violation_location(violation)
+            warn_explicit(violation.message, self.category, filename, lineno)
+
+        if summary:
+            warn_explicit(summary, self.category, __file__, 0)
+
+    def flush(self) -> None:
+        """Warn the summary of repetitions right away."""
+        with self._lock:
+            summary = self._take_summary()
+
+        if summary:
+            warn_explicit(summary, self.category, __file__, 0)
+
+    def _schedule(self) -> None:
+        """Start a timer summarizing pending repetitions, in case no further violation is emitted."""
+        if self._timer is not None:
+            return
+
+        delay = max(0.0, self.interval - (monotonic() - self._last_summary))
+        self._timer = Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _reset_in_child(self) -> None:
+        """The timer thread does not survive a fork."""
+        self._lock = Lock()
+        self._timer = None
+
+    def _take_summary(self) -> str:
+        self._last_summary = monotonic()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        lines = [
+            f"{pending}x {message}"
+            for message, pending in self._table.values()
+            if pending
+        ]
+        if self._evicted:
+            lines.append(f"{self._evicted}x (evicted violations)")
+
+        for entry in self._table.values():
+            entry[1] = 0
+        self._evicted = 0
+
+        if not lines:
+            return ""
+
+        return "Repeated TypingViolations:\n    + " + "\n    + ".join(lines)
+
+
+_aggregators: "WeakSet[WarningAggregator]" = WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for aggregator in list(_aggregators):
+        aggregator.flush()
+
+
+def _reset_in_child() -> None:
+    for aggregator in list(_aggregators):
+        aggregator._reset_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_in_child)
+
+
+default_warning_aggregator = WarningAggregator()
+
+
+def handling(
+    mode: str, sink: Optional["ViolationSink"]
+) -> Tuple[str, Optional["ViolationSink"]]:
+    """Mode and sink the violations are handled with, for a mode of `typed`.
+
+    The `'aggregate'` mode is the `'sink'` mode with a `WarningAggregator`.
+    """
+    if mode == "aggregate":
+        return "sink", sink or default_warning_aggregator
+
+    return mode, sink
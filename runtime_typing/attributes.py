@@ -0,0 +1,121 @@
+"""Validation of attribute assignments on typed classes."""
+
+from abc import ABCMeta
+from random import random
+from typing import Any, ClassVar, Dict, Iterable, Optional, Tuple, Union
+
+from runtime_typing.aggregation import handling
+from runtime_typing.utils import cached_type_hints, get_root, Parameter
+
+
+class AttributePlan:
+    """The annotated attributes of a class, compiled lazily.
+
+    Attributes
+    ----------
+
+    attributes
+        Dictionary from attribute name to `(annotation, accepted_types)`. If whether a value satisfies the annotation only depends on the type of the value (e.g. for `int` or `Optional[str]`), `accepted_types` is a set of the types which have been accepted before, so that assigning values of these types again costs a single set lookup. Otherwise, it is `None`.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        exclude: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.cls = cls
+        self.exclude = set(exclude) if exclude else set()
+        self.include = set(include) if include else set()
+        self._attributes = None
+
+    @property
+    def attributes(self) -> Dict[str, Tuple[Any, Optional[set]]]:
+        if self._attributes is None:
+            self._attributes = {
+                name: (
+                    annotation,
+                    set() if depends_on_type_only(annotation) else None,
+                )
+                for name, annotation in cached_type_hints(self.cls).items()
+                if get_root(annotation) is not ClassVar
+                and (not self.include or name in self.include)
+                and name not in self.exclude
+            }
+
+        return self._attributes
+
+
+def depends_on_type_only(annotation: Any) -> bool:
+    """Whether validating against `annotation` only depends on the type of
+    the value (as for plain classes and unions of them).
+
+    Classes whose metaclass overrides `__instancecheck__`, and protocols
+    (which may be satisfied by the attributes of single instances), are checked
+    against each value instead.
+    """
+    if annotation is Any or annotation is None:
+        return True
+
+    root = get_root(annotation)
+    if root is Union:
+        return all(depends_on_type_only(arg) for arg in annotation.__args__)
+
+    return (
+        isinstance(annotation, type)
+        and root is None
+        and type(annotation).__instancecheck__
+        in (type.__instancecheck__, ABCMeta.__instancecheck__)
+        and not getattr(annotation, "_is_protocol", False)
+    )
+
+
+def install_validated_setattr(
+    cls: type,
+    mode: str = "raise",
+    defer: bool = False,
+    sink: Optional[Any] = None,
+    exclude: Optional[Iterable[str]] = None,
+    include: Optional[Iterable[str]] = None,
+    sample: Optional[float] = None,
+    **options: Any,
+) -> type:
+    """Validate every assignment of an annotated attribute of `cls` (or, with
+    `sample`, a random fraction of them)."""
+    from runtime_typing.typed_function import TypedFunction
+
+    if mode in ("return", "shadow"):
+        raise ValueError(
+            f"Assignments can not be validated in mode `{mode}`."
+        )
+
+    mode, sink = handling(mode, sink)
+    plan = AttributePlan(cls, exclude=exclude, include=include)
+    setattr_ = cls.__setattr__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        try:
+            condition, accepted_types = plan.attributes[name]
+        except KeyError:
+            return setattr_(self, name, value)
+
+        if sample is not None and random() >= sample:
+            return setattr_(self, name, value)
+
+        if accepted_types is None or type(value) not in accepted_types:
+            typed_function = TypedFunction(
+                func=cls, kwargs={}, mode=mode, defer=defer, sink=sink
+            )
+            typed_function.validate_entity(
+                parameter=Parameter(value, name), condition=condition
+            )
+            if accepted_types is not None and not typed_function.violations:
+                accepted_types.add(type(value))
+
+        setattr_(self, name, value)
+
+    __setattr__.__qualname__ = f"{cls.__qualname__}.__setattr__"
+    cls.__setattr__ = __setattr__
+    cls.__runtime_typing_attribute_plan__ = plan
+
+    return cls
@@ -0,0 +1,208 @@
+"""Budgets bounding the work spent on validation.
+
+A budget limits the number of values visited (every argument, element, key
+and field counts as one) and the time spent validating. When a budget is
+exhausted, the remaining checks are skipped, i.e. the remaining values are
+accepted without validation, and the number of skipped values is recorded.
+
+Only the time spent validating counts: the clock of a budget runs between
+`start` and `stop`, which typed functions call around validation, and it is
+paused while the typed function itself runs.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator, Optional
+
+
+class Budget:
+    """Maximum validation work.
+
+    Pass a budget to `typed` (`@typed(budget=Budget(max_elements=10_000))`) to limit the work of each call, or enter `request_budget` to limit the work of all typed calls within a request.
+
+    Parameters
+    ----------
+
+    max_elements
+        Maximum number of values visited. Default: `None` (unlimited)
+
+    max_time
+        Maximum time spent validating, in microseconds (the time spent in the typed function itself does not count). The time is checked every few values, so it may be exceeded slightly. Default: `None` (unlimited)
+
+    Attributes
+    ----------
+
+    elements
+        Number of values visited.
+
+    skipped
+        Number of values skipped, because the budget was exhausted. The budget passed to `typed` sums up the values skipped by all calls.
+
+    exhaustions
+        Number of calls (or requests) which exhausted the budget.
+    """
+
+    __slots__ = (
+        "max_elements",
+        "max_time",
+        "elements",
+        "skipped",
+        "exhaustions",
+        "exhausted",
+        "_max_seconds",
+        "_spent",
+        "_started",
+        "_origin",
+        "_parent",
+    )
+
+    TIME_CHECK_INTERVAL = 32
+
+    def __init__(
+        self,
+        max_elements: Optional[int] = None,
+        max_time: Optional[float] = None,
+    ) -> None:
+        self.max_elements = max_elements
+        self.max_time = max_time
+        self.elements = 0
+        self.skipped = 0
+        self.exhaustions = 0
+        self.exhausted = False
+        self._max_seconds = None if max_time is None else max_time / 1e6
+        self._spent = 0.0
+        self._started: Optional[float] = None
+        self._origin: Optional["Budget"] = None
+        self._parent: Optional["Budget"] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Budget(max_elements={self.max_elements!r}, "
+            f"max_time={self.max_time!r})"
+        )
+
+    def for_call(self, parent: Optional["Budget"] = None) -> "Budget":
+        """A fresh (started) budget with the same limits, for one call.
+        Skipped values are recorded on this budget, too, and `parent` is spent
+        along."""
+        budget = Budget(self.max_elements, self.max_time)
+        budget._origin = self
+        budget._parent = parent
+        budget.start()
+
+        return budget
+
+    def start(self) -> None:
+        """Start (or resume) the clock, and the clock of the parent budget."""
+        if self._started is None:
+            self._started = perf_counter()
+        if self._parent is not None:
+            self._parent.start()
+
+    def stop(self) -> None:
+        """Pause the clock, and the clock of the parent budget."""
+        if self._started is not None:
+            self._spent += perf_counter() - self._started
+            self._started = None
+        if self._parent is not None:
+            self._parent.stop()
+
+    def elapsed(self) -> float:
+        """Time spent validating, in seconds."""
+        if self._started is None:
+            return self._spent
+
+        return self._spent + perf_counter() - self._started
+
+    def spend(self) -> bool:
+        """Account for visiting one value. `False`, if the value has to be
+        skipped, because the budget is exhausted."""
+        if self._visit():
+            return True
+
+        self.skip(1)
+        return False
+
+    def _visit(self) -> bool:
+        if self.exhausted:
+            return False
+
+        self.elements += 1
+        max_elements = self.max_elements
+        if (
+            (max_elements is not None and self.elements > max_elements)
+            or (
+                self._max_seconds is not None
+                and self.elements % self.TIME_CHECK_INTERVAL == 1
+                and self.elapsed() > self._max_seconds
+            )
+            or (self._parent is not None and not self._parent._visit())
+        ):
+            self.exhaust()
+            return False
+
+        return True
+
+    def exhaust(self) -> None:
+        self.exhausted = True
+        self.exhaustions += 1
+        if self._origin is not None:
+            self._origin.exhaustions += 1
+
+    def skip(self, count: int) -> None:
+        """Record `count` values as skipped."""
+        self.skipped += count
+        if self._origin is not None:
+            self._origin.skipped += count
+        if self._parent is not None:
+            self._parent.skip(count)
+
+
+_request_budget: ContextVar[Optional[Budget]] = ContextVar(
+    "runtime_typing_request_budget", default=None
+)
+
+
+def current_request_budget() -> Optional[Budget]:
+    return _request_budget.get()
+
+
+@contextmanager
+def request_budget(
+    max_elements: Optional[int] = None, max_time: Optional[float] = None
+) -> Iterator[Budget]:
+    """Limit the validation work of all typed calls within the context (e.g.
+    a request), in the current thread or task.
+
+    Parameters
+    ----------
+
+    max_elements
+        Maximum number of values visited by all typed calls. Default: `None` (unlimited)
+
+    max_time
+        Maximum time spent validating in all typed calls, in microseconds (neither the time spent in the typed functions, nor the time spent outside of typed calls counts). Default: `None` (unlimited)
+
+    Returns
+    -------
+
+    A context manager yielding the `runtime_typing.Budget` of the request, which tells the number of skipped values afterwards.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with request_budget(max_time=2_000) as budget:
+            response = handle(request)
+
+        if budget.skipped:
+            log.info("skipped validation of %d values", budget.skipped)
+    """
+    budget = Budget(max_elements, max_time)
+    token = _request_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _request_budget.reset(token)
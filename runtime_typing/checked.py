@@ -0,0 +1,270 @@
+"""Containers validating their elements incrementally, on every mutation.
+
+A checked container is validated once, when it is created, and afterwards
+each insertion and update is validated. Typed functions accept a checked
+container for a compatible annotation without walking its elements again
+(unless an invalid element has been admitted in `'warn'` mode, or the elements
+could have been mutated into invalid ones since, e.g. the lists of a
+`List[List[int]]`). Operations
+creating new containers (e.g. `+` or `|`) return plain lists, sets and dicts.
+"""
+
+from collections.abc import Iterable
+from typing import (
+    Any,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    _GenericAlias,
+    get_args,
+)
+
+from runtime_typing.attributes import depends_on_type_only
+from runtime_typing.utils import contains_type_var, get_root, Parameter
+
+
+def verdict_is_stable(annotation: Any) -> bool:
+    """Whether a value which satisfies `annotation` keeps satisfying it,
+    however it is mutated (as for classes, and tuples of them)."""
+    if depends_on_type_only(annotation):
+        return True
+
+    root = get_root(annotation)
+    if root is Literal:
+        return True
+
+    if root in (Union, tuple, frozenset, type):
+        return all(
+            verdict_is_stable(arg)
+            for arg in get_args(annotation)
+            if arg is not Ellipsis
+        )
+
+    return False
+
+
+class CheckedContainer:
+    """Mixin of checked containers.
+
+    Attributes
+    ----------
+
+    annotation
+        The annotation the container is checked against.
+
+    tainted
+        Whether an invalid element has been admitted (in `'warn'` mode). Tainted containers are validated like any other container by typed functions.
+    """
+
+    annotation: Any = None
+    mode = "raise"
+    tainted = False
+    _element_conditions: Tuple[Any, ...] = ()
+    _trusted: Optional[bool] = None
+
+    def satisfies(self, condition: Any) -> bool:
+        """Whether the container satisfies `condition`, without validating
+        its elements (i.e. in O(1)).
+
+        Only containers whose elements can not be mutated into invalid ones,
+        and whose annotation does not contain a `TypeVar` (which has to be
+        bound by the elements), are trusted.
+        """
+        if self.tainted:
+            return False
+
+        trusted = self._trusted
+        if trusted is None:
+            trusted = self._trusted = all(
+                verdict_is_stable(element_condition)
+                and not contains_type_var(element_condition)
+                for element_condition in self._element_conditions
+            )
+        if not trusted:
+            return False
+
+        if condition == self.annotation:
+            return True
+
+        root = get_root(condition)
+        if not isinstance(root, type) or not isinstance(self, root):
+            return False
+
+        return get_args(condition) in ((), get_args(self.annotation))
+
+    def _validate(self, values: Iterable, condition: Any) -> None:
+        from runtime_typing.typed_function import TypedFunction
+
+        typed_function = TypedFunction(
+            func=type(self), kwargs={}, mode=self.mode, defer=False
+        )
+        parent = Parameter(None, "self")
+        for key, value in values:
+            typed_function.validate_entity(
+                Parameter(value, key, parent), condition
+            )
+
+        if typed_function.violations:
+            self.tainted = True
+
+    def __reduce__(self) -> tuple:
+        data = dict(self) if isinstance(self, dict) else list(self)
+        return (checked, (self.annotation, data, self.mode))
+
+
+class CheckedList(CheckedContainer, list):
+    """List validating `append`, `extend`, `insert`, item assignment and
+    `+=`."""
+
+    _element_conditions = (Any,)
+
+    def __init__(self, values: Iterable = ()) -> None:
+        super().__init__(self._check(0, list(values)))
+
+    def _check(self, start: int, values: List[Any]) -> List[Any]:
+        self._validate(enumerate(values, start), self._element_conditions[0])
+        return values
+
+    def append(self, value: Any) -> None:
+        self._check(len(self), [value])
+        super().append(value)
+
+    def extend(self, values: Iterable) -> None:
+        super().extend(self._check(len(self), list(values)))
+
+    def insert(self, index: int, value: Any) -> None:
+        self._check(index, [value])
+        super().insert(index, value)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = self._check(index.start or 0, list(value))
+        else:
+            self._check(index, [value])
+        super().__setitem__(index, value)
+
+    def __iadd__(self, values: Iterable) -> "CheckedList":
+        self.extend(values)
+        return self
+
+
+class CheckedSet(CheckedContainer, set):
+    """Set validating `add`, `update`, `symmetric_difference_update`, `|=`
+    and `^=`."""
+
+    _element_conditions = (Any,)
+
+    def __init__(self, values: Iterable = ()) -> None:
+        super().__init__(self._check(list(values)))
+
+    def _check(self, values: List[Any]) -> List[Any]:
+        self._validate(enumerate(values), self._element_conditions[0])
+        return values
+
+    def add(self, value: Any) -> None:
+        self._check([value])
+        super().add(value)
+
+    def update(self, *iterables: Iterable) -> None:
+        for values in iterables:
+            super().update(self._check(list(values)))
+
+    def symmetric_difference_update(self, values: Iterable) -> None:
+        super().symmetric_difference_update(self._check(list(values)))
+
+    def __ior__(self, values: Iterable) -> "CheckedSet":
+        self.update(values)
+        return self
+
+    def __ixor__(self, values: Iterable) -> "CheckedSet":
+        self.symmetric_difference_update(values)
+        return self
+
+
+class CheckedDict(CheckedContainer, dict):
+    """Dict validating item assignment, `update`, `setdefault` and `|=`."""
+
+    _element_conditions = (Any, Any)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(self._check(list(dict(*args, **kwargs).items())))
+
+    def _check(self, items: List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+        key_condition, value_condition = self._element_conditions
+        self._validate(((key, key) for key, _ in items), key_condition)
+        self._validate(items, value_condition)
+        return items
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._check([(key, value)])
+        super().__setitem__(key, value)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(self._check(list(dict(*args, **kwargs).items())))
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self._check([(key, default)])
+        return super().setdefault(key, default)
+
+    def __ior__(self, other: Any) -> "CheckedDict":
+        self.update(other)
+        return self
+
+
+_checked_types = {list: CheckedList, set: CheckedSet, dict: CheckedDict}
+
+
+def checked(
+    annotation: _GenericAlias, data: Iterable = (), mode: str = "raise"
+) -> "CheckedContainer":
+    """Create a checked container for `annotation` from `data`.
+
+    Parameters
+    ----------
+
+    annotation
+        A `List[...]`, `Set[...]` or `Dict[..., ...]` annotation.
+
+    data
+        The initial elements (validated once).
+
+    mode
+        How to handle violations: `'raise'` (the container is not mutated) or `'warn'`. Default: `'raise'`
+
+    Returns
+    -------
+
+    A `CheckedList`, `CheckedSet` or `CheckedDict` (which are subclasses of `list`, `set` and `dict`).
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        scores = checked(List[int], [1, 2, 3])
+
+    >>> scores.append("not an int")
+    RuntimeTypingError: TypingViolation in type `CheckedList`: Expected type of argument `self[3]` to be `<class 'int'>` (got `<class 'str'>`).
+    """
+    try:
+        checked_type = _checked_types[get_root(annotation)]
+    except KeyError:
+        raise ValueError(
+            f"Can not create checked container for `{annotation}`."
+        ) from None
+
+    container = checked_type()
+    container.annotation = annotation
+    container.mode = mode
+    if get_args(annotation):
+        container._element_conditions = get_args(annotation)
+
+    if checked_type is CheckedList:
+        container.extend(data)
+    else:
+        container.update(data)
+
+    return container
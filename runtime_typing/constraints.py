@@ -0,0 +1,253 @@
+"""Constraints on values, to be used as metadata of `typing.Annotated`.
+
+.. code-block:: python
+
+    @typed
+    def set_volume(volume: Annotated[int, Ge(0), Le(100)]):
+        ...
+
+The constraints of an annotation are compiled once: bounds are folded into
+a single (chained) comparison, regular expressions are precompiled, and
+length constraints are checked before the elements of a container are walked.
+"""
+
+import operator
+import re
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+class Constraint(ABC):
+    """Abstract Base Class of Constraints."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __call__(self, value: Any) -> bool:
+        """Whether `value` satisfies the constraint."""
+        pass
+
+    def _key(self) -> tuple:
+        return tuple(
+            getattr(self, slot)
+            for cls in reversed(type(self).__mro__)
+            for slot in vars(cls).get("__slots__", ())
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(repr(value) for value in self._key())
+        return f"{type(self).__name__}({arguments})"
+
+
+class Bound(Constraint):
+    __slots__ = ("bound",)
+
+    compare: Callable[[Any, Any], bool]
+
+    def __init__(self, bound: Any) -> None:
+        self.bound = bound
+
+    def __call__(self, value: Any) -> bool:
+        return self.compare(value, self.bound)
+
+
+class Gt(Bound):
+    """The value must be greater than `bound`."""
+
+    __slots__ = ()
+    compare = operator.gt
+
+
+class Ge(Bound):
+    """The value must be greater than or equal to `bound`."""
+
+    __slots__ = ()
+    compare = operator.ge
+
+
+class Lt(Bound):
+    """The value must be less than `bound`."""
+
+    __slots__ = ()
+    compare = operator.lt
+
+
+class Le(Bound):
+    """The value must be less than or equal to `bound`."""
+
+    __slots__ = ()
+    compare = operator.le
+
+
+class MinLen(Constraint):
+    """The length of the value must be at least `length`."""
+
+    __slots__ = ("length",)
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    def __call__(self, value: Any) -> bool:
+        return len(value) >= self.length
+
+
+class MaxLen(Constraint):
+    """The length of the value must be at most `length`."""
+
+    __slots__ = ("length",)
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    def __call__(self, value: Any) -> bool:
+        return len(value) <= self.length
+
+
+class Regex(Constraint):
+    """The value must match the regular expression `pattern` (anywhere, use
+    `^` and `$` to match the whole value). The pattern is compiled once."""
+
+    __slots__ = ("pattern", "flags", "_search")
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        self.pattern = pattern
+        self.flags = flags
+        self._search = re.compile(pattern, flags).search
+
+    def _key(self) -> tuple:
+        return (self.pattern, self.flags)
+
+    def __reduce__(self) -> tuple:
+        return (Regex, self._key())
+
+    def __call__(self, value: Any) -> bool:
+        return self._search(value) is not None
+
+
+class CompiledConstraints:
+    """The constraints of one `Annotated` annotation, compiled for checking.
+
+    Attributes
+    ----------
+
+    length_constraints
+        Constraints on the length of the value, which are cheap to check, even for large containers.
+
+    value_constraints
+        All other constraints. Bounds are folded into the tightest lower and upper bound, which are checked by a single (chained) comparison.
+    """
+
+    def __init__(self, metadata: Iterable[Any]) -> None:
+        constraints = [m for m in metadata if isinstance(m, Constraint)]
+
+        lower = self._tightest(
+            [c for c in constraints if isinstance(c, (Gt, Ge))], operator.gt
+        )
+        upper = self._tightest(
+            [c for c in constraints if isinstance(c, (Lt, Le))], operator.lt
+        )
+
+        self.length_constraints = tuple(
+            c for c in constraints if isinstance(c, (MinLen, MaxLen))
+        )
+        self.bounds = tuple(bound for bound in (lower, upper) if bound)
+        self.other_constraints = tuple(
+            c
+            for c in constraints
+            if not isinstance(c, (Bound, MinLen, MaxLen))
+        )
+        self.value_constraints = self.bounds + self.other_constraints
+        self._check_bounds = self._compile_bounds(lower, upper)
+
+    @staticmethod
+    def _tightest(
+        bounds: List["Bound"], tighter: Callable[[Any, Any], bool]
+    ) -> Optional["Bound"]:
+        tightest = None
+        for bound in bounds:
+            if (
+                tightest is None
+                or tighter(bound.bound, tightest.bound)
+                or (
+                    bound.bound == tightest.bound
+                    and isinstance(bound, (Gt, Lt))
+                )
+            ):
+                tightest = bound
+
+        return tightest
+
+    @staticmethod
+    def _compile_bounds(
+        lower: Optional["Bound"], upper: Optional["Bound"]
+    ) -> Optional[Callable[[Any], bool]]:
+        if lower is None and upper is None:
+            return None
+
+        if upper is None:
+            return lower
+
+        if lower is None:
+            return upper
+
+        low, high = lower.bound, upper.bound
+        if isinstance(lower, Ge) and isinstance(upper, Le):
+            return lambda value: low <= value <= high
+        if isinstance(lower, Ge):
+            return lambda value: low <= value < high
+        if isinstance(upper, Le):
+            return lambda value: low < value <= high
+
+        return lambda value: low < value < high
+
+    def violated_length_constraint(self, value: Any) -> Optional["Constraint"]:
+        """The first length constraint `value` violates (or `None`)."""
+        if not hasattr(value, "__len__"):
+            return None
+
+        for constraint in self.length_constraints:
+            if not constraint(value):
+                return constraint
+
+        return None
+
+    def violated_value_constraint(self, value: Any) -> Optional["Constraint"]:
+        """The first other constraint `value` violates (or `None`)."""
+        try:
+            if self._check_bounds is not None and not self._check_bounds(
+                value
+            ):
+                for bound in self.bounds:
+                    if not bound(value):
+                        return bound
+
+            for constraint in self.other_constraints:
+                if not constraint(value):
+                    return constraint
+        except TypeError:
+            # The value is not comparable to a bound or not a string.
+            return self.value_constraints[0]
+
+        return None
+
+
+_compiled = {}
+
+
+def compile_constraints(metadata: Tuple[Any, ...]) -> "CompiledConstraints":
+    """Compile the metadata of an `Annotated` annotation (once)."""
+    try:
+        return _compiled[metadata]
+    except KeyError:
+        compiled = _compiled[metadata] = CompiledConstraints(metadata)
+    except TypeError:
+        compiled = CompiledConstraints(metadata)
+
+    return compiled
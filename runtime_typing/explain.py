@@ -0,0 +1,247 @@
+"""Introspection of validation plans: what validating a call costs, and why."""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from runtime_typing.budget import Budget
+from runtime_typing.checked import CheckedContainer
+from runtime_typing.plan import ValidationPlan, plan_of
+from runtime_typing.typed_function import TypedFunction
+from runtime_typing.utils import (
+    annotation_cost,
+    get_args,
+    get_root,
+    homogeneous_element_type,
+    verdicts_cacheable,
+    Parameter,
+)
+
+
+_missing = object()
+
+
+def annotation_nodes(annotation: Any) -> int:
+    """Number of nodes of the tree of `annotation` (e.g. 2 for `List[int]`)."""
+    return 1 + sum(annotation_nodes(arg) for arg in get_args(annotation))
+
+
+def cached_classes(annotation: Any) -> List[type]:
+    """ABCs and protocols in `annotation` with cached isinstance verdicts."""
+    classes = [
+        cls
+        for arg in get_args(annotation)
+        for cls in cached_classes(arg)
+    ]
+    if isinstance(annotation, type) and type(annotation) is not type:
+        if verdicts_cacheable(annotation):
+            classes.append(annotation)
+
+    return classes
+
+
+def fast_paths(annotation: Any, value: Any = _missing) -> List[str]:
+    """The fast paths validating `value` (if given) against `annotation`
+    takes."""
+    paths = []
+
+    for cls in cached_classes(annotation):
+        paths.append(f"cached isinstance ({cls.__name__})")
+
+    if value is _missing:
+        return paths
+
+    if isinstance(value, CheckedContainer) and value.satisfies(annotation):
+        paths.append("checked container")
+    elif get_root(annotation) is not None:
+        if homogeneous_element_type(value) is not None:
+            paths.append(f"homogeneous {type(value).__name__}")
+
+    return paths
+
+
+class ParameterExplanation:
+    """Plan and estimated cost of validating one parameter.
+
+    Attributes
+    ----------
+
+    name
+        Name of the parameter (or `'return'`).
+
+    annotation
+        The annotation the parameter is validated against.
+
+    cost
+        Static estimate of the cost (see `runtime_typing.utils.annotation_cost`).
+
+    nodes
+        Number of nodes of the annotation.
+
+    elements
+        Number of values visited validating the example argument (`None` for the return value, or if no example argument is given).
+
+    violations
+        Number of violations of the example argument (`None`, if not validated).
+
+    fast_paths
+        Fast paths the validation of the example argument takes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        annotation: Any,
+        elements: Optional[int] = None,
+        violations: Optional[int] = None,
+        fast_paths: Tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.annotation = annotation
+        self.cost = annotation_cost(annotation)
+        self.nodes = annotation_nodes(annotation)
+        self.elements = elements
+        self.violations = violations
+        self.fast_paths = fast_paths
+
+
+class Explanation:
+    """Plan of a typed function, with the estimated cost of a call.
+
+    Attributes
+    ----------
+
+    func
+        The (undecorated) function.
+
+    parameters
+        `ParameterExplanation` of each annotated parameter, in the order they are validated in `'raise'` mode (followed by the return value).
+
+    cost_ordered
+        Whether arguments are validated in the order of their cost (rather than in the order of the signature) in `'raise'` mode.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        parameters: List[ParameterExplanation],
+        cost_ordered: bool,
+    ) -> None:
+        self.func = func
+        self.parameters = parameters
+        self.cost_ordered = cost_ordered
+
+    def __str__(self) -> str:
+        header = ("parameter", "annotation", "cost", "nodes", "elements")
+        rows = [header + ("violations", "fast paths")]
+        for parameter in self.parameters:
+            rows.append(
+                (
+                    parameter.name,
+                    repr(parameter.annotation),
+                    str(parameter.cost),
+                    str(parameter.nodes),
+                    "-" if parameter.elements is None else str(parameter.elements),
+                    "-"
+                    if parameter.violations is None
+                    else str(parameter.violations),
+                    ", ".join(parameter.fast_paths) or "-",
+                )
+            )
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [
+            f"Plan of `{self.func.__module__}.{self.func.__qualname__}` "
+            f"(arguments validated in order of "
+            f"{'cost' if self.cost_ordered else 'the signature'}):"
+        ]
+        lines += [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
+            for row in rows
+        ]
+
+        return "\n".join(line.rstrip() for line in lines)
+
+    __repr__ = __str__
+
+
+def explain(func: Callable, *args: Any, **kwargs: Any) -> Explanation:
+    """Explain the validation plan of `func`, and what validating a call with `args` and `kwargs` costs.
+
+    The arguments are validated (in `'return'` mode, i.e. without raising), but `func` is not called.
+
+    Parameters
+    ----------
+
+    func
+        A function decorated with `typed` (or any annotated function).
+
+    args, kwargs
+        Example arguments. Arguments which are not given are only explained statically.
+
+    Returns
+    -------
+
+    An `Explanation`, which is printed as a table.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        @typed
+        def total(values: List[int], factor: float) -> float:
+            return sum(values) * factor
+
+    >>> print(explain(total, list(range(1000)), 2.0))
+    Plan of `__main__.total` (arguments validated in order of cost):
+    parameter  annotation        cost  nodes  elements  violations  fast paths
+    factor     <class 'float'>   1     1      1         0           -
+    values     typing.List[int]  200   2      1001      0           -
+    return     <class 'float'>   1     1      -         -           -
+    """
+    plan = plan_of(func) or ValidationPlan(func)
+    bound = plan.binding.bind(args, kwargs) if args or kwargs else {}
+
+    parameters = []
+    for name, annotation in plan.cost_ordered_arguments:
+        if name not in bound:
+            parameters.append(
+                ParameterExplanation(
+                    name, annotation, fast_paths=tuple(fast_paths(annotation))
+                )
+            )
+            continue
+
+        value = bound[name]
+        budget = Budget()
+        typed_function = TypedFunction(
+            func=plan.func,
+            kwargs=bound,
+            mode="return",
+            defer=False,
+            plan=plan,
+            budget=budget,
+        )
+        typed_function.validate_entity(Parameter(value, name), annotation)
+        parameters.append(
+            ParameterExplanation(
+                name,
+                annotation,
+                elements=budget.elements,
+                violations=len(typed_function.violations),
+                fast_paths=tuple(fast_paths(annotation, value)),
+            )
+        )
+
+    if "return" in plan.typed_arguments:
+        annotation = plan.typed_arguments["return"]
+        parameters.append(
+            ParameterExplanation(
+                "return", annotation, fast_paths=tuple(fast_paths(annotation))
+            )
+        )
+
+    return Explanation(
+        plan.func,
+        parameters,
+        cost_ordered=not plan.type_var_slots,
+    )
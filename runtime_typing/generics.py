@@ -0,0 +1,130 @@
+"""Bindings of the type parameters of instances of typed generic classes.
+
+For `class Buffer(Generic[T])`, the type bound to `T` is remembered per
+instance: from `__orig_class__` (for instances created as `Buffer[int]()`), or
+from the first call of a method binding `T`. Later calls of methods of the same
+instance are checked against the remembered binding. Bindings are held in a
+registry keyed by the id of the instance and dropped (by a weak reference)
+when the instance is garbage collected, so that instances neither need a
+`__dict__` nor to be hashable.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    get_args,
+)
+from weakref import WeakKeyDictionary, ref
+
+from runtime_typing.type_vars import TypeVarBindings
+
+if TYPE_CHECKING:
+    from runtime_typing.plan import ValidationPlan
+    from runtime_typing.typed_function import TypedFunction
+
+
+class InstanceBindings:
+    """Types bound to the type parameters of one instance."""
+
+    __slots__ = ("types", "orig_class")
+
+    def __init__(self) -> None:
+        self.types: Dict[TypeVar, type] = {}
+        self.orig_class: Any = None
+
+
+_instances: Dict[int, Tuple[ref, InstanceBindings]] = {}
+_methods: "WeakKeyDictionary[type, Dict[Callable, bool]]" = WeakKeyDictionary()
+
+
+def is_method_of(instance: Any, function: Callable) -> bool:
+    """Whether `function` is a method of the class of `instance` (defined on
+    the class, or inherited), rather than any function taking `instance` as
+    first argument (whose TypeVars are unrelated to those of the class)."""
+    cls = type(instance)
+    try:
+        methods = _methods[cls]
+    except KeyError:
+        methods = _methods[cls] = {}
+
+    try:
+        return methods[function]
+    except KeyError:
+        pass
+
+    name = getattr(function, "__name__", None)
+    verdict = any(
+        vars(base).get(name) is function for base in cls.__mro__
+    )
+    methods[function] = verdict
+
+    return verdict
+
+
+def instance_bindings(instance: Any) -> Optional[InstanceBindings]:
+    """The bindings remembered for `instance` (`None`, if it can not be
+    referenced weakly)."""
+    key = id(instance)
+    entry = _instances.get(key)
+    if entry is not None and entry[0]() is instance:
+        bindings = entry[1]
+    else:
+        try:
+            reference = ref(instance, lambda _: _instances.pop(key, None))
+        except TypeError:
+            return None
+        bindings = InstanceBindings()
+        _instances[key] = (reference, bindings)
+
+    orig_class = getattr(instance, "__orig_class__", None)
+    if orig_class is not None and orig_class is not bindings.orig_class:
+        bindings.orig_class = orig_class
+        for type_var, arg in zip(
+            getattr(type(instance), "__parameters__", ()), get_args(orig_class)
+        ):
+            if isinstance(arg, type):
+                bindings.types[type_var] = arg
+
+    return bindings
+
+
+def bindings_for_call(
+    instance: Any, plan: "ValidationPlan"
+) -> Optional[TypeVarBindings]:
+    """TypeVar bindings of a call of a method of `instance`, seeded with the
+    bindings remembered for the instance."""
+    remembered = instance_bindings(instance)
+    if remembered is None:
+        return None
+
+    slots = plan.type_var_slots
+    bindings = TypeVarBindings(slots)
+    for type_var, bound_type in remembered.types.items():
+        index = slots.get(type_var)
+        if index is not None:
+            bindings.types[index] = bound_type
+
+    return bindings
+
+
+def remember(instance: Any, typed_function: "TypedFunction") -> None:
+    """Remember the type parameters of `instance` bound by a call without
+    violations."""
+    if typed_function.violations:
+        return
+
+    remembered = instance_bindings(instance)
+    if remembered is None:
+        return
+
+    bindings = typed_function.type_var_bindings
+    for type_var in getattr(type(instance), "__parameters__", ()):
+        if type_var not in remembered.types:
+            bound_type = bindings.bound_type(type_var)
+            if bound_type is not None:
+                remembered.types[type_var] = bound_type
@@ -0,0 +1,159 @@
+"""Hooks called around the validation of typed functions, e.g. for tracing.
+
+Typed functions only take the instrumented path when a hook is registered (or
+statistics are enabled), so without hooks they do not pay for a single extra
+call.
+"""
+
+from threading import Lock
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from runtime_typing import stats
+from runtime_typing.violations import RuntimeTypingError
+
+if TYPE_CHECKING:
+    from runtime_typing.plan import ValidationPlan
+    from runtime_typing.typed_function import TypedFunction
+    from runtime_typing.violations import RuntimeTypingViolationBase
+
+
+class ValidationHook:
+    """Base class of hooks. Override the callbacks of interest.
+
+    Callbacks are called on the thread calling the typed function. Exceptions raised by a callback propagate to the caller of the typed function.
+    """
+
+    def before_arguments(self, func: Callable, kwargs: Dict[str, Any]) -> None:
+        """Called before the arguments `kwargs` of `func` are validated."""
+
+    def after_arguments(
+        self,
+        func: Callable,
+        elapsed: int,
+        violations: List["RuntimeTypingViolationBase"],
+    ) -> None:
+        """Called after the arguments of `func` have been validated, in `elapsed` nanoseconds, with `violations` (also when a violation is about to be raised)."""
+
+    def before_return(self, func: Callable, result: Any) -> None:
+        """Called before the return value `result` of `func` is validated."""
+
+    def after_return(
+        self,
+        func: Callable,
+        elapsed: int,
+        violations: List["RuntimeTypingViolationBase"],
+    ) -> None:
+        """Called after the return value of `func` has been validated, in `elapsed` nanoseconds, with `violations` (also when a violation is about to be raised)."""
+
+
+active = False
+
+_hooks: Tuple[ValidationHook, ...] = ()
+_lock = Lock()
+
+
+def register_hook(hook: ValidationHook) -> ValidationHook:
+    """Call `hook` around the validation of every typed function.
+
+    Parameters
+    ----------
+
+    hook
+        A `runtime_typing.ValidationHook`.
+
+    Returns
+    -------
+
+    `hook`, which can be passed to `unregister_hook` later.
+    """
+    global _hooks, active
+
+    with _lock:
+        _hooks = _hooks + (hook,)
+        active = True
+
+    return hook
+
+
+def unregister_hook(hook: ValidationHook) -> None:
+    """Stop calling `hook` (registered with `register_hook`)."""
+    global _hooks, active
+
+    with _lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+        active = bool(_hooks)
+
+
+def _validate(
+    typed_function: "TypedFunction", validate: Callable[[], None]
+) -> Tuple[
+    int, List["RuntimeTypingViolationBase"], Optional[RuntimeTypingError]
+]:
+    """Run `validate`, returning time, violations and the error to raise."""
+    count = len(typed_function.violations)
+    start = perf_counter_ns()
+    try:
+        validate()
+    except RuntimeTypingError as error:
+        elapsed = perf_counter_ns() - start
+        violation = getattr(error, "violation", None)
+        violations = typed_function.violations[count:]
+        if violation is not None:
+            violations.append(violation)
+        return elapsed, violations, error
+
+    return perf_counter_ns() - start, typed_function.violations[count:], None
+
+
+def instrumented_call(
+    plan: "ValidationPlan", typed_function: "TypedFunction"
+) -> Any:
+    """Call `typed_function`, calling the registered hooks and counting
+    statistics. Only validation is timed, the function itself is not."""
+    hooks = _hooks
+    func = typed_function.func
+    kwargs = typed_function.kwargs
+    typed_arguments = typed_function.typed_arguments
+    validates_return = "return" in typed_arguments
+
+    elapsed = 0
+    validations = len(typed_arguments) - validates_return
+    violation_count = 0
+
+    try:
+        for hook in hooks:
+            hook.before_arguments(func, kwargs)
+        phase_elapsed, violations, error = _validate(
+            typed_function, typed_function.validate_arguments
+        )
+        elapsed += phase_elapsed
+        violation_count += len(violations)
+        for hook in hooks:
+            hook.after_arguments(func, phase_elapsed, violations)
+        if error is not None:
+            raise error
+
+        result = typed_function.call_function()
+
+        for hook in hooks:
+            hook.before_return(func, result)
+        phase_elapsed, violations, error = _validate(
+            typed_function, lambda: typed_function.validate_return(result)
+        )
+        elapsed += phase_elapsed
+        validations += validates_return
+        violation_count += len(violations)
+        for hook in hooks:
+            hook.after_return(func, phase_elapsed, violations)
+        if error is not None:
+            raise error
+    finally:
+        if stats.enabled:
+            stats.count(plan, elapsed, validations, violation_count)
+
+    typed_function.result = result
+    if typed_function.mode == "return":
+        return result, typed_function.violations
+
+    return result
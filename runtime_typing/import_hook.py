@@ -0,0 +1,205 @@
+"""Type checking of whole packages, applied at import time.
+
+`install` registers a finder in `sys.meta_path`. Modules matching its
+patterns are loaded as usual, and then the annotated functions and classes
+defined in them are decorated with `typed`. Functions without any annotation
+are left untouched, so they do not pay for a wrapper which would not check
+anything.
+"""
+
+import sys
+
+from fnmatch import fnmatchcase
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from inspect import isclass, isfunction
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from runtime_typing.attributes import install_validated_setattr
+from runtime_typing.records import (
+    decorate_record_class,
+    is_immutable_record_class,
+    is_record_class,
+)
+from runtime_typing.typed import typed
+
+
+def is_annotated(func: Callable) -> bool:
+    return bool(getattr(func, "__annotations__", None))
+
+
+def is_typed(func: Callable) -> bool:
+    return hasattr(func, "__runtime_typing_plan__")
+
+
+class TypedLoader(Loader):
+    """Loader executing a module with another loader, then typing it."""
+
+    def __init__(self, loader: Loader, finder: "TypedFinder") -> None:
+        self.loader = loader
+        self.finder = finder
+
+    def __getattr__(self, name: str) -> Any:
+        # e.g. `get_source`, which is used by `linecache` and `inspect`
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self.loader.exec_module(module)
+        self.finder.type_module(module)
+
+
+class TypedFinder(MetaPathFinder):
+    """Finder typing the modules whose names match `include`, but not
+    `exclude` (see `install`)."""
+
+    def __init__(
+        self,
+        include: Sequence[str],
+        exclude: Optional[Sequence[str]] = None,
+        **options: Any,
+    ) -> None:
+        self.include = tuple(include)
+        self.exclude = tuple(exclude or ())
+        self.options = options
+
+    def matches(self, fullname: str) -> bool:
+        return any(
+            fnmatchcase(fullname, pattern) for pattern in self.include
+        ) and not any(
+            fnmatchcase(fullname, pattern) for pattern in self.exclude
+        )
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if not self.matches(fullname):
+            return None
+
+        for finder in sys.meta_path:
+            if isinstance(finder, TypedFinder):
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = TypedLoader(spec.loader, self)
+
+        return spec
+
+    def type_module(self, module: ModuleType) -> None:
+        """Decorate the annotated functions and classes defined in `module`."""
+        for name, member in list(vars(module).items()):
+            if getattr(member, "__module__", None) != module.__name__:
+                continue
+            if isfunction(member):
+                setattr(module, name, self.type_function(member))
+            elif isclass(member):
+                self.type_class(member)
+
+    def type_function(self, func: Callable, **options: Any) -> Callable:
+        if not is_annotated(func) or is_typed(func):
+            return func
+
+        return typed(**{**self.options, **options})(func)
+
+    def type_class(self, cls: type) -> None:
+        """Decorate the annotated methods and staticmethods of `cls` (or
+        validate the fields of records, as `typed` on a class does)."""
+        if is_record_class(cls) and self.options.get("mode") not in (
+            "return",
+            "shadow",
+        ):
+            if not any(is_typed(member) for member in vars(cls).values()):
+                options = dict(self.options)
+                if is_immutable_record_class(cls):
+                    options.pop("validate_assignment", None)
+                decorate_record_class(cls, self.type_function, **options)
+            return
+
+        for name, member in list(vars(cls).items()):
+            if isfunction(member):
+                setattr(cls, name, self.type_function(member))
+            elif isinstance(member, staticmethod) and isfunction(member.__func__):
+                typed_member = self.type_function(member.__func__)
+                if typed_member is not member.__func__:
+                    setattr(cls, name, staticmethod(typed_member))
+
+        if (
+            self.options.get("validate_assignment")
+            and self.options.get("mode") not in ("return", "shadow")
+            and vars(cls).get("__annotations__")
+        ):
+            install_validated_setattr(cls, **self.options)
+
+
+def install(
+    include: Iterable[str],
+    exclude: Optional[Iterable[str]] = None,
+    **options: Any,
+) -> TypedFinder:
+    """Type the modules matching `include` when they are imported.
+
+    Functions and classes defined in a matching module are decorated with `typed` as if they had been decorated by hand (except for unannotated functions, which are not decorated at all). Modules which have been imported before are not typed.
+
+    Parameters
+    ----------
+
+    include
+        Patterns of qualified names of modules to be typed, as understood by `fnmatch` (e.g. `["myapp", "myapp.*"]`).
+
+    exclude
+        Patterns of qualified names of modules not to be typed, even if they match `include`. Default: `None`
+
+    options
+        Keyword arguments of `typed` (e.g. `mode="warn"` or `sample=0.01`) applied to all typed functions and classes.
+
+    Returns
+    -------
+
+    The installed finder, which can be passed to `uninstall`.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        import runtime_typing
+
+        runtime_typing.install(include=["myapp.*"], mode="aggregate", sample=0.1)
+
+        import myapp.views
+    """
+    finder = TypedFinder(list(include), list(exclude or ()), **options)
+    sys.meta_path.insert(0, finder)
+
+    return finder
+
+
+def uninstall(finder: Optional[TypedFinder] = None) -> None:
+    """Stop typing modules on import (modules which have been typed already
+    stay typed).
+
+    Parameters
+    ----------
+
+    finder
+        The finder returned by `install`. Default: `None`, which uninstalls all finders.
+    """
+    sys.meta_path[:] = [
+        f
+        for f in sys.meta_path
+        if not (isinstance(f, TypedFinder) and finder in (None, f))
+    ]
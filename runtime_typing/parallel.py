@@ -0,0 +1,158 @@
+"""Validation of the elements of large containers in a pool of workers."""
+
+import os
+import sys
+
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import islice
+from pickle import PicklingError
+from threading import Lock
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, List, Optional, _GenericAlias
+
+from runtime_typing.utils import detach, Parameter
+
+
+_executor: Optional[Executor] = None
+_executor_lock = Lock()
+_workers = os.cpu_count() or 1
+
+
+def gil_enabled() -> bool:
+    """Whether the interpreter runs with the global interpreter lock."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def get_executor() -> Executor:
+    """The (lazily created) executor shared by all typed functions.
+
+    On free-threaded builds, threads validate in parallel, so a thread pool is
+    used. Otherwise, validation is GIL-bound and a process pool is used.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = (
+                ProcessPoolExecutor(max_workers=_workers)
+                if gil_enabled()
+                else ThreadPoolExecutor(max_workers=_workers)
+            )
+
+        return _executor
+
+
+def discard_executor() -> None:
+    """Shut the shared executor down (e.g. when a worker died), so that the
+    next parallel validation starts a fresh one."""
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def chunks(values: Iterable[Any], chunk_size: int) -> Iterable[List[Any]]:
+    iterator = iter(values)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def validate_chunk(
+    values: List[Any],
+    parent: "Parameter",
+    offset: int,
+    condition: _GenericAlias,
+    validate_fields: bool = False,
+) -> list:
+    """Validate all `values` against `condition` (executed in a worker).
+
+    The violations are detached from the typed function (which can not be
+    pickled) before they are sent back to the calling process. Conditions
+    are sent without forward references (which can not be pickled), so the
+    function is not needed to resolve them in the worker.
+    """
+    from runtime_typing.typed_function import TypedFunction
+
+    typed_function = TypedFunction(
+        func=SimpleNamespace(),
+        kwargs={},
+        mode="return",
+        defer=True,
+        validate_fields=validate_fields,
+    )
+    for index, value in enumerate(values, offset):
+        typed_function.validate_entity(
+            parameter=Parameter(value, index, parent), condition=condition
+        )
+
+    for violation in typed_function.violations:
+        bind_violation(violation, None)
+
+    return typed_function.violations
+
+
+def bind_violation(violation: Any, func: Optional[Callable]) -> None:
+    """Set the object the violation (and all its sub-violations) occurred on."""
+    if hasattr(violation, "violations"):
+        for sub_violation in violation.violations:
+            bind_violation(sub_violation, func)
+    else:
+        violation.obj = func
+
+
+def validate_in_chunks(
+    values: Iterable[Any],
+    parameter: "Parameter",
+    condition: _GenericAlias,
+    chunk_size: Optional[int] = None,
+    validate_fields: bool = False,
+) -> Optional[list]:
+    """Validate elements of `values` chunk-wise in the shared executor.
+
+    Returns the violations of all chunks, in the order of the elements, or
+    `None` if the values (or the condition) can not be sent to the workers, or
+    if the pool broke (e.g. a worker was killed), in which case the caller has
+    to fall back to validating them in-process.
+    """
+    if chunk_size is None:
+        chunk_size = max(len(values) // (4 * _workers), 1)
+
+    parent = detach(parameter)
+    futures = []
+    try:
+        executor = get_executor()
+        for index, chunk in enumerate(chunks(values, chunk_size)):
+            futures.append(
+                executor.submit(
+                    validate_chunk,
+                    chunk,
+                    parent,
+                    index * chunk_size,
+                    condition,
+                    validate_fields,
+                )
+            )
+
+        return [
+            violation for future in futures for violation in future.result()
+        ]
+    except BrokenExecutor:
+        discard_executor()
+
+        return None
+    except (PicklingError, AttributeError, TypeError):
+        for future in futures:
+            future.cancel()
+
+        return None
@@ -0,0 +1,492 @@
+"""Validation plans: what is known about a typed function before it is called.
+
+Plans are created when a function is decorated, but only compiled (i.e. the
+signature is inspected and the annotations are resolved) when the function is
+called for the first time, or when it is warmed up with `warmup`.
+"""
+
+import sys
+
+from inspect import (
+    _empty,
+    isclass,
+    signature,
+    Parameter,
+)
+from threading import Lock, Thread
+from time import perf_counter
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakSet
+
+from runtime_typing import plan_cache
+from runtime_typing.constraints import CompiledConstraints, compile_constraints
+from runtime_typing.utils import (
+    annotated_of,
+    annotation_cost,
+    cached_type_hints,
+    type_vars_of,
+)
+from runtime_typing.violations import RuntimeTypingNameError
+
+
+_plans: "WeakSet" = WeakSet()
+_statistics = {"compiled": 0, "loaded": 0, "compile_time": 0.0}
+_statistics_lock = Lock()
+
+POSITIONAL_ONLY = Parameter.POSITIONAL_ONLY
+POSITIONAL_OR_KEYWORD = Parameter.POSITIONAL_OR_KEYWORD
+VAR_POSITIONAL = Parameter.VAR_POSITIONAL
+KEYWORD_ONLY = Parameter.KEYWORD_ONLY
+VAR_KEYWORD = Parameter.VAR_KEYWORD
+
+
+class ValidationPlan:
+    """The parameters and annotations of a typed function.
+
+    Attributes
+    ----------
+
+    func
+        The (undecorated) function.
+
+    parameter_names
+        Names of the parameters of the function, in the order of the signature.
+
+    defaults
+        Default values of the parameters, by parameter name.
+
+    typed_arguments
+        Annotations to be validated (after applying `include` and `exclude`), by parameter name (or `'return'`).
+
+    type_var_slots
+        Slots of the TypeVars in `typed_arguments` (see `runtime_typing.type_vars`).
+
+    cost_ordered_arguments
+        The annotations of the arguments (without `'return'`), ordered by their estimated cost (see `runtime_typing.utils.annotation_cost`), so that cheap checks run before expensive container walks. If the annotations contain TypeVars, the arguments stay in the order of the signature, as TypeVars are bound by the first argument validated.
+
+    binding
+        The `Binding` of the arguments of a call to the parameters of the function.
+
+    compiled
+        Whether the plan has been compiled already.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        exclude: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.func = func
+        self.exclude = set(exclude) if exclude else set()
+        self.include = set(include) if include else set()
+
+        self.compiled = False
+        self._lock = Lock()
+        self._parameter_names = None
+        self._defaults = None
+        self._typed_arguments = None
+        self._binding = None
+        self._type_var_slots = None
+        self._constraints = None
+        self._cost_ordered_arguments = None
+
+        _plans.add(self)
+
+        if plan_cache.plan_cache_enabled():
+            self._load()
+
+    def compile(self) -> "ValidationPlan":
+        """Inspect the signature and resolve the annotations (only once).
+
+        The plan is compiled under its lock, and its attributes are published
+        only when they are complete, so that calls racing with
+        `warmup_in_background` never see a partially compiled plan.
+        """
+        if self.compiled:
+            return self
+
+        with self._lock:
+            if self.compiled:
+                return self
+
+            # plans which could not be loaded when decorating may be loadable
+            # now (e.g. once the classes they refer to are defined)
+            if plan_cache.plan_cache_enabled() and self._load():
+                return self
+
+            start = perf_counter()
+
+            annotated_arguments = cached_type_hints(self.func)
+            include = (
+                annotated_arguments.keys() if not self.include else self.include
+            ) - self.exclude
+            typed_arguments = {
+                name: condition
+                for name, condition in annotated_arguments.items()
+                if name in include
+            }
+            if hasattr(self.func, "__code__"):
+                self.binding.variadic_conditions(typed_arguments)
+
+            parameters = signature(self.func).parameters
+            self._parameter_names = tuple(parameters.keys())
+            self._defaults = {
+                name: parameter.default
+                for name, parameter in parameters.items()
+                if parameter.default is not _empty
+            }
+            self._typed_arguments = typed_arguments
+            self.compiled = True
+
+            with _statistics_lock:
+                _statistics["compiled"] += 1
+                _statistics["compile_time"] += perf_counter() - start
+
+            if plan_cache.plan_cache_enabled():
+                plan_cache.store(
+                    self,
+                    {
+                        "parameter_names": self._parameter_names,
+                        "typed_arguments": self._typed_arguments,
+                        "layout": self.binding.layout(),
+                    },
+                )
+
+        return self
+
+    def _load(self) -> bool:
+        """Take the compiled plan from the on-disk cache, if present."""
+        data = plan_cache.load(self)
+        if data is None or "layout" not in data:
+            return False
+
+        self._parameter_names = data["parameter_names"]
+        self._typed_arguments = data["typed_arguments"]
+        self._defaults = function_defaults(self.func)
+        self._binding = Binding.from_layout(data["layout"], self._defaults)
+        self.compiled = True
+
+        with _statistics_lock:
+            _statistics["loaded"] += 1
+
+        return True
+
+    @property
+    def parameter_names(self):
+        return self.compile()._parameter_names
+
+    @property
+    def defaults(self) -> Dict[str, Any]:
+        return self.compile()._defaults
+
+    @property
+    def typed_arguments(self) -> Dict[str, Any]:
+        return self.compile()._typed_arguments
+
+    @property
+    def type_var_slots(self) -> Dict[TypeVar, int]:
+        if self._type_var_slots is None:
+            slots: Dict[TypeVar, int] = {}
+            for condition in self.typed_arguments.values():
+                for type_var in type_vars_of(condition):
+                    slots.setdefault(type_var, len(slots))
+            self._type_var_slots = slots
+
+        return self._type_var_slots
+
+    @property
+    def constraints(self) -> Dict[int, CompiledConstraints]:
+        """The compiled constraints of the `Annotated` annotations (by `id`)."""
+        if self._constraints is None:
+            self._constraints = {
+                id(annotation): compile_constraints(annotation.__metadata__)
+                for condition in self.typed_arguments.values()
+                for annotation in annotated_of(condition)
+            }
+
+        return self._constraints
+
+    @property
+    def cost_ordered_arguments(self) -> Tuple[Tuple[str, Any], ...]:
+        if self._cost_ordered_arguments is None:
+            arguments = [
+                (name, condition)
+                for name, condition in self.typed_arguments.items()
+                if name != "return"
+            ]
+            if not self.type_var_slots:
+                arguments.sort(key=lambda item: annotation_cost(item[1]))
+            self._cost_ordered_arguments = tuple(arguments)
+
+        return self._cost_ordered_arguments
+
+    @property
+    def binding(self) -> "Binding":
+        if self._binding is None:
+            self._binding = Binding(self.func)
+
+        return self._binding
+
+
+class Binding:
+    """How the arguments of a call are bound to the parameters of a function.
+
+    The binding is computed from the signature of the function once (which
+    follows `__wrapped__`, so that the parameters of a function wrapped with
+    `functools.wraps` are bound rather than the `*args, **kwargs` of its
+    wrapper), so binding a call neither inspects the signature nor re-packs the
+    arguments: the function is still called with the original positional and
+    keyword arguments, the binding only tells which value to validate against
+    which annotation.
+
+    Attributes
+    ----------
+
+    positional
+        Names of the parameters which can be passed positionally, in order.
+
+    keywords
+        Names of the parameters which can be passed by keyword.
+
+    positional_only
+        Names of the parameters which can only be passed positionally.
+
+    var_positional
+        Name of the `*args` parameter (or `None`).
+
+    var_keyword
+        Name of the `**kwargs` parameter (or `None`).
+
+    defaults
+        Default values of the parameters, by parameter name.
+    """
+
+    __slots__ = (
+        "positional",
+        "keywords",
+        "positional_only",
+        "var_positional",
+        "var_keyword",
+        "defaults",
+    )
+
+    def __init__(self, func: Callable) -> None:
+        parameters = signature(func).parameters.values()
+
+        self.positional: Tuple[str, ...] = tuple(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind in (POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD)
+        )
+        self.keywords: FrozenSet[str] = frozenset(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind in (POSITIONAL_OR_KEYWORD, KEYWORD_ONLY)
+        )
+        self.positional_only: FrozenSet[str] = frozenset(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind is POSITIONAL_ONLY
+        )
+
+        self.var_positional: Optional[str] = None
+        self.var_keyword: Optional[str] = None
+        for parameter in parameters:
+            if parameter.kind is VAR_POSITIONAL:
+                self.var_positional = parameter.name
+            elif parameter.kind is VAR_KEYWORD:
+                self.var_keyword = parameter.name
+
+        self.defaults = {
+            parameter.name: parameter.default
+            for parameter in parameters
+            if parameter.default is not _empty
+        }
+
+    @classmethod
+    def from_layout(cls, layout: tuple, defaults: Dict[str, Any]) -> "Binding":
+        """The binding with the parameter `layout` (see `layout`) and the
+        `defaults`, without inspecting the signature (as when the plan is
+        loaded from the on-disk cache)."""
+        binding = cls.__new__(cls)
+        (
+            binding.positional,
+            binding.keywords,
+            binding.positional_only,
+            binding.var_positional,
+            binding.var_keyword,
+        ) = layout
+        binding.defaults = defaults
+
+        return binding
+
+    def layout(self) -> tuple:
+        """The parameters of the binding, without their defaults (which may
+        not be picklable)."""
+        return (
+            self.positional,
+            self.keywords,
+            self.positional_only,
+            self.var_positional,
+            self.var_keyword,
+        )
+
+    def bind(self, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Values of the parameters of a call with `args` and `kwargs`, by
+        parameter name.
+
+        Parameters without a value (i.e. neither passed nor defaulted) are missing in the result: calling the function raises a `TypeError` then anyway. So do superfluous arguments, and positional-only parameters passed by keyword (without `**kwargs` to take them), which are ignored.
+        """
+        bound = {**self.defaults, **dict(zip(self.positional, args))}
+
+        if self.var_positional is not None:
+            bound[self.var_positional] = args[len(self.positional) :]
+
+        if self.var_keyword is None and not self.positional_only:
+            bound.update(kwargs)
+            return bound
+
+        var_keyword = {}
+        for name, value in kwargs.items():
+            if name in self.keywords:
+                bound[name] = value
+            else:
+                var_keyword[name] = value
+        if self.var_keyword is not None:
+            bound[self.var_keyword] = var_keyword
+
+        return bound
+
+    def variadic_conditions(self, typed_arguments: Dict[str, Any]) -> None:
+        """Turn the annotations of `*args` and `**kwargs` (which annotate
+        each of their values) into annotations of the tuple and the dict the
+        values are bound to."""
+        if self.var_positional in typed_arguments:
+            typed_arguments[self.var_positional] = Tuple[
+                typed_arguments[self.var_positional], ...
+            ]
+        if self.var_keyword in typed_arguments:
+            typed_arguments[self.var_keyword] = Dict[
+                str, typed_arguments[self.var_keyword]
+            ]
+
+
+def function_defaults(func: Callable) -> Dict[str, Any]:
+    """Default values by parameter name, without inspecting the signature
+    (unless `func` wraps another function)."""
+    if hasattr(func, "__wrapped__"):
+        return {
+            name: parameter.default
+            for name, parameter in signature(func).parameters.items()
+            if parameter.default is not _empty
+        }
+
+    code = func.__code__
+    positional_names = code.co_varnames[: code.co_argcount]
+    positional_defaults = func.__defaults__ or ()
+
+    first_default = len(positional_names) - len(positional_defaults)
+
+    defaults = dict(zip(positional_names[first_default:], positional_defaults))
+    defaults.update(func.__kwdefaults__ or {})
+
+    return defaults
+
+
+def plan_of(obj: Any) -> Optional["ValidationPlan"]:
+    """The validation plan of a typed function (or `None`)."""
+    return getattr(obj, "__runtime_typing_plan__", None)
+
+
+def plans_in(module: ModuleType) -> Iterable["ValidationPlan"]:
+    """Plans of the typed functions and methods defined in `module`."""
+    for obj in list(vars(module).values()):
+        candidates = vars(obj).values() if isclass(obj) else (obj,)
+        for candidate in candidates:
+            candidate = getattr(candidate, "__func__", candidate)
+            plan = plan_of(candidate)
+            if plan is not None and getattr(
+                plan.func, "__module__", None
+            ) == module.__name__:
+                yield plan
+
+
+def warmup(module_or_package: Union[ModuleType, str]) -> int:
+    """Compile the plans of all typed functions in a module, ahead of time.
+
+    If a package is given, the plans in all its (already imported) submodules are compiled, too. Plans whose annotations can not be resolved yet are skipped (and compiled on the first call of the function).
+
+    Parameters
+    ----------
+
+    module_or_package
+        The module or package (or its name).
+
+    Returns
+    -------
+
+    The number of plans compiled by this call.
+    """
+    name = getattr(module_or_package, "__name__", module_or_package)
+    modules = [
+        module
+        for module_name, module in list(sys.modules.items())
+        if module is not None
+        and (module_name == name or module_name.startswith(name + "."))
+    ]
+
+    compiled = 0
+    for module in modules:
+        for plan in plans_in(module):
+            if plan.compiled:
+                continue
+            try:
+                plan.compile()
+            except RuntimeTypingNameError:
+                continue
+            compiled += 1
+
+    return compiled
+
+
+def warmup_in_background(module_or_package: Union[ModuleType, str]) -> Thread:
+    """Run `warmup` in a (daemon) background thread, e.g. at startup.
+
+    Returns
+    -------
+
+    The started thread.
+    """
+    thread = Thread(
+        target=warmup,
+        args=(module_or_package,),
+        name="runtime_typing-warmup",
+        daemon=True,
+    )
+    thread.start()
+
+    return thread
+
+
+def plan_statistics() -> Dict[str, Union[int, float]]:
+    """Statistics about validation plans of this process.
+
+    Returns
+    -------
+
+    Dictionary with the number of `plans` (alive), the number of plans `compiled` (so far), the number of plans `loaded` from the on-disk cache (see `runtime_typing.enable_plan_cache`) and the total `compile_time` (in seconds).
+    """
+    with _statistics_lock:
+        return {"plans": len(_plans), **_statistics}
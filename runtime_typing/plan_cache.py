@@ -0,0 +1,235 @@
+"""Persistent on-disk cache of compiled validation plans.
+
+Similar to `__pycache__`, compiled plans are stored in one file per module
+(and version of python). Plans are loaded when a function is decorated, so
+the annotations of short-lived processes do not have to be resolved again on
+every start. The cache is keyed by the path and the hash of the source of the
+module, so it is invalidated when the source changes. Within the file, plans are keyed
+by the qualified name of the function, the text of its annotations and the
+`include` and `exclude` arguments of `typed`. Each plan is pickled on its own,
+and only unpickled when it is looked up, so that a plan which can not be
+loaded (e.g. as it refers to a class defined further down in the module) does
+not invalidate the other plans of the module.
+
+As the cache is keyed by the source of the module of a function only, it is
+not invalidated when an alias imported from another module (e.g. `UserId =
+int` in `myapp.types`) changes: disable the cache (or delete the cache files)
+when such aliases change. Cache files are pickles, i.e. loading them may
+execute code: cache files which are not owned by the current user, or which
+are writable by others, are ignored, but the cache directory should not be
+shared with other users anyway.
+"""
+
+import atexit
+import hashlib
+import os
+import pickle
+import stat
+import sys
+
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from runtime_typing.plan import ValidationPlan
+
+
+_directory: Optional[str] = None
+_enabled = False
+_lock = Lock()
+
+_source_hashes: Dict[tuple, Optional[str]] = {}
+_entries: Dict[str, Dict[tuple, Any]] = {}
+_dirty = set()
+
+
+def enable_plan_cache(directory: Optional[str] = None) -> None:
+    """Store compiled plans on disk, and load them when decorating.
+
+    Parameters
+    ----------
+
+    directory
+        Directory the cache files are stored in. Default: `None`, which stores the cache of each module in the `__pycache__` directory next to the module.
+    """
+    global _directory, _enabled
+
+    _directory = directory
+    _enabled = True
+
+
+def disable_plan_cache() -> None:
+    """Stop loading and storing compiled plans (after saving pending ones)."""
+    global _enabled
+
+    save_plan_cache()
+    _enabled = False
+
+
+def plan_cache_enabled() -> bool:
+    return _enabled
+
+
+def source_hash(filename: str) -> Optional[str]:
+    """Hash of the content of the file (hashed once per modification)."""
+    try:
+        status = os.stat(filename)
+    except OSError:
+        return None
+
+    key = (filename, status.st_mtime_ns, status.st_size)
+    try:
+        return _source_hashes[key]
+    except KeyError:
+        pass
+
+    try:
+        with open(filename, "rb") as file:
+            digest = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    except OSError:
+        digest = None
+
+    _source_hashes[key] = digest
+
+    return digest
+
+
+def cache_path(filename: str) -> Optional[str]:
+    digest = source_hash(filename)
+    if digest is None:
+        return None
+
+    module_name = os.path.splitext(os.path.basename(filename))[0]
+    if _directory is None:
+        directory = os.path.join(os.path.dirname(filename), "__pycache__")
+    else:
+        # modules with the same name (and source) in different packages share
+        # the directory, so their files are told apart by their location
+        directory = _directory
+        location = hashlib.blake2b(
+            os.path.abspath(filename).encode(), digest_size=8
+        ).hexdigest()
+        module_name = f"{module_name}-{location}"
+
+    return os.path.join(
+        directory,
+        f"{module_name}.{sys.implementation.cache_tag}"
+        f".runtime_typing-{digest}.pickle",
+    )
+
+
+def plan_key(plan: "ValidationPlan") -> Optional[Tuple[str, tuple]]:
+    """Cache file and key within the file of the plan (if cacheable)."""
+    func = plan.func
+    code = getattr(func, "__code__", None)
+    if code is None or hasattr(func, "__wrapped__"):
+        return None
+
+    path = cache_path(code.co_filename)
+    if path is None:
+        return None
+
+    annotations = getattr(func, "__annotations__", {})
+    key = (
+        func.__qualname__,
+        tuple((name, repr(value)) for name, value in annotations.items()),
+        tuple(sorted(plan.include)),
+        tuple(sorted(plan.exclude)),
+    )
+
+    return path, key
+
+
+def trusted(path: str) -> bool:
+    """Whether the cache file at `path` may be unpickled: it must be owned by
+    the current user, and not be writable by others."""
+    status = os.stat(path)
+    if hasattr(os, "getuid") and status.st_uid != os.getuid():
+        return False
+
+    return not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def load_entries(path: str) -> Dict[tuple, bytes]:
+    """The pickled plans in the cache file at `path`, by key."""
+    try:
+        return _entries[path]
+    except KeyError:
+        pass
+
+    try:
+        if trusted(path):
+            with open(path, "rb") as file:
+                entries = pickle.load(file)
+        else:
+            entries = {}
+    except Exception:
+        entries = {}
+
+    if not isinstance(entries, dict):
+        entries = {}
+
+    _entries[path] = entries
+
+    return entries
+
+
+def load(plan: "ValidationPlan") -> Optional[Dict[str, Any]]:
+    """Compiled data of `plan` from the cache (or `None`)."""
+    location = plan_key(plan)
+    if location is None:
+        return None
+
+    path, key = location
+    with _lock:
+        pickled = load_entries(path).get(key)
+
+    if pickled is None:
+        return None
+
+    try:
+        return pickle.loads(pickled)
+    except Exception:
+        # e.g. a class which is not defined yet: the plan is compiled instead
+        return None
+
+
+def store(plan: "ValidationPlan", data: Dict[str, Any]) -> None:
+    """Remember compiled data of `plan`, to be saved by `save_plan_cache`."""
+    location = plan_key(plan)
+    if location is None:
+        return
+
+    try:
+        pickled = pickle.dumps(data)
+    except Exception:
+        return
+
+    path, key = location
+    with _lock:
+        entries = load_entries(path)
+        if entries.get(key) != pickled:
+            entries[key] = pickled
+            _dirty.add(path)
+
+
+def save_plan_cache() -> None:
+    """Write the plans compiled since the last save to disk.
+
+    This is called automatically when the interpreter exits.
+    """
+    with _lock:
+        for path in list(_dirty):
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temporary_path = f"{path}.{os.getpid()}.tmp"
+                with open(temporary_path, "wb") as file:
+                    pickle.dump(_entries[path], file)
+                os.replace(temporary_path, path)
+            except OSError:
+                pass
+
+        _dirty.clear()
+
+
+atexit.register(save_plan_cache)
@@ -0,0 +1,670 @@
+"""Type profiles: the shapes of arguments and return values, validated offline.
+
+Instead of validating calls, functions typed with `profile=True` record the
+type shape of their arguments and return value, e.g. `list[int:998, str:2]`
+for a list of 998 ints and 2 strings, or `dict{title: str, year: int}` for a
+dict with a few identifier keys (like a `TypedDict`). Shapes are tallied per
+function in a bounded in-memory reservoir, and flushed to a file of JSON lines
+per process (when profiling is disabled, and when the process exits). Replaying
+the files later validates an exemplar value built from each shape against the
+annotations of the functions, with the validators of `TypedFunction`:
+
+.. code-block:: shell
+
+    python -m runtime_typing.profiling /tmp/runtime_typing
+
+Shapes record types, not values. When replaying, value constraints (`Literal`
+and the constraints of `Annotated`) are checked against the types of their
+values only, and signatures of `Callable` arguments are not checked.
+"""
+
+import atexit
+import collections.abc
+import importlib
+import json
+import os
+import sys
+import types
+
+from enum import Enum
+from itertools import islice
+from random import randrange
+from tempfile import gettempdir
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from runtime_typing.plan import ValidationPlan, plan_of
+from runtime_typing.typed_function import TypedFunction
+from runtime_typing.utils import Annotated, Parameter
+
+if TYPE_CHECKING:
+    from runtime_typing.violations import RuntimeTypingViolationBase
+
+# `list[int]` and the like are new in Python 3.9.
+GenericAlias = getattr(types, "GenericAlias", ())
+
+
+MAX_DEPTH = 6
+MAX_FIELDS = 16
+MAX_KEYS = 32
+
+enabled = False
+
+_directory: Optional[str] = None
+_capacity = 0
+_max_elements = 0
+_records: Dict[Tuple[str, str, tuple], list] = {}
+_keys: List[Tuple[str, str, tuple]] = []
+_distinct = 0
+_lock = Lock()
+
+
+def default_directory() -> str:
+    return os.path.join(gettempdir(), "runtime_typing")
+
+
+def profile_file(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{pid}.shapes.jsonl")
+
+
+def enable_profiling(
+    directory: Optional[str] = None,
+    capacity: int = 10_000,
+    max_elements: int = 1_000,
+) -> None:
+    """Record the type shapes of calls of functions typed with `profile=True`.
+
+    Parameters
+    ----------
+
+    directory
+        Directory the shapes of all processes are flushed to (one file per process). Default: `None`, which is the directory `runtime_typing` in the temporary directory of the system.
+
+    capacity
+        Maximum number of distinct shapes (of all functions) held in memory. When the reservoir is full, a new shape replaces a random one, with a probability shrinking with the number of distinct shapes seen, so that the reservoir stays a uniform sample of them. Default: `10_000`
+
+    max_elements
+        Maximum number of elements of a container whose shapes are tallied (the length of the container is recorded in any case). Default: `1_000`
+    """
+    global enabled, _directory, _capacity, _max_elements
+
+    with _lock:
+        _directory = directory or default_directory()
+        _capacity = capacity
+        _max_elements = max_elements
+        os.makedirs(_directory, exist_ok=True)
+
+    enabled = True
+
+
+def disable_profiling() -> None:
+    """Stop recording shapes, and flush the shapes recorded so far."""
+    global enabled
+
+    enabled = False
+    flush_profile()
+
+
+def flush_profile() -> Optional[str]:
+    """Append the shapes in the reservoir to the file of the process, and
+    empty the reservoir. Returns the path of the file (`None`, if there was
+    nothing to flush)."""
+    global _distinct
+
+    with _lock:
+        records = list(_records.values())
+        _records.clear()
+        _keys.clear()
+        _distinct = 0
+
+    if not records or _directory is None:
+        return None
+
+    path = profile_file(_directory, os.getpid())
+    with open(path, "a", encoding="utf-8") as file:
+        for module, qualname, shapes, count in records:
+            file.write(
+                json.dumps(
+                    {
+                        "module": module,
+                        "qualname": qualname,
+                        "shapes": shapes,
+                        "count": count,
+                    }
+                )
+                + "\n"
+            )
+
+    return path
+
+
+def _reset_in_child() -> None:
+    """Forked processes must not flush the shapes of their parent."""
+    global _lock, _distinct
+
+    _lock = Lock()
+    _records.clear()
+    _keys.clear()
+    _distinct = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_in_child)
+
+atexit.register(flush_profile)
+
+
+# builtin types which are not attributes of `builtins` (e.g. `NoneType`)
+_builtin_types = {
+    cls.__qualname__: cls
+    for cls in (
+        type(None),
+        type(Ellipsis),
+        type(NotImplemented),
+        *(
+            value
+            for value in vars(types).values()
+            if isinstance(value, type) and value.__module__ == "builtins"
+        ),
+    )
+}
+
+
+def qualified_name(cls: type) -> str:
+    """Name of `cls` as recorded in shapes (see `resolve`): the bare name of
+    builtin types (including those which are not attributes of `builtins`,
+    like `NoneType`), `module:qualname` otherwise."""
+    if cls.__module__ == "builtins":
+        return cls.__qualname__
+
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def structure(shape: dict) -> Any:
+    """Hashable key of the structure of `shape` (the types, without the
+    lengths and counts), like the keys shapes are tallied by when recorded."""
+    if "class" in shape:
+        return ("class", shape["class"])
+
+    name = shape["type"]
+    if "fields" in shape:
+        return (name, tuple(map(structure, shape["fields"])))
+    if "items" in shape:
+        return (
+            name,
+            "items",
+            frozenset((structure(s),) for s, _ in shape["items"]),
+        )
+    if "keys" in shape:
+        return (
+            name,
+            "keys",
+            tuple((key, structure(s)) for key, s in shape["keys"].items()),
+        )
+    if "entries" in shape:
+        return (
+            name,
+            "entries",
+            frozenset(
+                (structure(key), structure(value))
+                for key, value, _ in shape["entries"]
+            ),
+        )
+
+    return name
+
+
+def shape_of(value: Any, max_elements: int = 1_000, depth: int = 0) -> dict:
+    """The type shape of `value`.
+
+    Classes are recorded by name (`{"class": ...}`), other values by the name of their type (`{"type": ...}`). Lists, sets, frozensets, tuples and dicts (of exactly these types) are recorded with the shapes of their elements, tallied (`"items"` and `"entries"`), positionally for short tuples (`"fields"`), and by key for short dicts whose keys are identifiers (`"keys"`, like a `TypedDict`). Keys which are not identifiers are not recorded, as they are likely data rather than names.
+
+    Parameters
+    ----------
+
+    value
+        The value.
+
+    max_elements
+        Maximum number of elements of a container whose shapes are tallied. Default: `1_000`
+
+    depth
+        Depth of nesting of `value` (containers nested deeper than `MAX_DEPTH` are recorded by their type only). Default: `0`
+    """
+    return _shape(value, max_elements, depth)[0]
+
+
+def _shape(value: Any, max_elements: int, depth: int) -> Tuple[dict, Any]:
+    """The shape of `value`, and a hashable key of its structure (the types,
+    without the lengths and counts), which identifies the shape without
+    serializing it."""
+    if isinstance(value, type):
+        name = qualified_name(value)
+        return {"class": name}, ("class", name)
+
+    value_type = type(value)
+    name = qualified_name(value_type)
+    shape: Dict[str, Any] = {"type": name}
+    if depth >= MAX_DEPTH:
+        return shape, name
+
+    depth += 1
+    if value_type is tuple and len(value) <= MAX_FIELDS:
+        fields = [_shape(v, max_elements, depth) for v in value]
+        shape["fields"] = [field for field, _ in fields]
+        return shape, (name, tuple(key for _, key in fields))
+
+    if value_type in (list, set, frozenset, tuple):
+        shape["len"] = len(value)
+        shape["items"], keys = _tally(
+            [_shape(v, max_elements, depth)]
+            for v in islice(value, max_elements)
+        )
+        return shape, (name, "items", keys)
+
+    if value_type is dict:
+        if len(value) <= MAX_KEYS and all(
+            type(key) is str and key.isidentifier() for key in value
+        ):
+            keys = {
+                key: _shape(v, max_elements, depth)
+                for key, v in value.items()
+            }
+            shape["keys"] = {key: field for key, (field, _) in keys.items()}
+            return shape, (
+                name,
+                "keys",
+                tuple((key, field_key) for key, (_, field_key) in keys.items()),
+            )
+
+        shape["len"] = len(value)
+        shape["entries"], keys = _tally(
+            [
+                _shape(key, max_elements, depth),
+                _shape(v, max_elements, depth),
+            ]
+            for key, v in islice(value.items(), max_elements)
+        )
+        return shape, (name, "entries", keys)
+
+    return shape, name
+
+
+def _tally(elements: Any) -> Tuple[List[list], frozenset]:
+    """Distinct shapes of `elements` (lists of `(shape, key)` pairs) with
+    their counts (most frequent first), and the key of the distinct shapes."""
+    tally: Dict[tuple, list] = {}
+    for element in elements:
+        key = tuple(key for _, key in element)
+        try:
+            tally[key][-1] += 1
+        except KeyError:
+            tally[key] = [*(shape for shape, _ in element), 1]
+
+    entries = sorted(tally.values(), key=lambda entry: -entry[-1])
+    return entries, frozenset(tally)
+
+
+def format_shape(shape: dict) -> str:
+    """Compact text of a shape, e.g. `list[int:998, str:2]`."""
+    if "class" in shape:
+        return f"type[{shape['class']}]"
+
+    name = shape["type"]
+    if "fields" in shape:
+        return f"{name}({', '.join(map(format_shape, shape['fields']))})"
+    if "keys" in shape:
+        keys = ", ".join(
+            f"{key}: {format_shape(value)}"
+            for key, value in shape["keys"].items()
+        )
+        return f"{name}{{{keys}}}"
+    if "items" in shape:
+        items = [f"{format_shape(s)}:{count}" for s, count in shape["items"]]
+    elif "entries" in shape:
+        items = [
+            f"{format_shape(key)} -> {format_shape(value)}:{count}"
+            for key, value, count in shape["entries"]
+        ]
+    else:
+        return name
+
+    entries = shape["items"] if "items" in shape else shape["entries"]
+    tallied = sum(entry[-1] for entry in entries)
+    if tallied < shape["len"]:
+        items.append(f"...:{shape['len'] - tallied}")
+
+    return f"{name}[{', '.join(items)}]"
+
+
+def record(plan: ValidationPlan, kwargs: Dict[str, Any], result: Any) -> None:
+    """Record the shapes of a call of the function of `plan` (with the bound
+    arguments `kwargs`, returning `result`) into the reservoir."""
+    global _distinct
+
+    shapes = {
+        name: _shape(kwargs[name], _max_elements, 0)
+        for name in plan.typed_arguments
+        if name in kwargs
+    }
+    if "return" in plan.typed_arguments:
+        shapes["return"] = _shape(result, _max_elements, 0)
+
+    func = plan.func
+    key = (
+        func.__module__,
+        func.__qualname__,
+        tuple((name, key) for name, (_, key) in shapes.items()),
+    )
+    with _lock:
+        entry = _records.get(key)
+        if entry is not None:
+            entry[-1] += 1
+            return
+
+        _distinct += 1
+        if len(_keys) < _capacity:
+            _keys.append(key)
+        else:
+            index = randrange(_distinct)
+            if index >= _capacity:
+                return
+            del _records[_keys[index]]
+            _keys[index] = key
+
+        _records[key] = [
+            func.__module__,
+            func.__qualname__,
+            {name: shape for name, (shape, _) in shapes.items()},
+            1,
+        ]
+
+
+class Exemplar:
+    """Stand-in for a value of a class which can not be instantiated without
+    arguments (`isinstance` checks see the class)."""
+
+    __slots__ = ("_cls",)
+
+    def __init__(self, cls: type) -> None:
+        self._cls = cls
+
+    @property
+    def __class__(self) -> type:
+        return self._cls
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cls, name)
+
+    def __repr__(self) -> str:
+        return f"<exemplar of {self._cls!r}>"
+
+
+class CallableExemplar(Exemplar):
+    """Stand-in for a callable value (e.g. a function)."""
+
+    __slots__ = ()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{self!r} can not be called")
+
+
+class UnresolvedName(LookupError):
+    """A name recorded in a profile which can not be imported."""
+
+
+def resolve(name: str) -> Any:
+    """The object of a qualified name (`module:qualname`, or the name of a
+    builtin)."""
+    module_name, _, qualname = name.rpartition(":")
+    if not module_name and qualname in _builtin_types:
+        return _builtin_types[qualname]
+    if "<locals>" in qualname:
+        raise UnresolvedName(name)
+
+    try:
+        obj = importlib.import_module(module_name or "builtins")
+        for attribute in qualname.split("."):
+            obj = getattr(obj, attribute)
+    except (ImportError, AttributeError) as error:
+        raise UnresolvedName(name) from error
+
+    return obj
+
+
+def _scalar_exemplar(cls: type, index: int) -> Any:
+    if cls is type(None):
+        return None
+    if cls is bool:
+        return bool(index % 2)
+    if cls in (int, float, complex):
+        return cls(index)
+    if cls is str:
+        return str(index)
+    if cls in (bytes, bytearray):
+        return cls(str(index).encode())
+    if issubclass(cls, Enum):
+        members = list(cls)
+        if members:
+            return members[index % len(members)]
+
+    try:
+        value = cls.__new__(cls)
+        hash(value)
+    except Exception:
+        if any("__call__" in vars(base) for base in cls.__mro__):
+            return CallableExemplar(cls)
+        return Exemplar(cls)
+
+    return value
+
+
+def exemplar(shape: dict, index: int = 0) -> Any:
+    """A value of the shape `shape` (`index` distinguishes the exemplars of
+    the elements of a set or of the keys of a dict)."""
+    if "class" in shape:
+        return resolve(shape["class"])
+
+    cls = resolve(shape["type"])
+    if "fields" in shape:
+        return tuple(exemplar(s, i) for i, s in enumerate(shape["fields"]))
+    if "keys" in shape:
+        return {key: exemplar(s) for key, s in shape["keys"].items()}
+    if "items" in shape:
+        return cls(exemplar(s, i) for i, (s, _) in enumerate(shape["items"]))
+    if "entries" in shape:
+        return {
+            exemplar(key, i): exemplar(value)
+            for i, (key, value, _) in enumerate(shape["entries"])
+        }
+
+    return _scalar_exemplar(cls, index)
+
+
+def replayable(annotation: Any) -> Any:
+    """`annotation` with value constraints replaced by the types of their
+    values, and signatures of callables dropped."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is None or not args:
+        return annotation
+    if origin is Annotated:
+        return replayable(args[0])
+    if origin is Literal:
+        return Union[tuple(dict.fromkeys(type(arg) for arg in args))]
+    if origin is collections.abc.Callable:
+        return Callable
+
+    erased = tuple(replayable(arg) for arg in args)
+    if erased == args:
+        return annotation
+    if isinstance(annotation, GenericAlias):
+        return types.GenericAlias(origin, erased)
+    if hasattr(annotation, "copy_with"):
+        return annotation.copy_with(erased)
+
+    # `X | Y`
+    return Union[erased]
+
+
+class ReplayResult:
+    """The validation of the shapes of the calls of a function.
+
+    Attributes
+    ----------
+
+    function
+        Qualified name of the function (`module:qualname`).
+
+    shapes
+        Shape of each argument (and `'return'`), by name.
+
+    count
+        Number of calls recorded with these shapes.
+
+    violations
+        Violations of the annotations of the function by the shapes.
+
+    error
+        Why the shapes could not be replayed (e.g. a name which is not importable), or `None`.
+    """
+
+    def __init__(
+        self,
+        function: str,
+        shapes: Dict[str, dict],
+        count: int,
+        violations: List["RuntimeTypingViolationBase"],
+        error: Optional[str] = None,
+    ) -> None:
+        self.function = function
+        self.shapes = shapes
+        self.count = count
+        self.violations = violations
+        self.error = error
+
+
+def read_profile(directory: Optional[str] = None) -> Dict[tuple, list]:
+    """Aggregate the shapes flushed by all processes to `directory`: the
+    shapes and the number of calls, by function and shapes."""
+    directory = directory or default_directory()
+    records: Dict[tuple, list] = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".shapes.jsonl"):
+            continue
+        with open(os.path.join(directory, filename), encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                key = (
+                    entry["module"],
+                    entry["qualname"],
+                    tuple(
+                        (name, structure(shape))
+                        for name, shape in entry["shapes"].items()
+                    ),
+                )
+                try:
+                    records[key][1] += entry["count"]
+                except KeyError:
+                    records[key] = [entry["shapes"], entry["count"]]
+
+    return records
+
+
+def replay(directory: Optional[str] = None) -> List[ReplayResult]:
+    """Validate the shapes flushed to `directory` against the annotations of the functions they were recorded for.
+
+    The modules of the functions are imported. Functions are not called: an exemplar value is built from each shape, and validated by a `TypedFunction` in `'return'` mode.
+
+    Parameters
+    ----------
+
+    directory
+        Directory passed to `enable_profiling`. Default: `None`, which is the default directory of `enable_profiling`.
+
+    Returns
+    -------
+
+    A `ReplayResult` per function and distinct shapes.
+    """
+    results = []
+    for (module, qualname, _), (shapes, count) in read_profile(
+        directory
+    ).items():
+        function = f"{module}:{qualname}"
+        try:
+            obj = resolve(function)
+            plan = plan_of(obj) or ValidationPlan(obj)
+            values = {name: exemplar(shape) for name, shape in shapes.items()}
+        except UnresolvedName as error:
+            results.append(
+                ReplayResult(
+                    function, shapes, count, [], f"cannot import `{error}`"
+                )
+            )
+            continue
+
+        typed_function = TypedFunction(
+            func=plan.func, kwargs=values, mode="return", defer=True, plan=plan
+        )
+        for name, value in values.items():
+            if name in plan.typed_arguments:
+                typed_function.validate_entity(
+                    Parameter(value, name),
+                    replayable(plan.typed_arguments[name]),
+                )
+        results.append(
+            ReplayResult(function, shapes, count, typed_function.violations)
+        )
+
+    return results
+
+
+def format_replay(results: List[ReplayResult]) -> str:
+    lines = []
+    for result in results:
+        if not (result.violations or result.error):
+            continue
+        shapes = ", ".join(
+            f"{name}: {format_shape(shape)}"
+            for name, shape in result.shapes.items()
+        )
+        lines.append(f"{result.function}({shapes}) [{result.count} calls]")
+        if result.error is not None:
+            lines.append(f"    ! {result.error}")
+        lines.extend(
+            f"    + {violation.message}" for violation in result.violations
+        )
+
+    calls = sum(result.count for result in results)
+    lines.append(
+        f"{len(results)} shapes of {calls} calls replayed, "
+        f"{sum(bool(r.violations) for r in results)} with violations, "
+        f"{sum(r.error is not None for r in results)} not replayable."
+    )
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    results = replay(argv[0] if argv else None)
+    print(format_replay(results))
+    if any(result.violations for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Compiled field validation for dataclasses and NamedTuples."""
+
+from dataclasses import fields, is_dataclass
+from functools import wraps
+from inspect import getmembers, isfunction
+from random import random
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from runtime_typing.aggregation import handling
+from runtime_typing.attributes import install_validated_setattr
+from runtime_typing.utils import cached_type_hints, get_root, Parameter
+
+
+_record_plans: Dict[type, Optional["RecordPlan"]] = {}
+
+
+def is_record_class(cls: Any) -> bool:
+    """Whether `cls` is a dataclass or a NamedTuple class."""
+    return isinstance(cls, type) and (
+        is_dataclass(cls)
+        or (issubclass(cls, tuple) and hasattr(cls, "_fields"))
+    )
+
+
+def is_immutable_record_class(cls: Any) -> bool:
+    """Whether `cls` is a frozen dataclass or a NamedTuple class."""
+    if is_dataclass(cls):
+        return cls.__dataclass_params__.frozen
+
+    return is_record_class(cls)
+
+
+class RecordPlan:
+    """The annotated fields of a dataclass or NamedTuple, compiled lazily.
+
+    Attributes
+    ----------
+
+    fields
+        Tuple of `(name, annotation, exact_type)` for each annotated field. `exact_type` is the annotation if it is a plain class, so that values of exactly that type are accepted with a single comparison. Otherwise, it is `None`.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        exclude: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.cls = cls
+        self.exclude = set(exclude) if exclude else set()
+        self.include = set(include) if include else set()
+        self._fields = None
+
+    @property
+    def fields(self) -> Tuple[Tuple[str, Any, Optional[type]], ...]:
+        if self._fields is None:
+            hints = cached_type_hints(self.cls)
+            names = (
+                [field.name for field in fields(self.cls)]
+                if is_dataclass(self.cls)
+                else self.cls._fields
+            )
+            names = [
+                name
+                for name in names
+                if name in hints
+                and (not self.include or name in self.include)
+                and name not in self.exclude
+            ]
+
+            self._fields = tuple(
+                (name, hints[name], exact_type(hints[name])) for name in names
+            )
+
+        return self._fields
+
+
+def exact_type(annotation: Any) -> Optional[type]:
+    if type(annotation) is type and get_root(annotation) is None:
+        return annotation
+
+    return None
+
+
+def record_plan(cls: type) -> Optional["RecordPlan"]:
+    """The plan of all annotated fields of `cls` (if it is a record class)."""
+    try:
+        return _record_plans[cls]
+    except KeyError:
+        plan = _record_plans[cls] = (
+            RecordPlan(cls) if is_record_class(cls) else None
+        )
+    except TypeError:
+        plan = None
+
+    return plan
+
+
+def validate_record(
+    typed_function: Any,
+    instance: Any,
+    plan: "RecordPlan",
+    parent: Optional["Parameter"] = None,
+) -> None:
+    """Validate the fields of `instance` with the validators of
+    `typed_function`."""
+    for name, condition, field_type in plan.fields:
+        value = getattr(instance, name)
+        if field_type is not None and type(value) is field_type:
+            continue
+
+        typed_function.validate_entity(
+            parameter=Parameter(value, name, parent), condition=condition
+        )
+
+
+def decorate_record_class(cls: type, decorator: Callable, **options) -> type:
+    """Validate the fields of every new instance of a dataclass or NamedTuple.
+
+    Instead of validating the arguments of the generated `__init__` (or
+    `__new__`) through the signature, the fields of the constructed instance
+    are validated against the compiled `RecordPlan` of the class. So are the
+    fields of the instances `_make` (and `_replace`) of a NamedTuple create.
+    All other methods are decorated as usual.
+    """
+    from runtime_typing.typed_function import TypedFunction
+
+    if options.get("validate_assignment") and is_immutable_record_class(cls):
+        raise ValueError(
+            f"Assignments can not be validated on `{cls.__qualname__}`, "
+            f"whose fields can not be assigned."
+        )
+
+    mode, sink = handling(options.get("mode", "raise"), options.get("sink"))
+    defer = options.get("defer", False)
+    sample = options.get("sample")
+    plan = RecordPlan(
+        cls, exclude=options.get("exclude"), include=options.get("include")
+    )
+
+    def validate(instance: Any) -> None:
+        if sample is not None and random() >= sample:
+            return
+
+        typed_function = TypedFunction(
+            func=cls, kwargs={}, mode=mode, defer=defer, sink=sink
+        )
+        validate_record(typed_function, instance, plan)
+
+    constructor_name = "__init__" if is_dataclass(cls) else "__new__"
+    constructor = getattr(cls, constructor_name)
+
+    if constructor_name == "__init__":
+
+        @wraps(constructor)
+        def validated_constructor(self, *args, **kwargs):
+            constructor(self, *args, **kwargs)
+            validate(self)
+
+    else:
+
+        @wraps(constructor)
+        def validated_constructor(cls, *args, **kwargs):
+            instance = constructor(cls, *args, **kwargs)
+            validate(instance)
+            return instance
+
+    for name, method in getmembers(cls, predicate=isfunction):
+        if name != constructor_name:
+            setattr(cls, name, decorator(method, **options))
+
+    if constructor_name == "__new__":
+        make = cls._make.__func__
+
+        @wraps(make)
+        def validated_make(cls, iterable):
+            instance = make(cls, iterable)
+            validate(instance)
+            return instance
+
+        # `_replace` creates the new instance with `_make`
+        cls._make = classmethod(validated_make)
+
+    if options.get("validate_assignment"):
+        # The constructor assigns all fields, which are validated on
+        # assignment then.
+        return install_validated_setattr(cls, **options)
+
+    setattr(cls, constructor_name, validated_constructor)
+    validated_constructor.__runtime_typing_record_plan__ = plan
+
+    return cls
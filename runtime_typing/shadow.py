@@ -0,0 +1,218 @@
+"""Validation of calls in a background worker, off the path of the call."""
+
+import os
+
+from copy import copy, deepcopy
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
+from warnings import warn
+from weakref import WeakSet
+
+from runtime_typing.typed_function import TypedFunction
+from runtime_typing.violations import (
+    RuntimeTypingNameError,
+    RuntimeTypingViolationBase,
+    RuntimeTypingWarning,
+)
+
+if TYPE_CHECKING:
+    from runtime_typing.plan import ValidationPlan
+
+
+SnapshotMode = Literal["reference", "shallow", "deep"]
+
+_validators: "WeakSet[ShadowValidator]" = WeakSet()
+
+
+def warn_violation(violation: "RuntimeTypingViolationBase") -> None:
+    violation.handle("warn")
+
+
+class ShadowValidator:
+    """Bounded queue of calls, validated by a background worker thread.
+
+    Parameters
+    ----------
+
+    maxsize
+        Maximum number of calls waiting for validation. When the queue is full, further calls are not validated (but counted in `dropped`). Default: `1024`
+
+    snapshot
+        How arguments and return values are captured on the calling thread. Default: `'reference'`
+
+        + `'reference'`: The objects themselves are queued. Cheapest, but objects mutated after the call are validated in their mutated state.
+
+        + `'shallow'`: Shallow copies of the objects are queued.
+
+        + `'deep'`: Deep copies of the objects are queued.
+
+    sink
+        Callable receiving every violation found by the worker. Default: Throw a `runtime_typing.RuntimeTypingWarning`. Errors of the validation itself (e.g. annotations which can not be resolved) are warned as `runtime_typing.RuntimeTypingWarning`, too.
+
+    Attributes
+    ----------
+
+    dropped
+        Number of calls which have not been validated, because the queue was full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        snapshot: "SnapshotMode" = "reference",
+        sink: Optional[Callable[["RuntimeTypingViolationBase"], Any]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.queue = Queue(maxsize=maxsize)
+        self.snapshot = {
+            "reference": lambda obj: obj,
+            "shallow": copy,
+            "deep": deepcopy,
+        }[snapshot]
+        self.sink = sink or warn_violation
+        self.dropped = 0
+
+        self._lock = Lock()
+        self._worker = None
+
+        _validators.add(self)
+
+    def capture(
+        self, kwargs: dict, plan: Optional["ValidationPlan"] = None
+    ) -> Optional[dict]:
+        """Snapshot the arguments of a call, before the function is called.
+
+        Only the typed arguments of `plan` (if given) are captured, the others are not validated anyway. Returns `None` (and counts the call as dropped), if the queue is full, so that calls which will not be validated do not pay for the snapshot.
+        """
+        if self.queue.full():
+            self._drop()
+            return None
+
+        if plan is not None:
+            try:
+                names = plan.typed_arguments
+            except RuntimeTypingNameError:
+                # reported by the worker, not on the calling thread
+                names = kwargs
+            kwargs = {name: kwargs[name] for name in names if name in kwargs}
+
+        try:
+            return {name: self.snapshot(value) for name, value in kwargs.items()}
+        except Exception:
+            return kwargs
+
+    def submit(
+        self,
+        func: Callable,
+        kwargs: dict,
+        result: Any,
+        **options: Any,
+    ) -> None:
+        """Queue the call of `func` for validation, without blocking.
+
+        Parameters
+        ----------
+
+        func
+            The (undecorated) function which has been called.
+
+        kwargs
+            The arguments of the call, by parameter name, as captured by `capture` (`None`, if the call has been dropped by `capture`).
+
+        result
+            The return value of the call.
+
+        options
+            Further keyword arguments to `TypedFunction` (such as `plan` or `parallel`).
+        """
+        if kwargs is None:
+            return
+
+        if self.queue.full():
+            self._drop()
+            return
+
+        plan = options.get("plan")
+        if (
+            plan is not None
+            and plan.compiled
+            and "return" not in plan.typed_arguments
+        ):
+            item = (func, kwargs, result, options)
+        else:
+            try:
+                item = (func, kwargs, self.snapshot(result), options)
+            except Exception:
+                item = (func, kwargs, result, options)
+
+        self._ensure_worker()
+
+        try:
+            self.queue.put_nowait(item)
+        except Full:
+            self._drop()
+
+    def _drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def join(self) -> None:
+        """Block until all queued calls are validated."""
+        self.queue.join()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = Thread(
+                        target=self._work,
+                        name="runtime_typing-shadow",
+                        daemon=True,
+                    )
+                    self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            func, kwargs, result, options = self.queue.get()
+            try:
+                typed_function = TypedFunction(
+                    func=func,
+                    kwargs=kwargs,
+                    mode="return",
+                    defer=True,
+                    **options,
+                )
+                typed_function.validate_arguments()
+                typed_function.validate_return(result)
+
+                for violation in typed_function.violations:
+                    self.sink(violation)
+            except Exception as error:
+                warn(
+                    f"Shadow validation of "
+                    f"`{getattr(func, '__qualname__', func)}` failed: {error}",
+                    RuntimeTypingWarning,
+                )
+            finally:
+                self.queue.task_done()
+
+    def _reset_in_child(self) -> None:
+        """The worker thread does not survive a fork: the child starts a
+        worker of its own (calls queued in the parent are validated by the
+        parent)."""
+        self.queue = Queue(maxsize=self.maxsize)
+        self._lock = Lock()
+        self._worker = None
+
+
+def _reset_in_child() -> None:
+    for validator in list(_validators):
+        validator._reset_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_in_child)
+
+
+default_shadow_validator = ShadowValidator()
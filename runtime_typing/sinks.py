@@ -0,0 +1,308 @@
+"""Sinks receiving violations, e.g. for structured logging or spooling."""
+
+import atexit
+import json
+import logging
+import os
+
+from abc import ABC, abstractmethod
+from collections import deque
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
+from weakref import WeakSet
+
+if TYPE_CHECKING:
+    from runtime_typing.violations import RuntimeTypingViolationBase
+
+
+def violation_record(violation: "RuntimeTypingViolationBase") -> Dict[str, Any]:
+    """JSON-serializable representation of a violation, with a timestamp."""
+    return {"time": time(), **violation.to_dict()}
+
+
+class ViolationSink(ABC):
+    """Abstract Base Class of Sinks receiving Violations.
+
+    Sinks are callables, so they can also be used as sink of a `runtime_typing.ShadowValidator`.
+    """
+
+    @abstractmethod
+    def emit(self, violation: "RuntimeTypingViolationBase") -> None:
+        pass
+
+    def emit_batch(
+        self, violations: Iterable["RuntimeTypingViolationBase"]
+    ) -> None:
+        for violation in violations:
+            self.emit(violation)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __call__(self, violation: "RuntimeTypingViolationBase") -> None:
+        self.emit(violation)
+
+
+class LoggingSink(ViolationSink):
+    """Log violations to a `logging.Logger`.
+
+    The JSON-serializable record of the violation is attached to the log record as `runtime_typing_violation`.
+
+    Parameters
+    ----------
+
+    logger
+        The logger (or the name of the logger). Default: `'runtime_typing'`
+
+    level
+        The level violations are logged with. Default: `logging.WARNING`
+    """
+
+    def __init__(
+        self,
+        logger: Any = "runtime_typing",
+        level: int = logging.WARNING,
+    ) -> None:
+        self.logger = (
+            logging.getLogger(logger) if isinstance(logger, str) else logger
+        )
+        self.level = level
+
+    def emit(self, violation: "RuntimeTypingViolationBase") -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                violation.message,
+                extra={"runtime_typing_violation": violation_record(violation)},
+            )
+
+
+class RingBufferSink(ViolationSink):
+    """Keep the most recent violations in memory.
+
+    Parameters
+    ----------
+
+    maxlen
+        Maximum number of violations kept. Older violations are discarded. Default: `1000`
+
+    Attributes
+    ----------
+
+    violations
+        The kept violations, oldest first.
+    """
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        self._buffer = deque(maxlen=maxlen)
+
+    def emit(self, violation: "RuntimeTypingViolationBase") -> None:
+        self._buffer.append(violation)
+
+    @property
+    def violations(self) -> List["RuntimeTypingViolationBase"]:
+        return list(self._buffer)
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+
+class JSONLinesFileSink(ViolationSink):
+    """Append violations as JSON lines to a file, which is rotated by size.
+
+    Parameters
+    ----------
+
+    path
+        Path of the file.
+
+    max_bytes
+        Size from which on the file is rotated (renamed to `<path>.1`, while `<path>.1` is renamed to `<path>.2` and so on). If `0`, the file is never rotated. Default: `10 MB`
+
+    backup_count
+        Number of rotated files which are kept. Default: `3`
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._lock = Lock()
+        self._file = None
+
+    def emit(self, violation: "RuntimeTypingViolationBase") -> None:
+        self.emit_batch([violation])
+
+    def emit_batch(
+        self, violations: Iterable["RuntimeTypingViolationBase"]
+    ) -> None:
+        lines = "".join(
+            json.dumps(violation_record(violation), default=str) + "\n"
+            for violation in violations
+        )
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+
+            self._file.write(lines)
+            self._file.flush()
+
+            if self.max_bytes and self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class BatchingDispatcher(ViolationSink):
+    """Deliver violations asynchronously and batch-wise to another sink.
+
+    Emitting a violation only puts it into a bounded queue, so the emitting thread never performs I/O. A background thread delivers the queued violations to `sink` in batches. Dispatchers are closed (i.e. the queued violations are delivered) at the exit of the interpreter.
+
+    Parameters
+    ----------
+
+    sink
+        The sink the violations are delivered to.
+
+    maxsize
+        Maximum number of queued violations. Violations emitted to a full queue are dropped (and counted in `dropped`). Default: `10000`
+
+    batch_size
+        Maximum number of violations delivered at once. Default: `100`
+
+    flush_interval
+        Maximum time (in seconds) a violation waits for its batch to fill up. Default: `1.0`
+
+    Attributes
+    ----------
+
+    dropped
+        Number of violations dropped, because the queue was full.
+    """
+
+    def __init__(
+        self,
+        sink: "ViolationSink",
+        maxsize: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        self._maxsize = maxsize
+        self._queue = Queue(maxsize=maxsize)
+        self._lock = Lock()
+        self._worker = None
+
+        _dispatchers.add(self)
+
+    def emit(self, violation: "RuntimeTypingViolationBase") -> None:
+        self._ensure_worker()
+
+        try:
+            self._queue.put_nowait(violation)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until all queued violations are delivered."""
+        self._queue.join()
+        self.sink.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.sink.close()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = Thread(
+                        target=self._work,
+                        name="runtime_typing-dispatcher",
+                        daemon=True,
+                    )
+                    self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except Empty:
+                    break
+
+            try:
+                self.sink.emit_batch(batch)
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _reset_in_child(self) -> None:
+        """The worker thread does not survive a fork: the child starts a
+        worker of its own (violations queued in the parent are delivered by
+        the parent)."""
+        self._queue = Queue(maxsize=self._maxsize)
+        self._lock = Lock()
+        self._worker = None
+
+
+_dispatchers: "WeakSet[BatchingDispatcher]" = WeakSet()
+
+
+@atexit.register
+def _close_at_exit() -> None:
+    for dispatcher in list(_dispatchers):
+        if dispatcher._worker is not None:
+            dispatcher.close()
+
+
+def _reset_in_child() -> None:
+    for dispatcher in list(_dispatchers):
+        dispatcher._reset_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_in_child)
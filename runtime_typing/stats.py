@@ -0,0 +1,276 @@
+"""Statistics of typed functions, aggregated across processes.
+
+Every process writes its counters into a memory-mapped file of its own (named
+after its process id and the time it was opened, so that a process reusing the
+id of a finished process does not overwrite its counters) in a shared
+directory. The file consists of a header and a fixed number of slots, one slot
+per typed function, each holding the name of the function and a fixed-layout
+array of counters. Counting a call is a few stores into the mapped memory
+under a lock of the process (its threads share the slots), so there is no
+inter-process communication on the hot path. Readers aggregate the counters
+of all files in the directory:
+
+.. code-block:: shell
+
+    python -m runtime_typing.stats /tmp/runtime_typing
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+
+from bisect import bisect_right
+from tempfile import gettempdir
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from runtime_typing.plan import ValidationPlan
+
+
+MAGIC = b"RTSTATS1"
+HEADER = struct.Struct("<8sQ")
+NAME_SIZE = 160
+
+BUCKET_BOUNDS = (10**3, 10**4, 10**5, 10**6, 10**7, 10**8, 10**9)
+BUCKET_LABELS = (
+    "<1us",
+    "<10us",
+    "<100us",
+    "<1ms",
+    "<10ms",
+    "<100ms",
+    "<1s",
+    ">=1s",
+)
+COUNTERS = ("calls", "validations", "violations", "time_ns") + tuple(
+    f"time {label}" for label in BUCKET_LABELS
+)
+CALLS, VALIDATIONS, VIOLATIONS, TIME_NS, FIRST_BUCKET = range(5)
+
+SLOT_SIZE = NAME_SIZE + 8 * len(COUNTERS)
+
+enabled = False
+
+_directory: Optional[str] = None
+_capacity = 0
+_file: Optional[mmap.mmap] = None
+_counters: Optional[memoryview] = None
+_slot_count = 0
+_slots: "WeakKeyDictionary[ValidationPlan, int]" = WeakKeyDictionary()
+_lock = Lock()
+
+
+def default_directory() -> str:
+    return os.path.join(gettempdir(), "runtime_typing")
+
+
+def enable_statistics(
+    directory: Optional[str] = None, capacity: int = 4096
+) -> None:
+    """Count calls, validations, violations and validation time of typed functions.
+
+    Parameters
+    ----------
+
+    directory
+        Directory the counters of all processes are written to (one file per process). Default: `None`, which is the directory `runtime_typing` in the temporary directory of the system.
+
+    capacity
+        Maximum number of typed functions counted per process. Calls of functions beyond the capacity are not counted. Default: `4096`
+    """
+    global enabled, _directory, _capacity
+
+    with _lock:
+        _close()
+        _directory = directory or default_directory()
+        _capacity = capacity
+        os.makedirs(_directory, exist_ok=True)
+        _open()
+
+    enabled = True
+
+
+def disable_statistics() -> None:
+    """Stop counting (the counters written so far are kept on disk)."""
+    global enabled
+
+    enabled = False
+    with _lock:
+        _close()
+
+
+def statistics_file(directory: str, pid: int, opened: int) -> str:
+    return os.path.join(directory, f"{pid}-{opened}.stats")
+
+
+def _open() -> None:
+    global _file, _counters, _slot_count
+
+    size = HEADER.size + _capacity * SLOT_SIZE
+    path = statistics_file(_directory, os.getpid(), time.time_ns())
+    with open(path, "w+b") as file:
+        file.truncate(size)
+        _file = mmap.mmap(file.fileno(), size)
+
+    HEADER.pack_into(_file, 0, MAGIC, _capacity)
+    _counters = memoryview(_file)[HEADER.size :].cast("B")
+    _slot_count = 0
+    _slots.clear()
+
+
+def _close() -> None:
+    global _file, _counters
+
+    if _counters is not None:
+        _counters.release()
+        _counters = None
+    if _file is not None:
+        _file.close()
+        _file = None
+    _slots.clear()
+
+
+def _reopen_in_child() -> None:
+    """Forked processes must not write into the file of their parent."""
+    global _lock
+
+    _lock = Lock()
+    if enabled:
+        _close()
+        _open()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_in_child)
+
+
+def _slot(plan: "ValidationPlan") -> Optional[memoryview]:
+    """The counters of the function of `plan` (allocated on first use).
+
+    Must be called with `_lock` held.
+    """
+    global _slot_count
+
+    index = _slots.get(plan)
+    if index is None:
+        if _slot_count >= _capacity:
+            return None
+        index = _slot_count
+        func = plan.func
+        name = f"{func.__module__}.{func.__qualname__}".encode()
+        offset = index * SLOT_SIZE
+        _counters[offset : offset + NAME_SIZE] = name[:NAME_SIZE].ljust(
+            NAME_SIZE, b"\0"
+        )
+        _slot_count += 1
+        _slots[plan] = index
+
+    offset = index * SLOT_SIZE + NAME_SIZE
+    return _counters[offset : offset + SLOT_SIZE - NAME_SIZE].cast("q")
+
+
+def count(
+    plan: "ValidationPlan", elapsed: int, validations: int, violations: int
+) -> None:
+    """Count a call of the function of `plan` into its slot.
+
+    The increments are not atomic, so they are done under the lock (which also
+    keeps the file from being closed meanwhile).
+    """
+    bucket = FIRST_BUCKET + bisect_right(BUCKET_BOUNDS, elapsed)
+
+    with _lock:
+        if _counters is None:
+            return
+        counters = _slot(plan)
+        if counters is None:
+            return
+
+        counters[CALLS] += 1
+        counters[VALIDATIONS] += validations
+        counters[VIOLATIONS] += violations
+        counters[TIME_NS] += elapsed
+        counters[bucket] += 1
+        counters.release()
+
+
+def read_statistics(
+    directory: Optional[str] = None,
+) -> Dict[str, Dict[str, int]]:
+    """Aggregate the counters written by all processes to `directory`.
+
+    Parameters
+    ----------
+
+    directory
+        Directory passed to `enable_statistics`. Default: `None`, which is the default directory of `enable_statistics`.
+
+    Returns
+    -------
+
+    The sum of the counters of all processes, by qualified name of the function. Counters are `calls`, `validations` (of arguments and return values), `violations`, `time_ns` (of validation) and a histogram of the validation time per call (`time <1us`, ..., `time >=1s`).
+    """
+    directory = directory or default_directory()
+    totals: Dict[str, Dict[str, int]] = {}
+
+    if not os.path.isdir(directory):
+        return totals
+
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".stats"):
+            continue
+        with open(os.path.join(directory, file_name), "rb") as file:
+            content = file.read()
+        if len(content) < HEADER.size:
+            continue
+        magic, capacity = HEADER.unpack_from(content)
+        if magic != MAGIC:
+            continue
+
+        for index in range(capacity):
+            offset = HEADER.size + index * SLOT_SIZE
+            name = content[offset : offset + NAME_SIZE].rstrip(b"\0")
+            if not name:
+                break
+            values = struct.unpack_from(
+                f"<{len(COUNTERS)}q", content, offset + NAME_SIZE
+            )
+            function_totals = totals.setdefault(
+                name.decode(errors="replace"), dict.fromkeys(COUNTERS, 0)
+            )
+            for counter, value in zip(COUNTERS, values):
+                function_totals[counter] += value
+
+    return totals
+
+
+def format_statistics(totals: Dict[str, Dict[str, int]]) -> str:
+    """Render aggregated statistics as a table, most expensive first."""
+    columns = ("calls", "validations", "violations", "time_ns")
+    rows: List[tuple] = [("function",) + columns]
+    for name, counters in sorted(
+        totals.items(), key=lambda item: -item[1]["time_ns"]
+    ):
+        rows.append((name,) + tuple(str(counters[c]) for c in columns))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    print(format_statistics(read_statistics(argv[0] if argv else None)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Bindings of the TypeVars of a typed call.
+
+The TypeVars occurring in the annotations of a function get fixed slots when
+its plan is compiled (see `ValidationPlan.type_var_slots`). A call binds them
+in a small array indexed by these slots, which can be snapshotted and rolled
+back cheaply, e.g. when a branch of a `Union` does not match.
+
+A TypeVar is bound to the type of the first value validated against it. Then,
+
++ later values have to be instances of the bound type, unless the TypeVar has a `bound`: then later values only have to be instances of the `bound`, and the binding is joined to the closest common base class of the values (within the `bound`).
+
++ if the TypeVar has constraints, values have to be instances of one of them, and the TypeVar is bound to the (first) matching constraint rather than to the type of the value.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
+
+
+def is_subclass(cls: Any, parent: Any) -> bool:
+    """`issubclass`, which is `False` rather than raising for non-classes."""
+    try:
+        return issubclass(cls, parent)
+    except TypeError:
+        return False
+
+
+def join(bound_type: type, new_type: type, bound: type) -> type:
+    """Closest common base class of `bound_type` and `new_type` within `bound`."""
+    for base in bound_type.__mro__:
+        if is_subclass(new_type, base) and is_subclass(base, bound):
+            return base
+
+    return bound
+
+
+class TypeVarBindings:
+    """Types bound to the TypeVars of a call, by slot.
+
+    TypeVars without a slot of the plan (e.g. TypeVars of resolved forward references) get a slot when they are bound first.
+    """
+
+    __slots__ = ("slots", "types")
+
+    def __init__(self, slots: Dict[TypeVar, int]) -> None:
+        self.slots = slots
+        self.types: List[Optional[type]] = [None] * len(slots)
+
+    def slot(self, type_var: TypeVar) -> int:
+        try:
+            return self.slots[type_var]
+        except KeyError:
+            self.slots = {**self.slots, type_var: len(self.types)}
+            self.types.append(None)
+            return self.slots[type_var]
+
+    def bound_type(self, type_var: TypeVar) -> Optional[type]:
+        """The type bound to `type_var` (or `None`, if it is not bound)."""
+        index = self.slots.get(type_var)
+        return None if index is None else self.types[index]
+
+    def snapshot(self) -> Tuple[Dict[TypeVar, int], Tuple[Optional[type], ...]]:
+        return self.slots, tuple(self.types)
+
+    def rollback(
+        self, snapshot: Tuple[Dict[TypeVar, int], Tuple[Optional[type], ...]]
+    ) -> None:
+        self.slots, types = snapshot
+        self.types[:] = types
+
+    def bind(self, type_var: TypeVar, value_type: type) -> Optional[Any]:
+        """Bind `type_var` to `value_type`, or check `value_type` against the
+        existing binding.
+
+        Returns
+        -------
+
+        `None`, if `value_type` is consistent with the binding (and the bound and constraints) of `type_var`, otherwise what had been expected instead.
+        """
+        index = self.slot(type_var)
+        bound_type = self.types[index]
+
+        constraints = type_var.__constraints__
+        if constraints:
+            for constraint in constraints:
+                if is_subclass(value_type, constraint):
+                    break
+            else:
+                return constraints
+
+            if bound_type is None:
+                self.types[index] = constraint
+                return None
+
+            return None if constraint is bound_type else bound_type
+
+        bound = type_var.__bound__
+        if isinstance(bound, type):
+            if not is_subclass(value_type, bound):
+                return bound
+
+            if bound_type is None:
+                self.types[index] = value_type
+            elif not is_subclass(value_type, bound_type):
+                self.types[index] = join(bound_type, value_type, bound)
+            return None
+
+        if bound_type is None:
+            self.types[index] = value_type
+            return None
+
+        return None if is_subclass(value_type, bound_type) else bound_type
@@ -5,10 +5,17 @@ runtime_typing
 Providing a function decorator to perform type checks during runtime.
 """
 
-from inspect import _empty, signature
 from functools import wraps
-from typing import Callable, Literal, Iterable, Optional
-
+from random import random
+from typing import Callable, Generic, Literal, Iterable, Optional
+
+from runtime_typing import hooks, profiling, stats
+from runtime_typing.aggregation import handling
+from runtime_typing.budget import Budget, current_request_budget
+from runtime_typing.generics import bindings_for_call, is_method_of, remember
+from runtime_typing.plan import ValidationPlan
+from runtime_typing.sinks import ViolationSink
+from runtime_typing.shadow import ShadowValidator, default_shadow_validator
 from runtime_typing.typed_function import TypedFunction
 from runtime_typing.utils import optional_arguments_to_decorator
 
@@ -16,10 +23,20 @@ from runtime_typing.utils import optional_arguments_to_decorator
 @optional_arguments_to_decorator
 def typed(
     obj: "Callable",
-    mode: Literal["raise", "warn", "return"] = "raise",
+    mode: Literal[
+        "raise", "warn", "aggregate", "return", "sink", "shadow"
+    ] = "raise",
     defer: bool = False,
     exclude: Optional[Iterable[str]] = None,
     include: Optional[Iterable[str]] = None,
+    parallel: Optional[int] = None,
+    shadow: Optional[ShadowValidator] = None,
+    sink: Optional[ViolationSink] = None,
+    validate_fields: bool = False,
+    validate_assignment: bool = False,
+    sample: Optional[float] = None,
+    budget: Optional[Budget] = None,
+    profile: bool = False,
 ) -> "Callable":
     """Decorator for validating arguments against type annotations.
 
@@ -27,7 +44,7 @@ def typed(
     ----------
 
     obj
-        The object to be typed (either a function or a class). When a class is decorated, all its methods are typed, except for classmethods. Subclasses are not typed subsequently. See Examples below.
+        The object to be typed (either a function or a class). When a class is decorated, all its methods are typed, except for classmethods. Subclasses are not typed subsequently. When a dataclass or a NamedTuple class is decorated (decorate it with `@typed` after `@dataclass`), the fields of every new instance are validated against the annotations of the class instead of validating the arguments of its constructor. See Examples below.
 
     mode
         Mode how to handle typing violations. Default: `'raise'`
@@ -36,8 +53,14 @@ def typed(
 
         + `'warn'`: For any violation of a type constraint, a `runtime_typing.RuntimeTypingWarning` is being thrown.
 
+        + `'aggregate'`: Like `'warn'`, but repetitions of the same violation (on the same function and parameter, with the same expected and actual type) are not warned each, but counted and warned as periodic summaries. Violations are aggregated by `sink`, which defaults to a `runtime_typing.WarningAggregator` shared by all typed functions.
+
         + `'return'`: No exception is raised and no warning is thrown, but the return value of the function is a 2-Tuple, consisting of the original result of the function and a (possibly empty) list of `runtime_typing.TypingViolation`.
 
+        + `'sink'`: No exception is raised and no warning is thrown, violations are only emitted to `sink`.
+
+        + `'shadow'`: The function is called right away, and its arguments and return value are queued for validation in a background thread (see `shadow`). Violations are reported to the sink of the `runtime_typing.ShadowValidator`.
+
     defer
         Whether to defer the handling of a violation. Default: `False`. By default, `@typed` handles every violation as soon as it occurs. This behavior can be changed by setting `defer` to `True`. This will gather all violations before handling them (i.e. throwing an Exception or a Warning)
 
@@ -47,6 +70,31 @@ def typed(
     exclude
         Iterable of names of arguments (can also contatin "return") to be ignored during type-checking. Definitions via `exclude` prevail over those via `include`.
 
+    parallel
+        Minimum number of elements of a container argument (e.g. a `List[...]`) from which on its elements are validated chunk-wise in a pool of worker processes (or threads, on free-threaded builds of python). Default: `None`, which means elements are always validated in-process. Containers which are smaller than this threshold never pay the dispatching cost. Elements that cannot be pickled are validated in-process, and so are elements of annotations containing a `TypeVar`, because bindings of a `TypeVar` must be shared among all elements, or a forward reference (e.g. recursive type aliases like `JSON = Union[str, List["JSON"]]`), which is resolved in the module of the function. Calls with a `budget` (or within a `request_budget`) validate in-process, too, so that the budget bounds the work. If the pool breaks (e.g. a worker is killed), the elements are validated in-process, and a fresh pool is started for the next container.
+
+
+    sink
+        A `runtime_typing.ViolationSink` every violation is emitted to, before it is handled according to `mode`. Default: `None`. Wrap a sink into a `runtime_typing.BatchingDispatcher` to deliver violations in a background thread, without doing I/O on the calling thread.
+
+    validate_fields
+        Whether the fields of dataclass and NamedTuple instances are validated (against the annotations of their class), when they are passed as arguments annotated with their class. Default: `False`, which only checks the type of the instance.
+
+    validate_assignment
+        Only applies to classes. Whether assignments of attributes annotated in the class (e.g. `count: int`) are validated, by a `__setattr__` installed on the class. Works with `__slots__` and (non-frozen) dataclasses, whose fields are then validated on assignment. Raises a `ValueError` for frozen dataclasses and NamedTuples, whose fields can not be assigned. Assigning values of a type which has been accepted before is cheap, if validation only depends on the type of the value (e.g. for `int` or `Optional[str]`). Not available in `'return'` and `'shadow'` mode. Default: `False`
+
+    sample
+        Fraction (between `0.0` and `1.0`) of calls to be validated, chosen at random. The other calls go straight to the function. On classes, the same fraction of the constructions of dataclasses and NamedTuples and of the assignments validated with `validate_assignment` is validated. Default: `None`, which validates every call.
+
+    budget
+        A `runtime_typing.Budget` limiting the validation work of each call (the number of values visited or the time spent). When it is exhausted, the remaining values are accepted without validation, and counted as skipped on `budget`. Calls within `runtime_typing.request_budget` spend the budget of the request, too. Default: `None`, which does not limit the work (except for the budget of a request).
+
+    profile
+        Whether to record the type shapes of the arguments and the return value (see `runtime_typing.enable_profiling`) instead of validating them. The shapes are validated offline, by replaying them against the annotations of the function (see `runtime_typing.replay`). Calls are only recorded while profiling is enabled, and (when `sample` is given) only a fraction of them. Default: `False`
+
+    shadow
+        The `runtime_typing.ShadowValidator` validating calls in `'shadow'` mode. It configures the size of the queue, how arguments are snapshotted and where violations are reported to. Default: A validator shared by all typed functions, which throws a `runtime_typing.RuntimeTypingWarning` for each violation.
+
 
     Example
     -------
@@ -151,6 +199,62 @@ def typed(
         def effectively_check_nothing(x: int, y: float) -> str:
             return (x, y)
 
+    Example
+    -------
+
+    Validate the elements of big containers in parallel with `parallel`. The violations are reported in the order of the elements.
+
+    .. code-block:: python
+
+        @typed(parallel=100_000)
+        def count_records(records: List[Record]) -> int:
+            return len(records)
+
+    Example
+    -------
+
+    Emit violations to a rotating file of JSON lines, written by a background thread, with `mode="sink"`.
+
+    .. code-block:: python
+
+        spool = BatchingDispatcher(JSONLinesFileSink("violations.jsonl"))
+
+
+        @typed(mode="sink", sink=spool)
+        def identity_of_int(x: int) -> int:
+            return x
+
+    >>> identity_of_int("does not raise")
+    "does not raise"
+
+    Example
+    -------
+
+    Record the type shapes of 1% of the calls with `profile=True`, and validate them offline (with `python -m runtime_typing.profiling`).
+
+    .. code-block:: python
+
+        enable_profiling("/var/tmp/shapes")
+
+
+        @typed(profile=True, sample=0.01)
+        def count_records(records: List[Record]) -> int:
+            return len(records)
+
+    Example
+    -------
+
+    Validate calls off the path of the call with `mode="shadow"`. The function returns right away, violations are reported by a background thread.
+
+    .. code-block:: python
+
+        @typed(mode="shadow", shadow=ShadowValidator(snapshot="deep"))
+        def identity_of_int(x: int) -> int:
+            return x
+
+    >>> identity_of_int("not an int")  # returns immediately
+    "not an int"
+
     Example
     -------
     Use `@typed` on a class: Instance methods and staticmethods are typed, even if they are inherited from an un-typed class; classmethods and nested classes are not typed.
@@ -201,6 +305,49 @@ def typed(
     Example
     -------
 
+    Use `@typed` on a dataclass, and validate the fields of instances passed as arguments with `validate_fields=True`:
+
+    .. code-block:: python
+
+        @typed
+        @dataclass
+        class Point:
+            x: float
+            y: float
+
+
+        @typed(validate_fields=True)
+        def norm(point: Point) -> float:
+            return (point.x**2 + point.y**2) ** 0.5
+
+    >>> Point(1.0, "not a float")
+    RuntimeTypingError: TypingViolation in type `Point`: Expected type of argument `y` to be `<class 'float'>` (got `<class 'str'>`).
+
+    Example
+    -------
+
+    Use `@typed` on a generic class. The type parameters are bound once per instance (from `Buffer[int]()`, or by the first call of a method), and are kept for all later method calls on the instance:
+
+    .. code-block:: python
+
+        T = TypeVar("T")
+
+
+        @typed
+        class Buffer(Generic[T]):
+            def __init__(self) -> None:
+                self.items = []
+
+            def push(self, item: T) -> None:
+                self.items.append(item)
+
+    >>> buffer = Buffer[int]()
+    >>> buffer.push("not an int")
+    RuntimeTypingError: TypingViolation in function `push`: Expected type of argument `item` to be `<class 'int'>` (got `<class 'str'>`).
+
+    Example
+    -------
+
     Typing a classmethod. If you want to type a classmethod of a class, you can do so by explicitely decorating it:
 
     .. code-block:: python
@@ -215,29 +362,86 @@ def typed(
     RuntimeTypingError: TypingViolation in function `some_class_method`: Expected type of argument `x` to be `<class 'int'>` (got `<class 'str'>`).
     """
 
+    if mode == "sink" and sink is None:
+        raise ValueError("Mode `'sink'` requires a `sink`.")
+
+    handle_mode, violation_sink = handling(mode, sink)
+
+    plan = ValidationPlan(func=obj, exclude=exclude, include=include)
+
     @wraps(obj)
     def validated(*args, **kwargs):
-        func_parameters = signature(obj).parameters
-
-        given_args = dict(zip(func_parameters.keys(), args))
-        given_args.update(kwargs)
-        default_args = {
-            name: parameter.default
-            for name, parameter in func_parameters.items()
-            if parameter.default is not _empty
-        }
-        kwargs = {**default_args, **given_args}
+        if sample is not None and random() >= sample:
+            return obj(*args, **kwargs)
+
+        if profile:
+            result = obj(*args, **kwargs)
+            if profiling.enabled:
+                profiling.record(plan, plan.binding.bind(args, kwargs), result)
+
+            return result
+
+        bound_arguments = plan.binding.bind(args, kwargs)
+
+        if mode == "shadow":
+            shadow_validator = shadow or default_shadow_validator
+            captured_kwargs = shadow_validator.capture(bound_arguments, plan)
+            result = obj(*args, **kwargs)
+            shadow_validator.submit(
+                obj,
+                captured_kwargs,
+                result,
+                parallel=parallel,
+                plan=plan,
+                validate_fields=validate_fields,
+            )
+
+            return result
+
+        generic_instance = None
+        type_var_bindings = None
+        if (
+            plan.type_var_slots
+            and args
+            and isinstance(args[0], Generic)
+            and is_method_of(args[0], validated)
+        ):
+            generic_instance = args[0]
+            type_var_bindings = bindings_for_call(generic_instance, plan)
+
+        call_budget = current_request_budget()
+        if budget is not None:
+            call_budget = budget.for_call(call_budget)
 
         typed_func = TypedFunction(
             func=obj,
-            kwargs=kwargs,
-            mode=mode,
+            kwargs=bound_arguments,
+            mode=handle_mode,
             defer=defer,
-            exclude=exclude,
-            include=include,
+            parallel=parallel,
+            sink=violation_sink,
+            plan=plan,
+            validate_fields=validate_fields,
+            call_arguments=(args, kwargs),
+            type_var_bindings=type_var_bindings,
+            budget=call_budget,
         )
-        result = typed_func()
+        if call_budget is not None:
+            call_budget.start()
+        try:
+            if hooks.active or stats.enabled:
+                result = hooks.instrumented_call(plan, typed_func)
+            else:
+                result = typed_func()
+        finally:
+            if call_budget is not None:
+                call_budget.stop()
+
+        if type_var_bindings is not None:
+            remember(generic_instance, typed_func)
 
         return result
 
+    validated.__runtime_typing_plan__ = plan
+
     return validated
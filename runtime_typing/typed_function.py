@@ -1,10 +1,21 @@
-from collections.abc import Callable, Iterable
+from collections.abc import (
+    Callable,
+    Collection,
+    Container,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Sequence,
+    Set as AbstractSet,
+)
 from typing import (
     get_args,
-    get_type_hints,
     Any,
     Callable as TypingCallable,
     Dict,
+    ForwardRef,
     _GenericAlias,
     Iterable as TypingIterable,
     List,
@@ -17,6 +28,10 @@ from typing import (
 )
 from warnings import warn
 
+from runtime_typing.plan import ValidationPlan
+from runtime_typing.records import record_plan, validate_record
+from runtime_typing.sinks import ViolationSink
+from runtime_typing.type_vars import TypeVarBindings
 from runtime_typing.violations import (
     RuntimeTypingViolation,
     ComplexRuntimeTypingViolation,
@@ -25,9 +40,24 @@ from runtime_typing.violations import (
     RuntimeTypingError,
     RuntimeTypingWarning,
 )
+from runtime_typing.budget import Budget
+from runtime_typing.checked import CheckedContainer
+from runtime_typing.constraints import compile_constraints
+from runtime_typing.parallel import bind_violation, validate_in_chunks
 from runtime_typing.utils import (
+    Annotated,
+    cached_isinstance,
+    cached_issubclass,
+    cached_type_hints,
     contains,
+    contains_forward_ref,
+    contains_type_var,
     get_root,
+    homogeneous_element_type,
+    parameter_name,
+    parameter_path,
+    parameter_pattern,
+    resolve_forward_ref,
     valid_args_from_literal,
     Parameter,
 )
@@ -42,48 +72,111 @@ class TypedFunction:
         defer: bool,
         exclude: Optional[TypingIterable[str]] = None,
         include: Optional[TypingIterable[str]] = None,
-        type_var_registry: Optional[dict] = None,
+        type_var_bindings: Optional[TypeVarBindings] = None,
+        parallel: Optional[int] = None,
+        sink: Optional["ViolationSink"] = None,
+        recursion_guard: Optional[set] = None,
+        plan: Optional["ValidationPlan"] = None,
+        validate_fields: bool = False,
+        call_arguments: Optional[Tuple[tuple, dict]] = None,
+        budget: Optional[Budget] = None,
     ) -> None:
         self.func = func
         self.kwargs = kwargs
+        self.call_arguments = call_arguments
+        self.budget = budget
         self.mode = mode
         self.defer = defer
-        self.type_var_registry = type_var_registry or {}
-        self.exclude = set(exclude) if exclude else set()
-        self.include = set(include) if include else set()
+        self.parallel = parallel
+        self.sink = sink
+        self.validate_fields = validate_fields
+        self.recursion_guard = (
+            recursion_guard if recursion_guard is not None else set()
+        )
+        self._type_var_bindings = type_var_bindings
+        self.exclude = exclude
+        self.include = include
+        self.plan = plan
 
         self.violations = []
         self.return_value = None
 
     @property
     def annotated_arguments(self) -> Dict[str, _GenericAlias]:
-        return get_type_hints(self.func)
+        return cached_type_hints(self.func)
 
     @property
     def typed_arguments(self) -> Dict[str, _GenericAlias]:
-        include = (
-            self.annotated_arguments.keys()
-            if not self.include
-            else self.include
-        ) - self.exclude
-
-        return dict(
-            filter(
-                lambda item: item[0] in include,
-                self.annotated_arguments.items(),
+        if self.plan is None:
+            self.plan = ValidationPlan(
+                func=self.func, exclude=self.exclude, include=self.include
             )
-        )
+
+        return self.plan.typed_arguments
+
+    @property
+    def type_var_bindings(self) -> TypeVarBindings:
+        """Bindings of the TypeVars of the call (created on first use)."""
+        if self._type_var_bindings is None:
+            slots = self.plan.type_var_slots if self.plan is not None else {}
+            self._type_var_bindings = TypeVarBindings(slots)
+
+        return self._type_var_bindings
 
     def __call__(
         self,
     ) -> Union[Any, Tuple[Any, List[RuntimeTypingViolationBase]]]:
-        for arg_name, condition in self.typed_arguments.items():
+        self.validate_arguments()
+
+        result = self.call_function()
+
+        self.validate_return(result)
+
+        self.result = result
+
+        if self.mode == "return":
+            return self.result, self.violations
+
+        return self.result
+
+    def call_function(self) -> Any:
+        """Call the function with `call_arguments` (the positional and keyword
+        arguments of the call), or with `kwargs` as keyword arguments."""
+        budget = self.budget
+        if budget is not None:
+            # the time of the function itself is not spent on validation
+            budget.stop()
+        try:
+            if self.call_arguments is None:
+                return self.func(**self.kwargs)
+
+            args, kwargs = self.call_arguments
+            return self.func(*args, **kwargs)
+        finally:
+            if budget is not None:
+                budget.start()
+
+    def validate_arguments(self) -> None:
+        """Validate the arguments in `kwargs` (without calling the function).
+
+        When violations are raised right away, cheap arguments are validated
+        first, so that a call fails fast (see
+        `ValidationPlan.cost_ordered_arguments`).
+        """
+        arguments = self.typed_arguments.items()
+        if self.mode == "raise" and not self.defer:
+            arguments = self.plan.cost_ordered_arguments
+
+        for arg_name, condition in arguments:
             if arg_name == "return":
                 continue
 
             try:
                 val = self.kwargs[arg_name]
             except KeyError:
+                if self.call_arguments is not None:
+                    # calling the function raises the `TypeError`
+                    continue
                 raise TypeError(
                     f"`{self.func.__name__}()` missing required positional "
                     f"argument `{arg_name}`."
@@ -94,21 +187,14 @@ class TypedFunction:
                 condition=condition,
             )
 
-        result = self.func(**self.kwargs)
-
+    def validate_return(self, result: Any) -> None:
+        """Validate `result` as return value of the function."""
         if "return" in self.typed_arguments:
             self.validate_entity(
                 parameter=Parameter(value=result, name="return"),
-                condition=get_type_hints(self.func)["return"],
+                condition=self.typed_arguments["return"],
             )
 
-        self.result = result
-
-        if self.mode == "return":
-            return self.result, self.violations
-
-        return self.result
-
     def handle_violations(self) -> List[RuntimeTypingViolationBase]:
         if self.violations:
             message = "\n    + " + "\n    + ".join(
@@ -130,37 +216,34 @@ class TypedFunction:
     ) -> "RuntimeTypingViolationBase":
         """Check whether entity of `name` and `val` violates condition,
         recursively walking through nested condition."""
+        if self.budget is not None and not self.budget.spend():
+            return
+
         root = get_root(condition)
 
-        try:
-            validation_method = {
-                # Annotated: self.__validate_annotated,
-                Any: self.__validate_any,
-                Union: self.__validate_union,
-                Literal: self.__validate_literal,
-                Callable: self.__validate_callable,
-                Iterable: self.__validate_iterable,
-                TypedDict: self.__validate_typed_dict,
-                TypeVar: self.__validate_type_var,
-                type: self.__validate_type,
-                dict: self.__validate_dict,
-                list: self.__validate_list,
-                set: self.__validate_set,
-                frozenset: self.__validate_frozenset,
-                tuple: self.__validate_tuple,
-            }[root]
-
-            validation_method(parameter=parameter, condition=condition)
-
-        except KeyError:
+        validation_method = self._validation_methods.get(root)
+        if validation_method is None:
             self.__validate_primitive(
                 parameter=parameter,
                 expected_type=condition,
                 constraints=tuple(),
             )
+            return
+
+        validation_method(self, parameter=parameter, condition=condition)
+
+    def __skip_remaining(
+        self, values: Any, index: int, values_per_item: int = 1
+    ) -> None:
+        """Record the elements of `values` from `index` on as skipped."""
+        try:
+            remaining = len(values) - index
+        except TypeError:
+            remaining = 1
+        self.budget.skip(remaining * values_per_item)
 
     def __add_violation(
-        self, expected: Any, got: Any, category: str, parameter_name: str
+        self, expected: Any, got: Any, category: str, parameter: "Parameter"
     ) -> None:
         self.violations.append(
             RuntimeTypingViolation(
@@ -168,9 +251,12 @@ class TypedFunction:
                 expected=expected,
                 got=got,
                 category=category,
-                parameter_name=parameter_name,
+                parameter_name=parameter_name(parameter),
+                path=parameter_path(parameter),
+                pattern=parameter_pattern(parameter),
                 mode=self.mode,
                 defer=self.defer,
+                sink=self.sink,
             )
         )
 
@@ -179,6 +265,71 @@ class TypedFunction:
     ) -> None:
         pass
 
+    def __validate_forward_ref(
+        self, parameter: "Parameter", condition: ForwardRef
+    ) -> None:
+        """Validate against the (cached) evaluation of a forward reference.
+
+        Forward references are how recursive type aliases refer to
+        themselves. An entity which is (recursively) being validated against
+        the same forward reference already is considered valid, so that
+        cyclic values do not recurse infinitely.
+        """
+        key = (id(parameter.value), condition)
+        if key in self.recursion_guard:
+            return
+
+        self.recursion_guard.add(key)
+        try:
+            self.validate_entity(
+                parameter=parameter,
+                condition=resolve_forward_ref(condition, self.func),
+            )
+        finally:
+            self.recursion_guard.discard(key)
+
+    def __validate_annotated(
+        self, parameter: "Parameter", condition: _GenericAlias
+    ) -> None:
+        """Validate the type, and the constraints in the metadata.
+
+        Length constraints are checked first (they are cheap even for large
+        containers). Other constraints are only checked on values of the
+        right type. The constraints are compiled with the plan, except for
+        annotations the plan does not know (e.g. behind forward references).
+        """
+        constraints = None
+        if self.plan is not None:
+            constraints = self.plan.constraints.get(id(condition))
+        if constraints is None:
+            constraints = compile_constraints(condition.__metadata__)
+
+        violated = constraints.violated_length_constraint(parameter.value)
+        if violated is not None:
+            self.__add_violation(
+                expected=violated,
+                got=len(parameter.value),
+                parameter=parameter,
+                category="length of argument",
+            )
+            return
+
+        violation_count = len(self.violations)
+        self.validate_entity(
+            parameter=parameter, condition=condition.__origin__
+        )
+        if len(self.violations) > violation_count:
+            return
+
+        violated = constraints.violated_value_constraint(parameter.value)
+        if violated is not None:
+            self.__add_violation(
+                expected=violated,
+                got=parameter.value,
+                parameter=parameter,
+                category="value of argument",
+            )
+
     def __validate_primitive(
         self,
         parameter: "Parameter",
@@ -187,40 +338,46 @@ class TypedFunction:
     ):
         if constraints:
             if not any(
-                isinstance(parameter.value, constraint)
+                cached_isinstance(parameter.value, constraint)
                 for constraint in constraints
             ):
                 self.__add_violation(
                     expected=constraints,
                     got=type(parameter.value),
                     category="type of argument",
-                    parameter_name=parameter.name,
+                    parameter=parameter,
                 )
-        if not isinstance(parameter.value, expected_type):
+        if not cached_isinstance(parameter.value, expected_type):
             self.__add_violation(
                 expected=expected_type,
                 got=type(parameter.value),
                 category="type of argument",
-                parameter_name=parameter.name,
+                parameter=parameter,
             )
+        elif self.validate_fields:
+            plan = record_plan(expected_type)
+            if plan is not None:
+                validate_record(self, parameter.value, plan, parameter)
 
     def __validate_type_var(
         self,
         parameter: "Parameter",
         condition: _GenericAlias,
     ) -> None:
-        cond = condition
-        if condition in self.type_var_registry:
-            expected_type = self.type_var_registry[condition]
-        else:
-            expected_type = type(parameter.value)
-            self.type_var_registry[condition] = type(parameter.value)
-
-        self.__validate_primitive(
-            parameter=parameter,
-            expected_type=expected_type,
-            constraints=condition.__constraints__,
+        expected = self.type_var_bindings.bind(
+            condition, type(parameter.value)
         )
+        if expected is not None:
+            self.__add_violation(
+                expected=expected,
+                got=type(parameter.value),
+                category="type of argument",
+                parameter=parameter,
+            )
+        elif self.validate_fields:
+            plan = record_plan(type(parameter.value))
+            if plan is not None:
+                validate_record(self, parameter.value, plan, parameter)
 
     def __validate_typed_dict(
         self,
@@ -231,24 +388,25 @@ class TypedFunction:
             self.__add_violation(
                 expected=dict,
                 got=type(parameter.value),
-                parameter_name=parameter.name,
+                parameter=parameter,
                 category="type of argument",
             )
-        for expected_key, expected_type in get_type_hints(condition).items():
+            return
+
+        for expected_key, expected_type in cached_type_hints(
+            condition
+        ).items():
             if not expected_key in parameter.value:
                 self.__add_violation(
                     expected=expected_key,
                     got=None,
-                    parameter_name=parameter.name,
+                    parameter=parameter,
                     category="key in TypedDict",
                 )
                 continue
 
             self.validate_entity(
-                Parameter(
-                    parameter.value[expected_key],
-                    f"{parameter.name}.{expected_key}",
-                ),
+                Parameter(parameter.value[expected_key], expected_key, parameter),
                 expected_type,
             )
 
@@ -259,24 +417,70 @@ class TypedFunction:
         sequence_type: type,
     ) -> None:
         """Validate sequence types (with potential inner_condition)."""
-        if not isinstance(parameter.value, sequence_type):
+        if not cached_isinstance(parameter.value, sequence_type):
             self.__add_violation(
                 expected=sequence_type,
                 got=type(parameter.value),
-                parameter_name=parameter.name,
+                parameter=parameter,
                 category="type of argument",
             )
+            return
+
+        if isinstance(
+            parameter.value, CheckedContainer
+        ) and parameter.value.satisfies(condition):
+            return
 
         try:
             inner_condition = get_args(condition)[0]
-            for element_val in parameter.value:
-                self.validate_entity(
-                    parameter=Parameter(element_val, parameter.name),
-                    condition=inner_condition,
+        except IndexError:
+            return
+
+        element_type = homogeneous_element_type(parameter.value)
+        if (
+            element_type is not None
+            and isinstance(inner_condition, type)
+            and get_root(inner_condition) is None
+        ):
+            if not issubclass(element_type, inner_condition):
+                self.__add_violation(
+                    expected=inner_condition,
+                    got=element_type,
+                    parameter=Parameter(None, 0, parameter),
+                    category="type of argument",
                 )
+            return
+
+        if (
+            self.parallel is not None
+            and self.budget is None
+            and hasattr(parameter.value, "__len__")
+            and len(parameter.value) >= self.parallel
+            and not contains_type_var(inner_condition)
+            and not contains_forward_ref(inner_condition)
+        ):
+            violations = validate_in_chunks(
+                values=parameter.value,
+                parameter=parameter,
+                condition=inner_condition,
+                validate_fields=self.validate_fields,
+            )
+            if violations is not None:
+                for violation in violations:
+                    bind_violation(violation, self.func)
+                    self.violations.append(violation)
+                    if not self.defer:
+                        violation.handle(self.mode, self.sink)
+                return
 
-        except IndexError:
-            pass
+        for index, element_val in enumerate(parameter.value):
+            if self.budget is not None and self.budget.exhausted:
+                self.__skip_remaining(parameter.value, index)
+                break
+            self.validate_entity(
+                parameter=Parameter(element_val, index, parameter),
+                condition=inner_condition,
+            )
 
     def __validate_list(
         self, parameter: "Parameter", condition: _GenericAlias
@@ -302,6 +506,31 @@ class TypedFunction:
             parameter=parameter, condition=condition, sequence_type=Iterable
         )
 
+    def __validate_abstract_collection(
+        self,
+        parameter: "Parameter",
+        condition: _GenericAlias,
+    ) -> None:
+        return self.__validate_sequence(
+            parameter=parameter,
+            condition=condition,
+            sequence_type=get_root(condition),
+        )
+
+    def __validate_container(
+        self,
+        parameter: "Parameter",
+        condition: _GenericAlias,
+    ) -> None:
+        """Validate `Container` (whose elements can not be enumerated)."""
+        if not cached_isinstance(parameter.value, Container):
+            self.__add_violation(
+                expected=Container,
+                got=type(parameter.value),
+                parameter=parameter,
+                category="type of argument",
+            )
+
     def __validate_tuple(
         self,
         parameter: "Parameter",
@@ -310,17 +539,21 @@ class TypedFunction:
         if not isinstance(parameter.value, tuple):
             self.__add_violation(
                 expected=tuple,
-                got=typ(parameter.value),
+                got=type(parameter.value),
                 category="type of argument",
-                parameter_name=parameter.name,
+                parameter=parameter,
             )
+            return
 
         inner_condition = get_args(condition)
 
         if inner_condition[-1] is Ellipsis:
-            for element_val in parameter.value:
+            for index, element_val in enumerate(parameter.value):
+                if self.budget is not None and self.budget.exhausted:
+                    self.__skip_remaining(parameter.value, index)
+                    break
                 self.validate_entity(
-                    parameter=Parameter(element_val, parameter.name),
+                    parameter=Parameter(element_val, index, parameter),
                     condition=inner_condition[-2],
                 )
         else:
@@ -329,14 +562,14 @@ class TypedFunction:
                     expected=len(inner_condition),
                     got=len(parameter.value),
                     category="length of argument",
-                    parameter_name=parameter.name,
+                    parameter=parameter,
                 )
 
-            for element_val, element_condition in zip(
-                parameter.value, inner_condition
+            for index, (element_val, element_condition) in enumerate(
+                zip(parameter.value, inner_condition)
             ):
                 self.validate_entity(
-                    parameter=Parameter(value=element_val, name=parameter.name),
+                    parameter=Parameter(element_val, index, parameter),
                     condition=element_condition,
                 )
 
@@ -346,41 +579,52 @@ class TypedFunction:
         condition: _GenericAlias,
         entity_or_type: Literal["entity", "type"] = "entity",
     ) -> None:
-        inner_condition = get_args(condition)
-        union_violations = []
+        violation_count = len(self.violations)
+        snapshot = self.__type_var_snapshot()
+        defer, self.defer = self.defer, True
+        try:
+            for inner_argument in get_args(condition):
+                branch_violation_count = len(self.violations)
+                if entity_or_type == "entity":
+                    self.validate_entity(
+                        parameter=parameter, condition=inner_argument
+                    )
+
+                if entity_or_type == "type":
+                    self.__validate_subclass(
+                        parameter=parameter, condition=inner_argument
+                    )
+
+                if len(self.violations) == branch_violation_count:
+                    del self.violations[violation_count:]
+                    return
+
+                self.__type_var_rollback(snapshot)
+        finally:
+            self.defer = defer
 
-        for inner_argument in inner_condition:
-            aux = TypedFunction(
-                func=self.func,
-                defer=True,
+        union_violations = self.violations[violation_count:]
+        del self.violations[violation_count:]
+        self.violations.append(
+            ComplexRuntimeTypingViolation(
+                violations=union_violations,
                 mode=self.mode,
-                kwargs=self.kwargs,
-                type_var_registry=self.type_var_registry,
+                defer=self.defer,
+                sink=self.sink,
             )
-            if entity_or_type == "entity":
-                aux.validate_entity(
-                    parameter=parameter, condition=inner_argument
-                )
-
-            if entity_or_type == "type":
-                aux.__validate_type(
-                    parameter=parameter, condition=inner_argument
-                )
+        )
 
-            if not aux.violations:
-                self.type_var_registry.update(aux.type_var_registry)
-                return
+    def __type_var_snapshot(self) -> Optional[tuple]:
+        if self._type_var_bindings is None:
+            return None
 
-            union_violations += aux.violations
+        return self._type_var_bindings.snapshot()
 
-        if union_violations:
-            self.violations.append(
-                ComplexRuntimeTypingViolation(
-                    violations=union_violations,
-                    mode=self.mode,
-                    defer=self.defer,
-                )
-            )
+    def __type_var_rollback(self, snapshot: Optional[tuple]) -> None:
+        if snapshot is None:
+            self._type_var_bindings = None
+        else:
+            self._type_var_bindings.rollback(snapshot)
 
     def __validate_literal(
         self,
@@ -393,7 +637,7 @@ class TypedFunction:
             self.__add_violation(
                 expected=valid_values,
                 got=parameter.value,
-                parameter_name=parameter.name,
+                parameter=parameter,
                 category="value of argument",
             )
 
@@ -406,7 +650,7 @@ class TypedFunction:
             self.__add_violation(
                 expected="collections.abc.Callable",
                 got=type(parameter.value),
-                parameter_name=parameter.name,
+                parameter=parameter,
                 category="type of argument",
             )
 
@@ -415,7 +659,7 @@ class TypedFunction:
         if inner_condition:
             condition_arg_types, condition_return_type = inner_condition
 
-            val_hints = get_type_hints(parameter.value)
+            val_hints = cached_type_hints(parameter.value)
             val_arg_types = list(
                 val_hints[arg] for arg in val_hints.keys() if arg != "return"
             )
@@ -428,7 +672,7 @@ class TypedFunction:
                 self.__add_violation(
                     expected=len(condition_arg_types),
                     got=len(val_arg_types),
-                    parameter_name=parameter.name,
+                    parameter=parameter,
                     category="length of value of argument",
                 )
 
@@ -439,7 +683,7 @@ class TypedFunction:
                     self.__add_violation(
                         expected=condition_arg_type,
                         got=val_arg_type,
-                        parameter_name=parameter.name,
+                        parameter=parameter,
                         category=f"{index + 1}. argument's type in callable "
                         f"argument ",
                     )
@@ -448,20 +692,42 @@ class TypedFunction:
                 self.__add_violation(
                     expected=condition_return_type,
                     got=val_return_type,
-                    parameter_name=parameter.name,
+                    parameter=parameter,
                     category="return type of callable argument",
                 )
 
     def __validate_dict(
         self, parameter: "Parameter", condition: _GenericAlias
     ) -> None:
-        if not isinstance(parameter.value, dict):
+        return self.__validate_mapping(parameter, condition, dict)
+
+    def __validate_abstract_mapping(
+        self, parameter: "Parameter", condition: _GenericAlias
+    ) -> None:
+        return self.__validate_mapping(
+            parameter, condition, get_root(condition)
+        )
+
+    def __validate_mapping(
+        self,
+        parameter: "Parameter",
+        condition: _GenericAlias,
+        mapping_type: type,
+    ) -> None:
+        """Validate mapping types, walking keys and values in one pass."""
+        if not cached_isinstance(parameter.value, mapping_type):
             self.__add_violation(
-                expected=dict,
+                expected=mapping_type,
                 got=type(parameter.value),
-                parameter_name=parameter.name,
+                parameter=parameter,
                 category="type of argument",
             )
+            return
+
+        if isinstance(
+            parameter.value, CheckedContainer
+        ) and parameter.value.satisfies(condition):
+            return
 
         inner_condition = get_args(condition)
 
@@ -469,36 +735,35 @@ class TypedFunction:
 
             key_type, value_type = inner_condition
 
-            aux = TypedFunction(
-                func=self.func,
-                defer=True,
-                mode=self.mode,
-                kwargs=self.kwargs,
-                type_var_registry=self.type_var_registry,
-            )
-
-            for key in parameter.value.keys():
-                aux.validate_entity(
-                    parameter=Parameter(
-                        value=key,
-                        name=f"key in `{parameter.name}`",
-                    ),
-                    condition=key_type,
-                )
-
-            for value in parameter.value.values():
-                aux.validate_entity(
-                    parameter=Parameter(
-                        value=value,
-                        name=f"value in `{parameter.name}`",
-                    ),
-                    condition=value_type,
-                )
+            violation_count = len(self.violations)
+            defer, self.defer = self.defer, True
+            try:
+                for index, (key, value) in enumerate(
+                    parameter.value.items()
+                ):
+                    if self.budget is not None and self.budget.exhausted:
+                        self.__skip_remaining(parameter.value, index, 2)
+                        break
+                    self.validate_entity(
+                        parameter=Parameter(key, key, parameter, "key"),
+                        condition=key_type,
+                    )
+                    self.validate_entity(
+                        parameter=Parameter(value, key, parameter, "value"),
+                        condition=value_type,
+                    )
+            finally:
+                self.defer = defer
 
-            if aux.violations:
+            if len(self.violations) > violation_count:
+                mapping_violations = self.violations[violation_count:]
+                del self.violations[violation_count:]
                 self.violations.append(
                     ComplexRuntimeTypingViolation(
-                        aux.violations, mode=self.mode, defer=self.defer
+                        mapping_violations,
+                        mode=self.mode,
+                        defer=self.defer,
+                        sink=self.sink,
                     )
                 )
 
@@ -507,56 +772,90 @@ class TypedFunction:
         parameter: "Parameter",
         condition: _GenericAlias,
     ) -> None:
-        if type(parameter.value) is not type:
+        if not isinstance(parameter.value, type):
             self.__add_violation(
                 expected=type,
                 got=type(parameter.value),
-                parameter_name=parameter.name,
+                parameter=parameter,
                 category="type of argument",
             )
+            return
 
-        if type(condition) is type:
-            if not issubclass(parameter.value, condition):
+        for target in get_args(condition):
+            self.__validate_subclass(parameter=parameter, condition=target)
+
+    def __validate_subclass(
+        self,
+        parameter: "Parameter",
+        condition: _GenericAlias,
+    ) -> None:
+        """Validate the class `parameter.value` against the `X` of `Type[X]`."""
+        root = get_root(condition)
+        if root is Any:
+            return
+
+        if root is Union:
+            self.__validate_union(
+                parameter=parameter,
+                condition=condition,
+                entity_or_type="type",
+            )
+            return
+
+        if root is TypeVar:
+            expected = self.type_var_bindings.bind(condition, parameter.value)
+            if expected is not None:
                 self.__add_violation(
-                    expected=condition,
+                    expected=expected,
                     got=parameter.value,
-                    parameter_name=parameter.name,
+                    parameter=parameter,
                     category="argument",
                 )
+            return
 
-        else:
-            inner_condition = get_args(condition)
-
-            if inner_condition:
-                for inner_type in inner_condition:
-                    root = get_root(inner_type)
-                    if root is Any:
-                        continue
-
-                    if root is Union:
-                        self.__validate_union(
-                            parameter=parameter,
-                            condition=inner_type,
-                            entity_or_type="type",
-                        )
-                        continue
-
-                    if root is TypeVar:
-                        if inner_type in self.type_var_registry:
-                            self.__validate_type(
-                                parameter=parameter,
-                                condition=self.type_var_registry[inner_type],
-                            )
-                            inner_type = self.type_var_registry[inner_type]
-
-                        else:
-                            self.type_var_registry[inner_type] = parameter.value
-                            continue
-
-                    if not issubclass(parameter.value, inner_type):
-                        self.__add_violation(
-                            expected=inner_condition,
-                            got=type(parameter.value),
-                            parameter_name=parameter.name,
-                            category="type of argument",
-                        )
+        if root is ForwardRef:
+            self.__validate_subclass(
+                parameter=parameter,
+                condition=resolve_forward_ref(condition, self.func),
+            )
+            return
+
+        target = condition if isinstance(condition, type) else root
+        if not isinstance(target, type):
+            return
+
+        if not cached_issubclass(parameter.value, target):
+            self.__add_violation(
+                expected=condition,
+                got=parameter.value,
+                parameter=parameter,
+                category="argument",
+            )
+
+    # The validation method of each root of an annotation (other roots are
+    # validated as primitive types), built once with the class.
+    _validation_methods = {
+        Annotated: __validate_annotated,
+        Any: __validate_any,
+        ForwardRef: __validate_forward_ref,
+        Union: __validate_union,
+        Literal: __validate_literal,
+        Callable: __validate_callable,
+        Iterable: __validate_iterable,
+        Collection: __validate_abstract_collection,
+        Sequence: __validate_abstract_collection,
+        MutableSequence: __validate_abstract_collection,
+        AbstractSet: __validate_abstract_collection,
+        MutableSet: __validate_abstract_collection,
+        Container: __validate_container,
+        Mapping: __validate_abstract_mapping,
+        MutableMapping: __validate_abstract_mapping,
+        TypedDict: __validate_typed_dict,
+        TypeVar: __validate_type_var,
+        type: __validate_type,
+        dict: __validate_dict,
+        list: __validate_list,
+        set: __validate_set,
+        frozenset: __validate_frozenset,
+        tuple: __validate_tuple,
+    }
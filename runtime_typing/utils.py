@@ -1,30 +1,140 @@
+import collections.abc
 import sys
+import typing
 
+from abc import ABCMeta, get_cache_token
+from array import array
 from collections import namedtuple
-from inspect import isfunction, isclass, getmembers
+from inspect import isfunction, isclass, getmembers, signature
+from weakref import WeakKeyDictionary
 from functools import wraps
 from typing import (
     get_args,
+    get_type_hints,
+    Callable,
+    Dict,
+    ForwardRef,
     get_origin,
     Any,
     _GenericAlias,
     Iterable,
+    Iterator,
     Literal,
+    Optional,
     Set,
     Union,
     TypedDict,
     TypeVar,
 )
 
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+else:
+    # `typing.Annotated` is new in Python 3.9: no annotation has it as root.
+    Annotated = object()
 
-Parameter = namedtuple("Parameter", "value name")
+
+Parameter = namedtuple(
+    "Parameter", "value name parent kind", defaults=(None, "item")
+)
+Parameter.__doc__ = """Entity to be validated, together with its location.
+
+`name` is the name of the function parameter (if `parent` is `None`), or the
+key or index of `value` within the value of `parent`. If `kind` is `"key"`, the
+entity is the key `name` itself, rather than the value stored under it; if it
+is `"value"`, the entity is the value stored under the key `name` of a mapping
+(rather than an index, a field or a key of a `TypedDict`). The human-readable
+name and the structured path of the entity are only built by `parameter_name`
+and `parameter_path`, when a violation occurs."""
+
+
+def parameter_path(parameter: "Parameter") -> tuple:
+    """Path of the parameter, from the function parameter to the entity.
+
+    Keys and indices are the segments of the path. A segment referring to the
+    key of a mapping itself (rather than the value stored under it) is wrapped
+    into a 1-tuple.
+    """
+    path = []
+    while parameter is not None:
+        segment = parameter.name
+        path.append((segment,) if parameter.kind == "key" else segment)
+        parameter = parameter.parent
+
+    return tuple(reversed(path))
+
+
+def parameter_pattern(parameter: "Parameter") -> tuple:
+    """Path of the parameter with the data-dependent segments replaced:
+    indices by `'[*]'`, keys of mappings by `'[key]'` (wrapped into a 1-tuple
+    for the key itself, as in `parameter_path`).
+
+    Violations at different indices or keys of the same parameter have the
+    same pattern, so they can be recognized as repetitions.
+    """
+    pattern = []
+    while parameter is not None:
+        segment = parameter.name
+        if parameter.parent is not None:
+            if parameter.kind == "key":
+                segment = ("[key]",)
+            elif parameter.kind == "value":
+                segment = "[key]"
+            elif isinstance(segment, int):
+                segment = "[*]"
+        pattern.append(segment)
+        parameter = parameter.parent
+
+    return tuple(reversed(pattern))
+
+
+def parameter_name(parameter: "Parameter") -> str:
+    """Human-readable name of the entity, e.g. `x['children'][3]`."""
+    if parameter.parent is None:
+        return parameter.name
+
+    parent_name = parameter_name(parameter.parent)
+    if parameter.kind == "key":
+        return f"key {parameter.name!r} in {parent_name}"
+
+    return f"{parent_name}[{parameter.name!r}]"
+
+
+def detach(parameter: Optional["Parameter"]) -> Optional["Parameter"]:
+    """Copy of the path of parameter, without the values."""
+    if parameter is None:
+        return None
+
+    return Parameter(
+        None, parameter.name, detach(parameter.parent), parameter.kind
+    )
 
 
 def class_decorator(cls, decorator, *args, **kwargs):
-    """Class decorator decorating all methods with decorator."""
+    """Class decorator decorating all methods with decorator.
+
+    Dataclasses and NamedTuples get their fields validated on construction
+    instead (unless violations are to be returned or validated in shadow
+    mode, which does not work for constructors). With the
+    `validate_assignment` option, assignments of annotated attributes are
+    validated, too.
+    """
+    from runtime_typing.attributes import install_validated_setattr
+    from runtime_typing.records import decorate_record_class, is_record_class
+
+    options = signature(decorator).bind(cls, *args, **kwargs).arguments
+    del options[next(iter(options))]
+
+    mode = options.get("mode")
+    if is_record_class(cls) and mode not in ("return", "shadow"):
+        return decorate_record_class(cls, decorator, **options)
+
     for name, method in getmembers(cls, predicate=isfunction):
         setattr(cls, name, decorator(method, *args, **kwargs))
 
+    if options.get("validate_assignment"):
+        install_validated_setattr(cls, **options)
+
     return cls
 
 
@@ -86,6 +196,9 @@ def get_root(annotation: _GenericAlias) -> Union[type, Any, TypeVar]:
     if annotation is Any:
         return Any
 
+    if isinstance(annotation, ForwardRef):
+        return ForwardRef
+
 
 def version_safe_is_typeddict(value: Any) -> bool:
     if sys.version_info < (3, 10):
@@ -97,3 +210,361 @@ def version_safe_is_typeddict(value: Any) -> bool:
 
     # Second check is necessary, is_typeddict(TypedDict) is surprisingly False
     return is_typeddict(value) or value is TypedDict
+
+
+def contains_type_var(annotation: _GenericAlias) -> bool:
+    """Whether `annotation` is or (deeply) contains a TypeVar."""
+    if type(annotation) is TypeVar:
+        return True
+
+    return any(contains_type_var(arg) for arg in get_args(annotation))
+
+
+def contains_forward_ref(annotation: _GenericAlias) -> bool:
+    """Whether `annotation` is or (deeply) contains a forward reference."""
+    if type(annotation) is ForwardRef:
+        return True
+
+    return any(contains_forward_ref(arg) for arg in get_args(annotation))
+
+
+def type_vars_of(annotation: _GenericAlias) -> Iterator[TypeVar]:
+    """The TypeVars `annotation` is or (deeply) contains, in order."""
+    if type(annotation) is TypeVar:
+        yield annotation
+        return
+
+    for arg in get_args(annotation):
+        yield from type_vars_of(arg)
+
+
+def annotated_of(annotation: _GenericAlias) -> Iterator[_GenericAlias]:
+    """The `Annotated` annotations `annotation` is or (deeply) contains."""
+    if get_root(annotation) is Annotated:
+        yield annotation
+
+    for arg in get_args(annotation):
+        yield from annotated_of(arg)
+
+
+CONTAINER_COST = 100
+
+_container_roots = {
+    list,
+    set,
+    frozenset,
+    dict,
+    collections.abc.Iterable,
+    collections.abc.Collection,
+    collections.abc.Container,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+}
+
+
+def annotation_cost(annotation: Any) -> int:
+    """Static estimate of the cost of validating a value against `annotation`.
+
+    Checks of plain classes, literals and TypeVars cost 1. Walking the elements of a container is assumed to be `CONTAINER_COST` times as expensive as the check of one element, and so are forward references (which are often recursive).
+    """
+    root = get_root(annotation)
+    args = get_args(annotation)
+
+    if root is None or root is Any or root is TypeVar or root is Literal:
+        return 1
+
+    if root is ForwardRef:
+        return CONTAINER_COST
+
+    if root is Union:
+        return sum(annotation_cost(arg) for arg in args)
+
+    if root is Annotated:
+        return annotation_cost(args[0]) + len(args) - 1
+
+    if root is TypedDict:
+        return 1 + sum(
+            annotation_cost(hint) for hint in cached_type_hints(annotation).values()
+        )
+
+    if root is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        return 1 + sum(annotation_cost(arg) for arg in args)
+
+    if root is tuple or root in _container_roots:
+        return CONTAINER_COST * (
+            1 + sum(annotation_cost(arg) for arg in args if arg is not Ellipsis)
+        )
+
+    return 1 + len(args)
+
+
+_resolved_forward_refs: Dict[tuple, Any] = {}
+
+
+def resolve_forward_ref(reference: ForwardRef, func: Callable) -> Any:
+    """Evaluate the forward reference in the module of `func`, once.
+
+    The evaluation is cached per namespace it is evaluated in, so recursive
+    type aliases (like `JSON = Union[str, List["JSON"]]`) are evaluated only
+    once, no matter how deeply values are nested. If the reference refers to a
+    name which is not defined (yet), nothing is cached, and a
+    `runtime_typing.RuntimeTypingNameError` is raised.
+    """
+    # `ForwardRef.__forward_module__` is new in Python 3.9.7.
+    forward_module = getattr(reference, "__forward_module__", None)
+    globalns = getattr(func, "__globals__", None)
+    if globalns is None or forward_module is not None:
+        module = forward_module or getattr(func, "__module__", None)
+        globalns = vars(sys.modules[module]) if module in sys.modules else {}
+
+    # the namespace is kept with the result, so that its `id` is not reused
+    key = (id(globalns), reference.__forward_arg__)
+    try:
+        namespace, resolved = _resolved_forward_refs[key]
+        if namespace is globalns:
+            return resolved
+    except KeyError:
+        pass
+
+    try:
+        resolved = eval(reference.__forward_arg__, globalns)
+    except NameError as error:
+        from runtime_typing.violations import RuntimeTypingNameError
+
+        raise RuntimeTypingNameError(
+            f"Could not resolve the forward reference "
+            f"`{reference.__forward_arg__}` in `"
+            f"{getattr(func, '__qualname__', func)}`: {error}. Names used in "
+            f"annotations must be defined (or imported) in the module of `"
+            f"{getattr(func, '__qualname__', func)}` before it is called."
+        ) from error
+
+    _resolved_forward_refs[key] = (globalns, resolved)
+
+    return resolved
+
+
+_type_hints: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+def cached_type_hints(obj: Any) -> Dict[str, Any]:
+    """`typing.get_type_hints(obj)`, evaluated on first use and then cached.
+
+    String annotations (and annotations under `from __future__ import
+    annotations`) are evaluated only once per object, rather than on every
+    call. If an annotation refers to a name which is not defined (yet), nothing
+    is cached, so that the evaluation is retried on the next use, and a
+    `runtime_typing.RuntimeTypingNameError` is raised.
+    """
+    try:
+        return _type_hints[obj]
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        if sys.version_info >= (3, 9):
+            hints = get_type_hints(obj, include_extras=True)
+        else:
+            hints = get_type_hints(obj)
+    except NameError as error:
+        from runtime_typing.violations import RuntimeTypingNameError
+
+        raise RuntimeTypingNameError(
+            f"Could not resolve the type annotations of "
+            f"`{getattr(obj, '__qualname__', obj)}`: {error}. Names used in "
+            f"annotations must be defined (or imported) in the module of "
+            f"`{getattr(obj, '__qualname__', obj)}` before it is called."
+        ) from error
+
+    try:
+        _type_hints[obj] = hints
+    except TypeError:
+        pass
+
+    return hints
+
+
+_array_element_types = {
+    **dict.fromkeys("bBhHiIlLqQ", int),
+    **dict.fromkeys("fd", float),
+    **dict.fromkeys("uw", str),
+}
+
+
+def homogeneous_element_type(value: Any) -> Optional[type]:
+    """The type of all elements of `value`, if it is known without iterating.
+
+    This is the case for (non-empty) `range`, `bytes`, `bytearray` and
+    `array.array` objects. For all other values, `None` is returned.
+    """
+    value_type = type(value)
+
+    if value_type is range or value_type is bytes or value_type is bytearray:
+        return int if value else None
+
+    if value_type is array:
+        return _array_element_types.get(value.typecode) if value else None
+
+    return None
+
+
+MAX_CACHED_VERDICTS = 4096
+
+_verdicts: Dict[tuple, bool] = {}
+_verdicts_token = get_cache_token()
+_cacheable: Dict[type, bool] = {}
+
+
+def protocol_attributes(protocol: type) -> Iterable[str]:
+    attributes = getattr(protocol, "__protocol_attrs__", None)
+    if attributes is None:
+        attributes = typing._get_protocol_attrs(protocol)
+
+    return attributes
+
+
+def verdicts_cacheable(cls: Any) -> bool:
+    """Whether `isinstance(value, cls)` only depends on the type of `value`.
+
+    This is the case for ABCs (e.g. `collections.abc.Iterable`) and for
+    protocols consisting of methods only. Protocols with data members are
+    checked against the attributes of each instance, so they are not cached.
+    """
+    try:
+        return _cacheable[cls]
+    except KeyError:
+        pass
+
+    metaclass = type(cls)
+    if getattr(cls, "_is_protocol", False):
+        cacheable = all(
+            callable(getattr(cls, attribute, None))
+            for attribute in protocol_attributes(cls)
+        )
+    else:
+        cacheable = (
+            isinstance(cls, ABCMeta)
+            and metaclass.__instancecheck__ is ABCMeta.__instancecheck__
+        )
+
+    _cacheable[cls] = cacheable
+
+    return cacheable
+
+
+def cached_isinstance(value: Any, cls: Any) -> bool:
+    """`isinstance(value, cls)`, cached per type of `value` for ABCs and
+    protocols.
+
+    Structural checks of ABCs (`__subclasshook__`) and runtime-checkable
+    protocols are expensive. Their verdicts are cached per (type of value,
+    cls). The cache is invalidated when a class is registered with an ABC
+    (`ABC.register`), and it is cleared when it grows too big. Values whose
+    `__class__` is not their type (proxies) are not cached.
+    """
+    global _verdicts_token
+
+    if type(cls) is type:
+        return isinstance(value, cls)
+
+    token = get_cache_token()
+    if token != _verdicts_token:
+        _verdicts.clear()
+        _verdicts_token = token
+
+    value_type = type(value)
+    if value.__class__ is not value_type:
+        # `isinstance` sees the `__class__` of proxies (e.g. exemplars)
+        return isinstance(value, cls)
+
+    key = (value_type, cls)
+    try:
+        return _verdicts[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return isinstance(value, cls)
+
+    verdict = isinstance(value, cls)
+
+    if verdicts_cacheable(cls):
+        if len(_verdicts) >= MAX_CACHED_VERDICTS:
+            _verdicts.clear()
+        _verdicts[key] = verdict
+
+    return verdict
+
+
+_subclass_verdicts: "WeakKeyDictionary" = WeakKeyDictionary()
+_subclass_verdicts_token = get_cache_token()
+
+
+def subclass_verdicts_cacheable(target: Any) -> bool:
+    """Whether `issubclass(cls, target)` only depends on `cls` and `target`
+    (which is not the case for metaclasses overriding `__subclasscheck__`)."""
+    subclass_check = type(target).__subclasscheck__
+    if getattr(target, "_is_protocol", False):
+        return verdicts_cacheable(target)
+
+    return subclass_check in (type.__subclasscheck__, ABCMeta.__subclasscheck__)
+
+
+def structural_issubclass(cls: type, target: Any) -> bool:
+    """Whether `cls` has all attributes of the protocol `target`, as class
+    attributes or as annotated (instance) attributes. Targets which are not
+    protocols are not satisfied."""
+    if not getattr(target, "_is_protocol", False):
+        return False
+
+    annotated = {
+        name
+        for base in getattr(cls, "__mro__", (cls,))
+        for name in vars(base).get("__annotations__", {})
+    }
+
+    return all(
+        hasattr(cls, attribute) or attribute in annotated
+        for attribute in protocol_attributes(target)
+    )
+
+
+def cached_issubclass(cls: type, target: Any) -> bool:
+    """`issubclass(cls, target)`, cached per (`cls`, `target`).
+
+    `cls` can be any class, including classes with ABCMeta or custom metaclasses. The cache is weakly keyed by `cls`, so classes which are created dynamically (e.g. by a plugin registry) are not kept alive by the cache. It is invalidated when a class is registered with an ABC. Classes which `issubclass` can not check against `target` (e.g. against a protocol with data members) are checked by `structural_issubclass`, uncached.
+    """
+    global _subclass_verdicts_token
+
+    if type(target) is type:
+        return issubclass(cls, target)
+
+    token = get_cache_token()
+    if token != _subclass_verdicts_token:
+        _subclass_verdicts.clear()
+        _subclass_verdicts_token = token
+
+    try:
+        verdicts = _subclass_verdicts.get(cls)
+        if verdicts is None:
+            verdicts = _subclass_verdicts[cls] = {}
+        return verdicts[target]
+    except KeyError:
+        pass
+    except TypeError:
+        verdicts = None
+
+    try:
+        verdict = issubclass(cls, target)
+    except TypeError:
+        return structural_issubclass(cls, target)
+
+    if verdicts is not None and subclass_verdicts_cacheable(target):
+        if len(verdicts) >= MAX_CACHED_VERDICTS:
+            verdicts.clear()
+        verdicts[target] = verdict
+
+    return verdict
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
 from contextlib import suppress
-from typing import Any, List, Literal, Optional
+import json
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 from warnings import warn
 
+if TYPE_CHECKING:
+    from runtime_typing.sinks import ViolationSink
+
 
 class RuntimeTypingError(Exception):
     pass
@@ -12,15 +17,27 @@ class RuntimeTypingWarning(Warning):
     pass
 
 
-HandleViolationMode = Literal["raise", "warn", "return"]
+class RuntimeTypingNameError(NameError):
+    """A type annotation refers to a name which can not be resolved."""
+
+    pass
+
+
+HandleViolationMode = Literal["raise", "warn", "return", "sink"]
 
 
 class RuntimeTypingViolationBase(ABC):
     """Abstract Base Class of Violations of Typing Constraints."""
 
-    def __init__(self, mode: "HandleViolationMode", defer: bool):
+    def __init__(
+        self,
+        mode: "HandleViolationMode",
+        defer: bool,
+        sink: Optional["ViolationSink"] = None,
+    ):
         self._mode = mode
         self._defer = defer
+        self._sink = sink
         if not defer:
             self.handle()
 
@@ -37,7 +54,11 @@ class RuntimeTypingViolationBase(ABC):
     def __repr__(self):
         return self.message
 
-    def handle(self, mode: Optional[Literal["raise", "warn", "return"]] = None):
+    def handle(
+        self,
+        mode: Optional["HandleViolationMode"] = None,
+        sink: Optional["ViolationSink"] = None,
+    ):
         """Handle the violation (i.e. raise, warn or return it).
 
         Parameters
@@ -45,11 +66,20 @@ class RuntimeTypingViolationBase(ABC):
 
         mode
             How to handle the violation. If set, overrides the `mode` attribute of the violation.
+
+        sink
+            `runtime_typing.ViolationSink` the violation is emitted to, before it is raised, warned or returned. If set, overrides the sink the violation has been created with.
         """
         mode = mode or self._mode
+        sink = sink or self._sink
+
+        if sink is not None:
+            sink.emit(self)
 
         if mode == "raise":
-            raise RuntimeTypingError(self.message)
+            error = RuntimeTypingError(self.message)
+            error.violation = self
+            raise error
 
         if mode == "warn":
             warn(self.message, RuntimeTypingWarning)
@@ -61,6 +91,14 @@ class RuntimeTypingViolationBase(ABC):
     def message(self) -> str:
         pass
 
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable representation of the violation."""
+        pass
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
 
 class ComplexRuntimeTypingViolation(RuntimeTypingViolationBase):
     """Container of multiple TypingViolations.
@@ -84,15 +122,16 @@ class ComplexRuntimeTypingViolation(RuntimeTypingViolationBase):
         mode: "HandleViolationMode" = "raise",
         defer: bool = False,
         conjunction: Literal["and", "or"] = "or",
+        sink: Optional["ViolationSink"] = None,
     ):
         self.violations = violations
         self.conjunction = conjunction
 
-        super().__init__(mode=mode, defer=defer)
+        super().__init__(mode=mode, defer=defer, sink=sink)
 
     @property
     def message(self) -> str:
-        with suppress(KeyError):
+        with suppress(KeyError, AttributeError):
             if self.conjunction == "or":
                 obj = self.violations[0].obj
                 category = self.violations[0].category
@@ -112,6 +151,15 @@ class ComplexRuntimeTypingViolation(RuntimeTypingViolationBase):
 
         return f"TypingViolation:\n\t{violations_messages}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "message": self.message,
+            "conjunction": self.conjunction,
+            "violations": [
+                violation.to_dict() for violation in self.violations
+            ],
+        }
+
     def __add__(
         self, other: Optional["RuntimeTypingViolationBase"] = None
     ) -> "ComplexRuntimeTypingViolation":
@@ -138,7 +186,13 @@ class RuntimeTypingViolation(RuntimeTypingViolationBase):
         The object the violation occurred on.
 
     parameter_name
-        The name of the parameter the violation occurred on.
+        The human-readable name of the entity the violation occurred on, e.g. `x['children'][3]`.
+
+    path
+        The location of the entity the violation occurred on: The name of the parameter, followed by the keys and indices leading to the entity. A key of a mapping itself (rather than the value stored under it) is represented as 1-tuple.
+
+    pattern
+        The path with indices replaced by `'[*]'` and keys of mappings by `'[key]'`, which is the same for violations of the same parameter at different positions.
 
     expected
         The expected value (or type) of the parameter.
@@ -159,13 +213,18 @@ class RuntimeTypingViolation(RuntimeTypingViolationBase):
         got: Any,
         mode: HandleViolationMode = "raise",
         defer: bool = False,
+        sink: Optional["ViolationSink"] = None,
+        path: Optional[Tuple[Any, ...]] = None,
+        pattern: Optional[Tuple[Any, ...]] = None,
     ) -> None:
         self.obj = obj
         self.category = category
         self.parameter_name = parameter_name
+        self.path = path if path is not None else (parameter_name,)
+        self.pattern = pattern if pattern is not None else self.path
         self.expected = expected
         self.got = got
-        super().__init__(mode=mode, defer=defer)
+        super().__init__(mode=mode, defer=defer, sink=sink)
 
     def __add__(
         self, other: Optional["RuntimeTypingViolationBase"]
@@ -193,3 +252,41 @@ class RuntimeTypingViolation(RuntimeTypingViolationBase):
             f"{self.category + ' ' if self.category else ''}`{self.parameter_name}` to "
             f"be {expected} (got `{self.got}`)."
         )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "message": self.message,
+            "function": qualified_name(self.obj),
+            "category": self.category,
+            "parameter": self.path[0],
+            "path": [json_segment(segment) for segment in self.path],
+            "expected": json_value(self.expected),
+            "got": json_value(self.got),
+        }
+
+
+def qualified_name(obj: Any) -> Optional[str]:
+    if obj is None:
+        return None
+
+    module = getattr(obj, "__module__", None)
+    name = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", "")
+
+    return f"{module}.{name}" if module and module != "builtins" else name
+
+
+def json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, type):
+        return qualified_name(value)
+
+    return repr(value)
+
+
+def json_segment(segment: Any) -> Any:
+    if isinstance(segment, tuple):
+        return {"key": json_value(segment[0])}
+
+    return json_value(segment)
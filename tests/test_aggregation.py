@@ -0,0 +1,137 @@
+import time
+import warnings
+
+from unittest import TestCase
+
+from typing import Dict, List
+
+from runtime_typing import typed, RuntimeTypingWarning, WarningAggregator
+from runtime_typing.aggregation import (
+    _flush_at_exit,
+    default_warning_aggregator,
+)
+
+
+aggregator = WarningAggregator(interval=3600, max_keys=2)
+
+
+@typed(mode="aggregate", sink=aggregator)
+def expect_int_aggregate_mode(a: int):
+    return a
+
+
+containers = WarningAggregator(interval=3600)
+
+
+@typed(mode="aggregate", sink=containers)
+def expect_containers_aggregate_mode(a: List[int], b: Dict[str, int]):
+    return a, b
+
+
+@typed(mode="aggregate")
+def expect_str_aggregate_mode(a: str):
+    return a
+
+
+class TestAggregation(TestCase):
+    def setUp(self):
+        aggregator.flush()
+
+    def tearDown(self):
+        # nothing is left pending, to be summarized when the interpreter exits
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            for sink in (aggregator, containers, default_warning_aggregator):
+                sink.flush()
+
+    def test_first_occurrence_is_warned_immediately(self):
+        with self.assertWarns(RuntimeTypingWarning):
+            expect_str_aggregate_mode(1)
+
+    def test_repetitions_are_summarized(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+
+            self.assertEqual(expect_int_aggregate_mode(1.0), 1.0)
+            for _ in range(4):
+                expect_int_aggregate_mode(2.0)
+            expect_int_aggregate_mode("not an int")
+
+        self.assertEqual(len(caught), 2)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            aggregator.flush()
+
+        self.assertEqual(len(caught), 1)
+        self.assertIn("4x TypingViolation", str(caught[0].message))
+
+    def test_table_is_bounded(self):
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            for value in (1.0, 1.0, "s", "s", None, b""):
+                expect_int_aggregate_mode(value)
+
+            self.assertEqual(len(aggregator._table), 2)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            aggregator.flush()
+
+        self.assertIn("(evicted violations)", str(caught[0].message))
+
+    def test_warning_registry_does_not_grow(self):
+        registry = globals().setdefault("__warningregistry__", {})
+        size = len(registry)
+
+        with warnings.catch_warnings(record=True):
+            for value in range(10):
+                expect_str_aggregate_mode(value)
+
+        self.assertEqual(len(registry), size)
+
+    def test_paths_are_normalized(self):
+        containers.flush()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for i in range(50):
+                values = [0] * 50
+                values[i] = "not an int"
+                expect_containers_aggregate_mode(values, {})
+                expect_containers_aggregate_mode([], {str(i): "not an int"})
+
+            containers.flush()
+
+        self.assertEqual(len(caught), 3)
+        self.assertEqual(len(containers._table), 2)
+        self.assertIn("49x", str(caught[-1].message))
+
+    def test_pending_repetitions_are_flushed_at_exit(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            expect_containers_aggregate_mode([], {"a": 1.0})
+            expect_containers_aggregate_mode([], {"a": 1.0})
+            _flush_at_exit()
+
+        self.assertIn("1x TypingViolation", str(caught[-1].message))
+
+    def test_pending_repetitions_are_flushed_when_quiet(self):
+        quiet = WarningAggregator(interval=0.01)
+
+        @typed(mode="aggregate", sink=quiet)
+        def expect_int(a: int):
+            return a
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            expect_int(1.0)
+            time.sleep(0.02)
+            expect_int(1.0)
+            expect_int(1.0)
+            for _ in range(100):
+                if len(caught) == 3:
+                    break
+                time.sleep(0.01)
+
+        self.assertEqual(len(caught), 3)
+        self.assertIn("1x TypingViolation", str(caught[-1].message))
@@ -0,0 +1,96 @@
+from functools import wraps
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError
+
+
+@typed
+def positional_only(a: int, b: str = "b", /, c: float = 1.0):
+    return a, b, c
+
+
+@typed
+def variadic(first: int, *args: int, flag: bool = False, **kwargs: str):
+    return first, args, flag, kwargs
+
+
+@typed
+def keyword_catch_all(a: int, /, **kwargs: int):
+    return a, kwargs
+
+
+@typed(mode="return")
+def lenient_variadic(*args: int, **kwargs: str) -> None:
+    pass
+
+
+def passthrough(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@typed
+@passthrough
+def wrapped(x: int, y: str = "y") -> int:
+    return x
+
+
+class TestArgumentBinding(TestCase):
+    def test_positional_only(self):
+        self.assertEqual(positional_only(1), (1, "b", 1.0))
+        self.assertEqual(positional_only(1, "x", c=2.0), (1, "x", 2.0))
+        with self.assertRaises(RuntimeTypingError):
+            positional_only("1")
+        with self.assertRaises(RuntimeTypingError):
+            positional_only(1, 2)
+
+    def test_positional_only_passed_by_keyword(self):
+        with self.assertRaises(TypeError):
+            positional_only(a=1)
+        with self.assertRaises(TypeError) as context:
+            positional_only(1, a="not an int")
+        self.assertNotIsInstance(context.exception, RuntimeTypingError)
+
+    def test_wrapped_function(self):
+        self.assertEqual(wrapped(1), 1)
+        with self.assertRaises(RuntimeTypingError):
+            wrapped("a")
+        with self.assertRaises(RuntimeTypingError):
+            wrapped(1, y=2)
+
+    def test_positional_only_name_in_var_keyword(self):
+        self.assertEqual(keyword_catch_all(1, a=2), (1, {"a": 2}))
+        with self.assertRaises(RuntimeTypingError):
+            keyword_catch_all(1, a="2")
+
+    def test_variadic_arguments_are_passed_unchanged(self):
+        self.assertEqual(
+            variadic(1, 2, 3, flag=True, name="x"),
+            (1, (2, 3), True, {"name": "x"}),
+        )
+        self.assertEqual(variadic(1), (1, (), False, {}))
+
+    def test_variadic_arguments_are_validated(self):
+        with self.assertRaises(RuntimeTypingError):
+            variadic(1, 2, "3")
+        with self.assertRaises(RuntimeTypingError):
+            variadic(1, name=2)
+        with self.assertRaises(RuntimeTypingError):
+            variadic(1, flag="yes")
+
+    def test_paths_of_variadic_arguments(self):
+        _, (args_violation, kwargs_violation) = lenient_variadic(
+            1, "2", name=3
+        )
+        self.assertEqual(args_violation.path, ("args", 1))
+        self.assertEqual(
+            kwargs_violation.violations[0].path, ("kwargs", "name")
+        )
+
+    def test_missing_argument_raises_type_error_of_call(self):
+        with self.assertRaises(TypeError) as context:
+            variadic()
+        self.assertNotIsInstance(context.exception, RuntimeTypingError)
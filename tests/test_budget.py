@@ -0,0 +1,97 @@
+from typing import Dict, List
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import typed, request_budget, Budget, RuntimeTypingError
+
+
+budget = Budget(max_elements=10)
+
+
+@typed(budget=budget)
+def expect_ints(values: List[int]):
+    pass
+
+
+@typed(budget=Budget(max_elements=5))
+def expect_mapping(mapping: Dict[str, int]):
+    pass
+
+
+@typed
+def expect_list(values: List[int]):
+    pass
+
+
+@typed(budget=Budget(max_time=5_000))
+def slow(values: List[int]) -> int:
+    sleep(0.02)
+    return "not an int"
+
+
+class TestBudget(TestCase):
+    def setUp(self):
+        budget.skipped = budget.exhaustions = 0
+
+    def test_values_within_budget_are_validated(self):
+        with self.assertRaises(RuntimeTypingError):
+            expect_ints([1, 2, "3"])
+        expect_ints(list(range(9)))
+        self.assertEqual(budget.skipped, 0)
+
+    def test_remaining_values_are_skipped(self):
+        # the argument itself and 9 elements are visited
+        expect_ints(list(range(20)) + ["not an int"])
+        self.assertEqual(budget.skipped, 12)
+        self.assertEqual(budget.exhaustions, 1)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_ints([1, "2"] + list(range(20)))
+
+    def test_budget_is_fresh_for_every_call(self):
+        expect_ints(list(range(20)))
+        with self.assertRaises(RuntimeTypingError):
+            expect_ints(["1"])
+
+    def test_mapping(self):
+        expect_mapping({**{str(i): i for i in range(3)}, "x": "y"})
+
+    def test_time_budget(self):
+        time_budget = Budget(max_time=100)
+        call_budget = time_budget.for_call()
+        self.assertTrue(call_budget.spend())
+        with patch("runtime_typing.budget.perf_counter", return_value=1e9):
+            for _ in range(Budget.TIME_CHECK_INTERVAL):
+                call_budget.spend()
+        self.assertFalse(call_budget.spend())
+        self.assertEqual(time_budget.skipped, 2)
+
+    def test_time_of_the_function_is_not_spent(self):
+        with self.assertRaises(RuntimeTypingError):
+            slow(list(range(100)))
+
+    def test_time_outside_of_typed_calls_is_not_spent(self):
+        with request_budget(max_time=5_000) as request:
+            expect_list(list(range(10)))
+            sleep(0.02)
+            with self.assertRaises(RuntimeTypingError):
+                expect_list(list(range(100)) + ["not an int"])
+        self.assertEqual(request.skipped, 0)
+        self.assertLess(request.elapsed(), 0.005)
+
+    def test_request_budget(self):
+        with request_budget(max_elements=15) as request:
+            expect_list(list(range(10)))
+            expect_list(list(range(10)) + ["not an int"])
+        self.assertEqual(request.elements, 16)
+        self.assertEqual(request.skipped, 8)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_list(list(range(10)) + ["not an int"])
+
+    def test_call_budget_spends_request_budget(self):
+        with request_budget(max_elements=5) as request:
+            expect_ints(list(range(8)))
+        self.assertEqual(request.skipped, 4)
+        self.assertEqual(budget.skipped, 4)
@@ -0,0 +1,193 @@
+import copy
+import pickle
+from typing import Dict, List, Set, Tuple, TypeVar
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import (
+    checked,
+    typed,
+    CheckedDict,
+    CheckedList,
+    CheckedSet,
+    RuntimeTypingError,
+    RuntimeTypingWarning,
+)
+from runtime_typing.typed_function import TypedFunction
+
+
+@typed
+def total(values: List[int]) -> int:
+    return sum(values)
+
+
+T = TypeVar("T")
+
+
+@typed
+def total_of_lists(values: List[List[int]]) -> int:
+    return sum(map(sum, values))
+
+
+@typed
+def append(values: List[T], value: T) -> None:
+    values.append(value)
+
+
+@typed
+def names(mapping: Dict[str, int]) -> List[str]:
+    return list(mapping)
+
+
+class TestCheckedContainers(TestCase):
+    def test_initial_data_is_validated(self):
+        self.assertEqual(checked(List[int], [1, 2]), [1, 2])
+        with self.assertRaises(RuntimeTypingError):
+            checked(List[int], [1, "2"])
+
+    def test_list_mutations_are_validated(self):
+        values = checked(List[int], [1])
+        self.assertIsInstance(values, CheckedList)
+        values.append(2)
+        values.extend([3])
+        values.insert(0, 0)
+        values[0] = -1
+        values += [4]
+        self.assertEqual(values, [-1, 1, 2, 3, 4])
+
+        for mutate in (
+            lambda: values.append("a"),
+            lambda: values.extend([5, "a"]),
+            lambda: values.insert(0, "a"),
+            lambda: values.__setitem__(0, "a"),
+            lambda: values.__setitem__(slice(0, 1), ["a"]),
+            lambda: values.__iadd__(["a"]),
+        ):
+            with self.assertRaises(RuntimeTypingError):
+                mutate()
+        self.assertEqual(values, [-1, 1, 2, 3, 4])
+
+    def test_violation_path(self):
+        values = checked(List[int], [1])
+        with self.assertRaises(RuntimeTypingError) as context:
+            values.append("a")
+        self.assertIn("self[1]", str(context.exception))
+
+    def test_set_mutations_are_validated(self):
+        values = checked(Set[str], {"a"})
+        self.assertIsInstance(values, CheckedSet)
+        values.add("b")
+        values |= {"c"}
+        self.assertEqual(values, {"a", "b", "c"})
+        with self.assertRaises(RuntimeTypingError):
+            values.add(1)
+        with self.assertRaises(RuntimeTypingError):
+            values.update({"d", 2})
+        with self.assertRaises(RuntimeTypingError):
+            values ^= {"x", 3}
+        with self.assertRaises(RuntimeTypingError):
+            values.symmetric_difference_update({3})
+        self.assertEqual(values, {"a", "b", "c"})
+        values ^= {"a", "x"}
+        self.assertEqual(values, {"b", "c", "x"})
+
+    def test_dict_mutations_are_validated(self):
+        mapping = checked(Dict[str, int], {"a": 1})
+        self.assertIsInstance(mapping, CheckedDict)
+        mapping["b"] = 2
+        mapping.update(c=3)
+        mapping.setdefault("d", 4)
+        mapping |= {"e": 5}
+        self.assertEqual(mapping, {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5})
+
+        for mutate in (
+            lambda: mapping.__setitem__("f", "6"),
+            lambda: mapping.__setitem__(6, 6),
+            lambda: mapping.update({"f": "6"}),
+            lambda: mapping.setdefault("f", "6"),
+        ):
+            with self.assertRaises(RuntimeTypingError):
+                mutate()
+        self.assertNotIn("f", mapping)
+
+    def test_warn_mode(self):
+        values = checked(List[int], mode="warn")
+        with self.assertWarns(RuntimeTypingWarning):
+            values.append("a")
+        self.assertEqual(values, ["a"])
+
+    def test_tainted_containers_are_walked(self):
+        values = checked(List[int], [1], mode="warn")
+        self.assertTrue(values.satisfies(List[int]))
+        with self.assertWarns(RuntimeTypingWarning):
+            values.append("a")
+        self.assertTrue(values.tainted)
+        self.assertFalse(values.satisfies(List[int]))
+        with self.assertRaises(RuntimeTypingError):
+            total(values)
+
+    def test_construction_and_new_containers(self):
+        values = checked(List[int], [1])
+        with self.assertRaises(RuntimeTypingError):
+            values.__init__(["a"])
+        self.assertEqual(values, [1])
+        self.assertIs(type(values + ["a"]), list)
+        with self.assertRaises(RuntimeTypingError):
+            total(values + ["a"])
+        self.assertEqual(CheckedList([1, 2]), [1, 2])
+        self.assertEqual(CheckedSet({1}), {1})
+        self.assertEqual(CheckedDict({"a": 1}, b=2), {"a": 1, "b": 2})
+
+    def test_mutable_elements_are_walked(self):
+        values = checked(List[List[int]], [[1]])
+        self.assertFalse(values.satisfies(List[List[int]]))
+        values[0].append("x")
+        with self.assertRaises(RuntimeTypingError):
+            total_of_lists(values)
+
+        self.assertTrue(
+            checked(List[Tuple[int, str]]).satisfies(List[Tuple[int, str]])
+        )
+
+    def test_type_vars_are_bound_by_the_elements(self):
+        values = checked(List[T], [1])
+        self.assertFalse(values.satisfies(List[T]))
+        with self.assertRaises(RuntimeTypingError):
+            append(values, "a")
+
+    def test_unsupported_annotation(self):
+        with self.assertRaises(ValueError):
+            checked(int)
+
+    def test_typed_function_skips_elements(self):
+        values = checked(List[int], range(100))
+        mapping = checked(Dict[str, int], {"a": 1})
+        validate_entity = TypedFunction.validate_entity
+        with patch.object(
+            TypedFunction,
+            "validate_entity",
+            autospec=True,
+            side_effect=validate_entity,
+        ) as mock:
+            self.assertEqual(total(values), 4950)
+            self.assertEqual(names(mapping), ["a"])
+        # one call per argument and per return value (`List[str]` is walked)
+        self.assertEqual(mock.call_count, 5)
+
+    def test_incompatible_checked_container_is_walked(self):
+        values = checked(List[object], [1, "a"])
+        with self.assertRaises(RuntimeTypingError):
+            total(values)
+        self.assertEqual(total(checked(List[object], [1, 2])), 3)
+
+    def test_copy_and_pickle(self):
+        values = checked(Dict[str, int], {"a": 1})
+        for duplicate in (
+            copy.copy(values),
+            copy.deepcopy(values),
+            pickle.loads(pickle.dumps(values)),
+        ):
+            self.assertEqual(duplicate, values)
+            self.assertEqual(duplicate.annotation, Dict[str, int])
+            with self.assertRaises(RuntimeTypingError):
+                duplicate["b"] = "2"
@@ -0,0 +1,91 @@
+from typing import Dict, List, TypeVar
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import checked, explain, typed, RuntimeTypingError
+from runtime_typing.typed_function import TypedFunction
+from runtime_typing.utils import annotation_cost, CONTAINER_COST
+
+
+T = TypeVar("T")
+
+
+@typed
+def scale(values: List[int], factor: float) -> List[float]:
+    return [value * factor for value in values]
+
+
+@typed
+def first(values: List[T], default: T) -> T:
+    return values[0] if values else default
+
+
+class TestAnnotationCost(TestCase):
+    def test_classes_are_cheaper_than_containers(self):
+        self.assertEqual(annotation_cost(int), 1)
+        self.assertEqual(annotation_cost(List[int]), 2 * CONTAINER_COST)
+        self.assertGreater(
+            annotation_cost(Dict[str, List[int]]), annotation_cost(List[int])
+        )
+
+
+class TestExplain(TestCase):
+    def test_static_plan(self):
+        explanation = explain(scale)
+        self.assertTrue(explanation.cost_ordered)
+        self.assertEqual(
+            [parameter.name for parameter in explanation.parameters],
+            ["factor", "values", "return"],
+        )
+        factor = explanation.parameters[0]
+        self.assertEqual(factor.cost, 1)
+        self.assertEqual(factor.nodes, 1)
+        self.assertIsNone(factor.elements)
+        self.assertEqual(factor.fast_paths, ())
+
+    def test_example_arguments(self):
+        explanation = explain(scale, [1, 2, "3"], factor=2.0)
+        factor, values, _ = explanation.parameters
+        self.assertEqual((factor.elements, factor.violations), (1, 0))
+        self.assertEqual((values.elements, values.violations), (4, 1))
+
+    def test_fast_paths(self):
+        values = explain(scale, range(10), 2.0).parameters[1]
+        self.assertEqual(values.elements, 1)
+        self.assertEqual(values.fast_paths, ("homogeneous range",))
+
+        values = explain(scale, checked(List[int], [1, 2]), 2.0).parameters[1]
+        self.assertIn("checked container", values.fast_paths)
+
+    def test_function_is_not_called(self):
+        with patch.object(TypedFunction, "call_function") as call_function:
+            explain(scale, [1], 2.0)
+        call_function.assert_not_called()
+
+    def test_type_vars_keep_signature_order(self):
+        explanation = explain(first)
+        self.assertFalse(explanation.cost_ordered)
+        self.assertEqual(
+            [parameter.name for parameter in explanation.parameters],
+            ["values", "default", "return"],
+        )
+
+    def test_str(self):
+        lines = str(explain(scale, [1], 2.0)).splitlines()
+        self.assertIn("validated in order of cost", lines[0])
+        self.assertEqual(lines[1].split()[:3], ["parameter", "annotation", "cost"])
+        self.assertEqual(lines[2].split()[0], "factor")
+
+
+class TestCostOrdering(TestCase):
+    def test_cheap_violation_is_raised_before_container_walk(self):
+        values = list(range(1000))
+        with patch.object(
+            TypedFunction, "validate_entity", autospec=True,
+            side_effect=TypedFunction.validate_entity,
+        ) as validate_entity:
+            with self.assertRaises(RuntimeTypingError) as context:
+                scale(values, "not a float")
+
+        self.assertIn("factor", str(context.exception))
+        self.assertEqual(validate_entity.call_count, 1)
@@ -0,0 +1,111 @@
+import gc
+
+from typing import Generic, List, TypeVar
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError
+from runtime_typing import generics
+
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+@typed
+class Buffer(Generic[T]):
+    def __init__(self) -> None:
+        self.items: List[T] = []
+
+    def push(self, item: T) -> None:
+        self.items.append(item)
+
+    def pop(self) -> T:
+        return self.items.pop()
+
+    def replace(self, old: T, new: T) -> None:
+        self.items[self.items.index(old)] = new
+
+    def convert(self, item: T, target: S) -> S:
+        return target
+
+
+@typed
+def describe(buffer: Buffer, label: T) -> T:
+    return label
+
+
+class SubBuffer(Buffer[T]):
+    pass
+
+
+class SlottedBuffer(Generic[T]):
+    __slots__ = ("items",)
+
+    def __init__(self) -> None:
+        self.items = []
+
+    @typed
+    def push(self, item: T) -> None:
+        self.items.append(item)
+
+
+class TestGenericClasses(TestCase):
+    def test_free_functions_do_not_bind_instances(self):
+        buffer = Buffer()
+        describe(buffer, 1)
+        buffer.push("s")
+        with self.assertRaises(RuntimeTypingError):
+            buffer.push(1)
+
+    def test_inherited_methods_bind_instances(self):
+        buffer = SubBuffer()
+        buffer.push(1)
+        with self.assertRaises(RuntimeTypingError):
+            buffer.push("s")
+
+    def test_binding_from_orig_class(self):
+        buffer = Buffer[int]()
+        buffer.push(1)
+        with self.assertRaises(RuntimeTypingError):
+            buffer.push("1")
+
+    def test_binding_from_first_call(self):
+        buffer = Buffer()
+        buffer.push("a")
+        with self.assertRaises(RuntimeTypingError):
+            buffer.push(1)
+
+        buffer.items.append(1)
+        with self.assertRaises(RuntimeTypingError):
+            buffer.pop()
+
+    def test_instances_are_independent(self):
+        Buffer().push("a")
+        Buffer().push(1)
+
+    def test_method_type_vars_are_not_remembered(self):
+        buffer = Buffer[int]()
+        self.assertEqual(buffer.convert(1, "a"), "a")
+        self.assertEqual(buffer.convert(1, 2), 2)
+        with self.assertRaises(RuntimeTypingError):
+            buffer.convert("1", 2)
+
+    def test_violating_call_does_not_bind(self):
+        buffer = Buffer()
+        with self.assertRaises(RuntimeTypingError):
+            buffer.replace(1, "a")
+        buffer.push("a")
+
+    def test_instances_without_weak_references(self):
+        buffer = SlottedBuffer()
+        buffer.push(1)
+        buffer.push("1")
+
+    def test_bindings_are_released(self):
+        buffer = Buffer[int]()
+        buffer.push(1)
+        key = id(buffer)
+        self.assertIn(key, generics._instances)
+        del buffer
+        gc.collect()
+        self.assertNotIn(key, generics._instances)
@@ -0,0 +1,90 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import (
+    typed,
+    register_hook,
+    unregister_hook,
+    RuntimeTypingError,
+    ValidationHook,
+)
+from runtime_typing import hooks
+
+
+@typed
+def double(x: int) -> int:
+    return 2 * x
+
+
+@typed(mode="return")
+def lenient_double(x: int) -> int:
+    return 2 * x
+
+
+class RecordingHook(ValidationHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_arguments(self, func, kwargs):
+        self.calls.append(("before_arguments", func.__name__, kwargs))
+
+    def after_arguments(self, func, elapsed, violations):
+        self.assert_elapsed(elapsed)
+        self.calls.append(("after_arguments", func.__name__, len(violations)))
+
+    def before_return(self, func, result):
+        self.calls.append(("before_return", func.__name__, result))
+
+    def after_return(self, func, elapsed, violations):
+        self.assert_elapsed(elapsed)
+        self.calls.append(("after_return", func.__name__, len(violations)))
+
+    def assert_elapsed(self, elapsed):
+        assert isinstance(elapsed, int) and elapsed >= 0
+
+
+class TestHooks(TestCase):
+    def setUp(self):
+        self.hook = register_hook(RecordingHook())
+
+    def tearDown(self):
+        unregister_hook(self.hook)
+
+    def test_callbacks(self):
+        self.assertEqual(double(1), 2)
+        self.assertEqual(
+            self.hook.calls,
+            [
+                ("before_arguments", "double", {"x": 1}),
+                ("after_arguments", "double", 0),
+                ("before_return", "double", 2),
+                ("after_return", "double", 0),
+            ],
+        )
+
+    def test_raised_violation_is_reported(self):
+        with self.assertRaises(RuntimeTypingError) as context:
+            double("1")
+        self.assertEqual(
+            self.hook.calls[1:], [("after_arguments", "double", 1)]
+        )
+        self.assertEqual(context.exception.violation.path, ("x",))
+
+    def test_returned_violations_are_reported(self):
+        result, violations = lenient_double(1.5)
+        self.assertEqual((result, len(violations)), (3.0, 2))
+        self.assertEqual(
+            [call for call in self.hook.calls if call[0].startswith("after")],
+            [
+                ("after_arguments", "lenient_double", 1),
+                ("after_return", "lenient_double", 1),
+            ],
+        )
+
+    def test_no_instrumentation_without_hooks(self):
+        unregister_hook(self.hook)
+        self.assertFalse(hooks.active)
+        with patch.object(hooks, "instrumented_call") as instrumented_call:
+            double(1)
+        instrumented_call.assert_not_called()
+        self.assertEqual(self.hook.calls, [])
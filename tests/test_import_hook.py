@@ -0,0 +1,135 @@
+import os
+import sys
+
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase
+
+from runtime_typing import install, uninstall, RuntimeTypingError
+
+
+PACKAGE = "runtime_typing_import_hook_package"
+
+MODULE = dedent(
+    """
+    from dataclasses import dataclass
+    from runtime_typing import typed
+
+
+    def annotated(x: int) -> int:
+        return x
+
+
+    def unannotated(x):
+        return x
+
+
+    @typed(mode="return")
+    def typed_by_hand(x: int) -> int:
+        return x
+
+
+    class Counter:
+        count: int
+
+        def __init__(self):
+            self.count = 0
+
+
+    class Calculator:
+        def double(self, x: int) -> int:
+            return 2 * x
+
+        def untyped(self, x):
+            return x
+
+        @staticmethod
+        def halve(x: int) -> int:
+            return x // 2
+
+
+    @dataclass
+    class Point:
+        x: int
+        y: int
+    """
+)
+
+
+class TestImportHook(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        package = os.path.join(self.directory.name, PACKAGE)
+        os.mkdir(package)
+        for name, source in (
+            ("__init__", ""),
+            ("module", MODULE),
+            ("excluded", MODULE),
+        ):
+            with open(os.path.join(package, f"{name}.py"), "w") as file:
+                file.write(source)
+        sys.path.insert(0, self.directory.name)
+
+    def tearDown(self):
+        uninstall()
+        sys.path.remove(self.directory.name)
+        for name in list(sys.modules):
+            if name.startswith(PACKAGE):
+                del sys.modules[name]
+        self.directory.cleanup()
+
+    def import_module(self, name):
+        __import__(f"{PACKAGE}.{name}")
+        return sys.modules[f"{PACKAGE}.{name}"]
+
+    def test_matching_module_is_typed(self):
+        install(include=[f"{PACKAGE}.*"], exclude=[f"{PACKAGE}.excluded"])
+        module = self.import_module("module")
+
+        with self.assertRaises(RuntimeTypingError):
+            module.annotated("1")
+        with self.assertRaises(RuntimeTypingError):
+            module.Calculator().double("1")
+        with self.assertRaises(RuntimeTypingError):
+            module.Calculator.halve("1")
+        with self.assertRaises(RuntimeTypingError):
+            module.Calculator().halve("1")
+        with self.assertRaises(RuntimeTypingError):
+            module.Point(1, "2")
+
+        self.assertFalse(hasattr(module.unannotated, "__wrapped__"))
+        self.assertFalse(hasattr(module.Calculator.untyped, "__wrapped__"))
+        self.assertEqual(module.typed_by_hand("1")[0], "1")
+
+    def test_excluded_module_is_not_typed(self):
+        install(include=[f"{PACKAGE}.*"], exclude=[f"{PACKAGE}.excluded"])
+        module = self.import_module("excluded")
+        self.assertEqual(module.annotated("1"), "1")
+
+    def test_options(self):
+        install(include=[f"{PACKAGE}.module"], mode="warn", sample=0.0)
+        module = self.import_module("module")
+        self.assertEqual(module.annotated("1"), "1")
+
+    def test_records_in_shadow_mode(self):
+        install(include=[f"{PACKAGE}.module"], mode="shadow")
+        module = self.import_module("module")
+
+        self.assertTrue(hasattr(module.Point.__init__, "__runtime_typing_plan__"))
+        self.assertFalse(
+            hasattr(module.Point.__init__, "__runtime_typing_record_plan__")
+        )
+
+    def test_validate_assignment(self):
+        install(include=[f"{PACKAGE}.module"], validate_assignment=True)
+        module = self.import_module("module")
+
+        counter = module.Counter()
+        with self.assertRaises(RuntimeTypingError):
+            counter.count = "1"
+
+    def test_uninstall(self):
+        finder = install(include=[f"{PACKAGE}.*"])
+        uninstall(finder)
+        module = self.import_module("module")
+        self.assertEqual(module.annotated("1"), "1")
@@ -0,0 +1,181 @@
+import os
+
+from dataclasses import dataclass
+from threading import Thread
+from time import sleep
+from typing import List, Set, TypedDict, TypeVar, Union
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from runtime_typing import parallel, typed, Budget, RuntimeTypingError
+
+
+Record = TypedDict("Record", {"id": int, "name": str})
+
+T = TypeVar("T")
+
+
+@typed(parallel=10)
+def expect_records(records: List[Record]):
+    pass
+
+
+@typed(mode="return", parallel=10)
+def expect_ints_return_mode(ints: List[int]):
+    pass
+
+
+@typed(mode="return", parallel=10)
+def expect_set_of_ints_return_mode(ints: Set[int]):
+    pass
+
+
+@typed(mode="return", parallel=10)
+def expect_list_of_type_var_return_mode(values: List[T]):
+    pass
+
+
+@typed(mode="return", parallel=10)
+def expect_list_of_callables_return_mode(values: List[int]):
+    pass
+
+
+Nested = Union[int, List["Nested"]]
+
+
+@typed(mode="return", parallel=10)
+def expect_nested_return_mode(values: List[Nested]):
+    pass
+
+
+@dataclass
+class Point:
+    x: float
+
+
+class KillsWorker:
+    """Kills the worker process it is unpickled in."""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+@typed(mode="return", parallel=10, validate_fields=True)
+def expect_points_return_mode(points: List[Point]):
+    pass
+
+
+budget = Budget(max_elements=5)
+
+
+@typed(mode="return", parallel=10, budget=budget)
+def expect_ints_with_budget_return_mode(ints: List[int]):
+    pass
+
+
+class TestParallel(TestCase):
+    def test_expect_records(self):
+        records = [{"id": i, "name": str(i)} for i in range(100)]
+        expect_records(records)
+
+        records[57] = {"id": "57", "name": "57"}
+        with self.assertRaises(RuntimeTypingError):
+            expect_records(records)
+
+    def test_violations_in_order_of_elements(self):
+        ints = list(range(100))
+        ints[3] = "3"
+        ints[40] = 40.0
+        ints[99] = None
+
+        _, violations = expect_ints_return_mode(ints)
+
+        self.assertEqual(
+            [violation.got for violation in violations],
+            [str, float, type(None)],
+        )
+        self.assertEqual(
+            [violation.path for violation in violations],
+            [("ints", 3), ("ints", 40), ("ints", 99)],
+        )
+        self.assertTrue(
+            all(v.obj is expect_ints_return_mode.__wrapped__ for v in violations)
+        )
+
+    def test_below_threshold(self):
+        _, violations = expect_ints_return_mode([1, 2, "3"])
+
+        self.assertEqual(len(violations), 1)
+
+    def test_set(self):
+        _, violations = expect_set_of_ints_return_mode(set(range(50)) | {"a"})
+
+        self.assertEqual(len(violations), 1)
+
+    def test_type_var_is_validated_in_process(self):
+        _, violations = expect_list_of_type_var_return_mode(
+            list(range(20)) + ["a"]
+        )
+
+        self.assertEqual(len(violations), 1)
+
+    def test_unpicklable_elements(self):
+        _, violations = expect_list_of_callables_return_mode(
+            [lambda: None] * 20
+        )
+
+        self.assertEqual(len(violations), 20)
+
+    def test_validate_fields(self):
+        points = [Point(1.0)] * 20 + [Point("not a float")]
+
+        _, violations = expect_points_return_mode(points)
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0].path, ("points", 20, "x"))
+
+    def test_budget(self):
+        _, violations = expect_ints_with_budget_return_mode(["a"] * 20)
+
+        self.assertEqual(len(violations), 4)
+        self.assertEqual(budget.skipped, 16)
+
+    def test_broken_pool(self):
+        _, violations = expect_ints_return_mode([KillsWorker()] * 20)
+
+        self.assertEqual(len(violations), 20)
+
+        _, violations = expect_ints_return_mode(list(range(19)) + ["a"])
+
+        self.assertEqual(len(violations), 1)
+
+    def test_forward_references_are_validated_in_process(self):
+        with patch.object(parallel, "get_executor") as get_executor:
+            _, violations = expect_nested_return_mode(
+                [[[[1]]]] * 19 + [[[["a"]]]]
+            )
+
+        get_executor.assert_not_called()
+        self.assertEqual(len(violations), 1)
+
+    def test_executor_is_created_once(self):
+        def slowly_created_executor(max_workers):
+            sleep(0.01)
+            return Mock()
+
+        executors = []
+        with patch.object(parallel, "_executor", None), patch.object(
+            parallel, "gil_enabled", return_value=True
+        ), patch.object(
+            parallel, "ProcessPoolExecutor", side_effect=slowly_created_executor
+        ):
+            threads = [
+                Thread(target=lambda: executors.append(parallel.get_executor()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len({id(executor) for executor in executors}), 1)
@@ -0,0 +1,148 @@
+import importlib
+import os
+import sys
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import (
+    disable_plan_cache,
+    enable_plan_cache,
+    plan_statistics,
+    RuntimeTypingError,
+)
+from runtime_typing.plan import plan_of
+from runtime_typing import plan_cache
+from runtime_typing.plan_cache import save_plan_cache
+
+
+SOURCE = '''
+from typing import List
+
+from runtime_typing import typed
+
+
+@typed
+def expect_list_of_ints(x: "List[int]", y: str = "{default}") -> str:
+    return y
+
+
+@typed
+def expect_later(x: "Later") -> None:
+    pass
+
+
+class Later:
+    pass
+'''
+
+
+class TestPlanCache(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        sys.path.insert(0, self.directory.name)
+        enable_plan_cache(os.path.join(self.directory.name, "cache"))
+
+    def tearDown(self):
+        disable_plan_cache()
+        sys.path.remove(self.directory.name)
+        sys.modules.pop("cached_module", None)
+        self.directory.cleanup()
+
+    def import_module(self, default: str):
+        path = os.path.join(self.directory.name, "cached_module.py")
+        with open(path, "w") as file:
+            file.write(SOURCE.format(default=default))
+
+        sys.modules.pop("cached_module", None)
+        importlib.invalidate_caches()
+
+        return importlib.import_module("cached_module")
+
+    def test_plans_are_loaded_when_decorating(self):
+        module = self.import_module(default="a")
+        self.assertFalse(plan_of(module.expect_list_of_ints).compiled)
+        module.expect_list_of_ints([1])
+        save_plan_cache()
+
+        loaded = plan_statistics()["loaded"]
+        module = self.import_module(default="a")
+
+        self.assertTrue(plan_of(module.expect_list_of_ints).compiled)
+        self.assertEqual(plan_statistics()["loaded"], loaded + 1)
+        self.assertEqual(module.expect_list_of_ints([1]), "a")
+        with self.assertRaises(RuntimeTypingError):
+            module.expect_list_of_ints(["not an int"])
+
+    def test_cache_is_invalidated_when_source_changes(self):
+        module = self.import_module(default="a")
+        module.expect_list_of_ints([1])
+        save_plan_cache()
+
+        module = self.import_module(default="b")
+
+        self.assertFalse(plan_of(module.expect_list_of_ints).compiled)
+        self.assertEqual(module.expect_list_of_ints([1]), "b")
+
+    def test_plans_referring_to_later_classes(self):
+        module = self.import_module(default="a")
+        module.expect_list_of_ints([1])
+        module.expect_later(module.Later())
+        save_plan_cache()
+        plan_cache._entries.clear()
+
+        loaded = plan_statistics()["loaded"]
+        module = self.import_module(default="a")
+        with patch.object(plan_cache.pickle, "dump") as dump:
+            module.expect_later(module.Later())
+            with self.assertRaises(RuntimeTypingError):
+                module.expect_later("not later")
+            save_plan_cache()
+
+        # both plans are loaded (the second one on its first call, once
+        # `Later` is defined), and the cache file is not rewritten
+        self.assertEqual(plan_statistics()["loaded"], loaded + 2)
+        dump.assert_not_called()
+
+    def test_untrusted_cache_files_are_ignored(self):
+        module = self.import_module(default="a")
+        module.expect_list_of_ints([1])
+        save_plan_cache()
+        plan_cache._entries.clear()
+
+        loaded = plan_statistics()["loaded"]
+        with patch.object(plan_cache, "trusted", return_value=False):
+            module = self.import_module(default="a")
+
+        self.assertFalse(plan_of(module.expect_list_of_ints).compiled)
+        self.assertEqual(plan_statistics()["loaded"], loaded)
+
+    def test_modules_in_different_packages_do_not_share_plans(self):
+        package = os.path.join(self.directory.name, "package")
+        os.mkdir(package)
+        path = os.path.join(self.directory.name, "cached_module.py")
+        with open(path, "w") as file:
+            file.write(SOURCE.format(default="a"))
+        other_path = os.path.join(package, "cached_module.py")
+        with open(other_path, "w") as file:
+            file.write(SOURCE.format(default="a"))
+
+        self.assertNotEqual(
+            plan_cache.cache_path(path), plan_cache.cache_path(other_path)
+        )
+
+    def test_loaded_plans_do_not_inspect_the_signature(self):
+        module = self.import_module(default="a")
+        module.expect_list_of_ints([1])
+        save_plan_cache()
+        plan_cache._entries.clear()
+
+        module = self.import_module(default="a")
+        with patch("runtime_typing.plan.signature") as signature:
+            self.assertEqual(module.expect_list_of_ints([1], y="b"), "b")
+            self.assertEqual(module.expect_list_of_ints([1]), "a")
+            with self.assertRaises(RuntimeTypingError):
+                module.expect_list_of_ints([1], y=2)
+
+        signature.assert_not_called()
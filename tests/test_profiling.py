@@ -0,0 +1,242 @@
+import json
+import os
+import sys
+
+from enum import Enum
+from tempfile import TemporaryDirectory
+from typing import Callable, Dict, List, Literal, Optional, TypedDict, Union
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from runtime_typing import (
+    disable_profiling,
+    enable_profiling,
+    replay,
+    typed,
+    Gt,
+)
+from runtime_typing import profiling
+from runtime_typing.profiling import (
+    exemplar,
+    format_shape,
+    format_replay,
+    main,
+    replayable,
+    shape_of,
+)
+from runtime_typing.typed_function import TypedFunction
+
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+
+    Size = Annotated[int, Gt(0)]
+else:
+    Size = int
+
+
+class Movie(TypedDict):
+    title: str
+    year: int
+
+
+class Color(Enum):
+    RED = 1
+
+
+@typed(profile=True)
+def total(values: List[int]) -> int:
+    return len(values)
+
+
+@typed(profile=True)
+def titles(movies: List[Movie], order: Literal["asc", "desc"]) -> List[str]:
+    return [movie["title"] for movie in movies]
+
+
+@typed(profile=True)
+def paint(color: Color, size: Size) -> Optional[str]:
+    return None
+
+
+@typed(profile=True)
+def greet(name: Optional[str]) -> None:
+    pass
+
+
+@typed(profile=True)
+def call(callback: Callable[[], None]) -> None:
+    pass
+
+
+class TestShapes(TestCase):
+    def test_scalars_and_classes(self):
+        self.assertEqual(shape_of(1), {"type": "int"})
+        self.assertEqual(shape_of(int), {"class": "int"})
+        self.assertEqual(
+            shape_of(Color.RED), {"type": "tests.test_profiling:Color"}
+        )
+
+    def test_containers_are_tallied(self):
+        shape = shape_of(list(range(998)) + ["a", "b"])
+        self.assertEqual(format_shape(shape), "list[int:998, str:2]")
+
+    def test_elements_beyond_max_elements_are_not_tallied(self):
+        shape = shape_of(list(range(10)), max_elements=4)
+        self.assertEqual(shape["len"], 10)
+        self.assertEqual(format_shape(shape), "list[int:4, ...:6]")
+
+    def test_dicts(self):
+        self.assertEqual(
+            format_shape(shape_of({"title": "Heat", "year": 1995})),
+            "dict{title: str, year: int}",
+        )
+        # keys which are not identifiers are data, and not recorded
+        self.assertEqual(
+            format_shape(shape_of({"a@b.c": 1, "d@e.f": 2})),
+            "dict[str -> int:2]",
+        )
+
+    def test_tuples(self):
+        self.assertEqual(format_shape(shape_of((1, "a"))), "tuple(int, str)")
+        self.assertEqual(
+            format_shape(shape_of(tuple(range(20)))), "tuple[int:20]"
+        )
+
+    def test_exemplars(self):
+        self.assertEqual(exemplar(shape_of([1, "a"])), [0, "1"])
+        self.assertEqual(
+            exemplar(shape_of({"a@b": 1, "c@d": "x"})), {"0": 0, "1": "0"}
+        )
+        self.assertEqual(exemplar(shape_of(Color.RED)), Color.RED)
+        self.assertIs(exemplar(shape_of(int)), int)
+        self.assertIsNone(exemplar(shape_of(None)))
+        self.assertTrue(callable(exemplar(shape_of(len))))
+        self.assertEqual(exemplar(shape_of([])), [])
+        self.assertEqual(format_shape(shape_of([])), "list[]")
+
+    def test_replayable(self):
+        self.assertEqual(replayable(Literal["a", 1]), Union[str, int])
+        self.assertEqual(
+            replayable(Dict[str, List[Literal["a"]]]), Dict[str, List[str]]
+        )
+        self.assertEqual(replayable(List[int]), List[int])
+
+    @skipIf(sys.version_info < (3, 9), "typing.Annotated is new in Python 3.9")
+    def test_replayable_annotated(self):
+        self.assertEqual(replayable(Annotated[int, Gt(0)]), int)
+
+
+class TestProfiling(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        enable_profiling(self.directory.name)
+
+    def tearDown(self):
+        disable_profiling()
+        self.directory.cleanup()
+
+    def test_calls_are_not_validated(self):
+        with patch.object(TypedFunction, "validate_entity") as validate_entity:
+            self.assertEqual(total([1, 2]), 2)
+        validate_entity.assert_not_called()
+
+    def test_shapes_are_counted(self):
+        total([1, 2])
+        total([3, 4])
+        total([1, "2"])
+        path = profiling.flush_profile()
+        with open(path) as file:
+            entries = [json.loads(line) for line in file]
+
+        self.assertEqual(
+            sorted(
+                (format_shape(entry["shapes"]["values"]), entry["count"])
+                for entry in entries
+            ),
+            [("list[int:1, str:1]", 1), ("list[int:2]", 2)],
+        )
+
+    def test_shapes_of_the_same_types_are_counted_together(self):
+        total([1, 2])
+        total([1, 2, 3, 4])
+        (entry,) = profiling._records.values()
+        self.assertEqual(entry[-1], 2)
+
+    def test_reservoir_is_bounded(self):
+        enable_profiling(self.directory.name, capacity=3)
+        for length in range(1, 11):
+            total([(1,) * length])
+
+        self.assertEqual(len(profiling._records), 3)
+        self.assertEqual(profiling._distinct, 10)
+
+    def test_replay_of_none_and_callables(self):
+        greet(None)
+        greet("Ada")
+        greet(1)
+        call(lambda: None)
+        disable_profiling()
+
+        results = replay(self.directory.name)
+        self.assertEqual([result.error for result in results], [None] * 4)
+        self.assertEqual(
+            sorted(len(result.violations) for result in results), [0, 0, 0, 1]
+        )
+
+    def test_replay(self):
+        total([1, 2])
+        total([1, "2"])
+        titles([{"title": "Heat", "year": 1995}], "asc")
+        titles([{"title": "Heat", "year": "1995"}], "desc")
+        paint(Color.RED, 3)
+        disable_profiling()
+
+        results = replay(self.directory.name)
+        self.assertEqual(len(results), 5)
+        violating = sorted(
+            (result.function, str(result.violations[0].message))
+            for result in results
+            if result.violations
+        )
+        self.assertEqual(len(violating), 2)
+        self.assertEqual(violating[0][0], "tests.test_profiling:titles")
+        self.assertIn("year", violating[0][1])
+        self.assertEqual(violating[1][0], "tests.test_profiling:total")
+
+        report = format_replay(results)
+        self.assertIn("5 shapes of 5 calls replayed, 2 with violations", report)
+
+    def test_shapes_of_all_processes_are_aggregated(self):
+        total([1, 2])
+        profiling.flush_profile()
+        total([1, 2])
+        profiling.flush_profile()
+        os.rename(
+            profiling.profile_file(self.directory.name, os.getpid()),
+            profiling.profile_file(self.directory.name, 0),
+        )
+        total([1, 2])
+        profiling.flush_profile()
+
+        (result,) = replay(self.directory.name)
+        self.assertEqual(result.count, 3)
+        self.assertEqual(result.violations, [])
+
+    def test_unresolvable_functions_are_reported(self):
+        @typed(profile=True)
+        def local(x: int) -> int:
+            return x
+
+        local(1)
+        disable_profiling()
+
+        (result,) = replay(self.directory.name)
+        self.assertIn("cannot import", result.error)
+
+    def test_main_exits_with_violations(self):
+        total(["1"])
+        disable_profiling()
+
+        with patch("builtins.print"), self.assertRaises(SystemExit):
+            main([self.directory.name])
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError, RuntimeTypingWarning
+
+
+@typed
+@dataclass
+class Point:
+    x: float
+    y: float
+    tags: Optional[List[str]] = None
+
+    def scaled(self, factor: float) -> "Point":
+        return Point(self.x * factor, self.y * factor)
+
+
+@typed(mode="warn", exclude=("y",))
+@dataclass(frozen=True)
+class WarningPoint:
+    x: float
+    y: float
+
+
+@typed
+class Pair(NamedTuple):
+    left: int
+    right: str
+
+
+@dataclass
+class UntypedPoint:
+    x: float
+
+
+class UntypedPair(NamedTuple):
+    left: int
+
+
+@typed(validate_fields=True)
+def expect_untyped_point(point: UntypedPoint):
+    pass
+
+
+@typed(validate_fields=True, mode="return")
+def expect_list_of_untyped_pairs(pairs: List[UntypedPair]):
+    pass
+
+
+@typed
+def expect_untyped_point_without_fields(point: UntypedPoint):
+    pass
+
+
+class TestRecords(TestCase):
+    def test_dataclass(self):
+        Point(1.0, 2.0)
+        Point(x=1.0, y=2.0, tags=["a"])
+
+        with self.assertRaises(RuntimeTypingError):
+            Point(1.0, "not a float")
+
+        with self.assertRaises(RuntimeTypingError):
+            Point(1.0, 2.0, tags=[1])
+
+    def test_methods_of_dataclass(self):
+        with self.assertRaises(RuntimeTypingError):
+            Point(1.0, 2.0).scaled("not a float")
+
+    def test_frozen_dataclass_with_options(self):
+        WarningPoint(1.0, "excluded")
+
+        with self.assertWarns(RuntimeTypingWarning):
+            WarningPoint("not a float", 1.0)
+
+    def test_named_tuple(self):
+        pair = Pair(1, "s")
+        self.assertEqual(pair, (1, "s"))
+        self.assertIsInstance(pair, Pair)
+
+        with self.assertRaises(RuntimeTypingError):
+            Pair("not an int", "s")
+
+        with self.assertRaises(RuntimeTypingError):
+            Pair(left=1, right=2)
+
+    def test_named_tuple_make_and_replace(self):
+        self.assertEqual(Pair._make([1, "s"]), (1, "s"))
+        self.assertEqual(Pair(1, "s")._replace(right="t"), (1, "t"))
+
+        with self.assertRaises(RuntimeTypingError):
+            Pair._make(["not an int", "s"])
+
+        with self.assertRaises(RuntimeTypingError):
+            Pair(1, "s")._replace(left="not an int")
+
+    def test_sample(self):
+        @typed(sample=0.0)
+        @dataclass
+        class SampledPoint:
+            x: float
+
+        SampledPoint("not a float")
+
+    def test_validate_assignment_of_immutable_records(self):
+        with self.assertRaises(ValueError):
+
+            @typed(validate_assignment=True)
+            @dataclass(frozen=True)
+            class FrozenPoint:
+                x: float
+
+        with self.assertRaises(ValueError):
+
+            @typed(validate_assignment=True)
+            class ImmutablePair(NamedTuple):
+                left: int
+
+    def test_validate_fields(self):
+        expect_untyped_point(UntypedPoint(1.0))
+        expect_untyped_point_without_fields(UntypedPoint("not a float"))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_untyped_point(UntypedPoint("not a float"))
+
+    def test_validate_fields_path(self):
+        _, violations = expect_list_of_untyped_pairs(
+            [UntypedPair(1), UntypedPair("s")]
+        )
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0].path, ("pairs", 1, "left"))
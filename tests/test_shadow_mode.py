@@ -0,0 +1,139 @@
+import os
+
+from threading import Event
+from typing import List
+from unittest import TestCase, skipUnless
+from unittest.mock import Mock
+
+from runtime_typing import typed, RuntimeTypingWarning, ShadowValidator
+
+
+collected = []
+collecting_validator = ShadowValidator(sink=collected.append)
+deep_validator = ShadowValidator(snapshot="deep", sink=collected.append)
+
+release = Event()
+blocking_validator = ShadowValidator(
+    maxsize=1, sink=lambda violation: release.wait()
+)
+
+
+@typed(mode="shadow", shadow=collecting_validator)
+def expect_int_shadow_mode(a: int) -> int:
+    return a
+
+
+@typed(mode="shadow", shadow=deep_validator)
+def expect_list_of_ints_and_mutate(a: List[int]) -> None:
+    a.append("not an int")
+
+
+@typed(mode="shadow", shadow=blocking_validator)
+def expect_str_blocking(a: str) -> str:
+    return a
+
+
+class TestShadowMode(TestCase):
+    def setUp(self):
+        collected.clear()
+
+    def test_function_is_called_immediately(self):
+        self.assertEqual(expect_int_shadow_mode("not an int"), "not an int")
+
+        collecting_validator.join()
+
+        self.assertEqual(
+            [violation.parameter_name for violation in collected],
+            ["a", "return"],
+        )
+
+    def test_no_violations(self):
+        self.assertEqual(expect_int_shadow_mode(1), 1)
+
+        collecting_validator.join()
+
+        self.assertEqual(collected, [])
+
+    def test_deep_snapshot(self):
+        expect_list_of_ints_and_mutate([1, 2])
+
+        deep_validator.join()
+
+        self.assertEqual(collected, [])
+
+    def test_drop_on_full(self):
+        for _ in range(5):
+            expect_str_blocking(1)
+
+        self.assertGreater(blocking_validator.dropped, 0)
+
+        release.set()
+        blocking_validator.join()
+
+    def test_dropped_calls_are_not_snapshotted(self):
+        released = Event()
+        validator = ShadowValidator(
+            maxsize=1, sink=lambda violation: released.wait()
+        )
+        validator.snapshot = Mock(side_effect=lambda obj: obj)
+
+        @typed(mode="shadow", shadow=validator)
+        def expect_str(a: str) -> str:
+            return a
+
+        for _ in range(5):
+            expect_str(1)
+
+        dropped = validator.dropped
+        self.assertGreater(dropped, 0)
+        # arguments and return value of the calls which have been queued
+        self.assertEqual(validator.snapshot.call_count, 2 * (5 - dropped))
+
+        released.set()
+        validator.join()
+
+    def test_only_typed_arguments_are_snapshotted(self):
+        validator = ShadowValidator(sink=collected.append)
+        validator.snapshot = Mock(side_effect=lambda obj: obj)
+
+        class Service:
+            @typed(mode="shadow", shadow=validator)
+            def handle(self, ctx, a: int):
+                pass
+
+        Service().handle(object(), "not an int")
+        validator.join()
+
+        validator.snapshot.assert_called_once_with("not an int")
+        self.assertEqual(len(collected), 1)
+
+    def test_errors_are_warned(self):
+        @typed(mode="shadow", shadow=collecting_validator)
+        def expect_undefined(a: "Undefined"):
+            pass
+
+        with self.assertWarns(RuntimeTypingWarning):
+            expect_undefined(1)
+            collecting_validator.join()
+
+    @skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_calls_are_validated_in_forked_processes(self):
+        expect_int_shadow_mode(1)
+        collecting_validator.join()
+
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                expect_int_shadow_mode("not an int")
+                collecting_validator.join()
+                os.write(write_end, str(len(collected)).encode())
+            finally:
+                os._exit(0)
+
+        os.close(write_end)
+        with os.fdopen(read_end) as pipe:
+            violations = pipe.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(violations, "2")
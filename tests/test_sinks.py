@@ -0,0 +1,164 @@
+import json
+import os
+import subprocess
+import sys
+
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase, skipUnless
+
+from runtime_typing import (
+    typed,
+    BatchingDispatcher,
+    JSONLinesFileSink,
+    LoggingSink,
+    RingBufferSink,
+    RuntimeTypingError,
+)
+
+
+ring_buffer = RingBufferSink(maxlen=2)
+
+
+@typed(mode="sink", sink=ring_buffer)
+def expect_int_sink_mode(a: int):
+    return a
+
+
+@typed(sink=ring_buffer)
+def expect_int_raise_mode(a: int):
+    return a
+
+
+class TestSinks(TestCase):
+    def setUp(self):
+        ring_buffer.clear()
+
+    def test_sink_mode(self):
+        self.assertEqual(expect_int_sink_mode("not an int"), "not an int")
+
+        self.assertEqual(len(ring_buffer.violations), 1)
+        self.assertEqual(ring_buffer.violations[0].parameter_name, "a")
+
+    def test_sink_with_raise_mode(self):
+        with self.assertRaises(RuntimeTypingError):
+            expect_int_raise_mode("not an int")
+
+        self.assertEqual(len(ring_buffer.violations), 1)
+
+    def test_ring_buffer_is_bounded(self):
+        for value in ("a", "b", "c"):
+            expect_int_sink_mode(value)
+
+        self.assertEqual(
+            [violation.got for violation in ring_buffer.violations], [str, str]
+        )
+
+    def test_logging_sink(self):
+        @typed(mode="sink", sink=LoggingSink("runtime_typing.test"))
+        def expect_int(a: int):
+            pass
+
+        with self.assertLogs("runtime_typing.test") as logs:
+            expect_int("not an int")
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("runtime_typing_violation", logs.records[0].__dict__)
+
+    def test_batching_dispatcher_with_rotating_file(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "violations.jsonl")
+            file_sink = JSONLinesFileSink(path, max_bytes=400, backup_count=1)
+            dispatcher = BatchingDispatcher(
+                file_sink, batch_size=2, flush_interval=0.01
+            )
+
+            @typed(mode="sink", sink=dispatcher)
+            def expect_int(a: int):
+                pass
+
+            for _ in range(10):
+                expect_int("not an int")
+
+            dispatcher.close()
+
+            self.assertTrue(os.path.exists(path + ".1"))
+            self.assertFalse(os.path.exists(path + ".2"))
+            with open(path + ".1") as file:
+                records = [json.loads(line) for line in file]
+            self.assertIn("message", records[0])
+
+    def test_batching_dispatcher_drops_on_full_queue(self):
+        dispatcher = BatchingDispatcher(RingBufferSink(), maxsize=1)
+        dispatcher._ensure_worker = lambda: None
+
+        @typed(mode="sink", sink=dispatcher)
+        def expect_int(a: int):
+            pass
+
+        expect_int("a")
+        expect_int("b")
+
+        self.assertEqual(dispatcher.dropped, 1)
+
+    @skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_batching_dispatcher_delivers_in_forked_processes(self):
+        received = RingBufferSink()
+        dispatcher = BatchingDispatcher(received, flush_interval=0.01)
+
+        @typed(mode="sink", sink=dispatcher)
+        def expect_int(a: int):
+            pass
+
+        expect_int("a")
+        dispatcher.flush()
+
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                expect_int("b")
+                dispatcher.flush()
+                os.write(write_end, str(len(received.violations)).encode())
+            finally:
+                os._exit(0)
+
+        os.close(write_end)
+        with os.fdopen(read_end) as pipe:
+            delivered = pipe.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(delivered, "2")
+
+    def test_batching_dispatcher_delivers_at_exit(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "violations.jsonl")
+            script = dedent(
+                f"""
+                from runtime_typing import typed, BatchingDispatcher, JSONLinesFileSink
+
+                dispatcher = BatchingDispatcher(JSONLinesFileSink({path!r}))
+
+                @typed(mode="sink", sink=dispatcher)
+                def expect_int(a: int):
+                    pass
+
+                for _ in range(5):
+                    expect_int("a")
+                """
+            )
+            subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            )
+
+            with open(path) as file:
+                self.assertEqual(len(file.readlines()), 5)
+
+    def test_sink_mode_requires_a_sink(self):
+        with self.assertRaises(ValueError):
+
+            @typed(mode="sink")
+            def expect_int(a: int):
+                pass
@@ -0,0 +1,103 @@
+import os
+
+from multiprocessing import get_all_start_methods, get_context
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, skipUnless
+
+from runtime_typing import (
+    typed,
+    disable_statistics,
+    enable_statistics,
+    read_statistics,
+    RuntimeTypingError,
+)
+from runtime_typing.stats import format_statistics
+
+
+@typed
+def double(x: int) -> int:
+    return 2 * x
+
+
+@typed(mode="return")
+def lenient_double(x: int) -> int:
+    return 2 * x
+
+
+def call_double(count):
+    for i in range(count):
+        double(i)
+
+
+class TestStatistics(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        enable_statistics(self.directory.name)
+
+    def tearDown(self):
+        disable_statistics()
+        self.directory.cleanup()
+
+    def test_counters(self):
+        double(1)
+        double(2)
+        with self.assertRaises(RuntimeTypingError):
+            double("3")
+        result, violations = lenient_double(1.5)
+        self.assertEqual((result, len(violations)), (3.0, 2))
+
+        totals = read_statistics(self.directory.name)
+        counters = totals[f"{__name__}.double"]
+        self.assertEqual(counters["calls"], 3)
+        self.assertEqual(counters["validations"], 5)
+        self.assertEqual(counters["violations"], 1)
+        self.assertGreater(counters["time_ns"], 0)
+        self.assertEqual(
+            sum(v for k, v in counters.items() if k.startswith("time ")), 3
+        )
+
+        self.assertEqual(totals[f"{__name__}.lenient_double"]["violations"], 2)
+        self.assertIn("double", format_statistics(totals))
+
+    @skipUnless("fork" in get_all_start_methods(), "requires fork")
+    def test_aggregates_across_processes(self):
+        double(1)
+        context = get_context("fork")
+        processes = [
+            context.Process(target=call_double, args=(10,)) for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual(len(os.listdir(self.directory.name)), 3)
+        totals = read_statistics(self.directory.name)
+        self.assertEqual(totals[f"{__name__}.double"]["calls"], 21)
+
+    def test_disabled(self):
+        double(1)
+        disable_statistics()
+        double(1)
+        totals = read_statistics(self.directory.name)
+        self.assertEqual(totals[f"{__name__}.double"]["calls"], 1)
+
+    def test_threads(self):
+        threads = [Thread(target=call_double, args=(1000,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        totals = read_statistics(self.directory.name)
+        self.assertEqual(totals[f"{__name__}.double"]["calls"], 8000)
+
+    def test_files_are_not_reused(self):
+        double(1)
+        enable_statistics(self.directory.name)
+        double(1)
+
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+        totals = read_statistics(self.directory.name)
+        self.assertEqual(totals[f"{__name__}.double"]["calls"], 2)
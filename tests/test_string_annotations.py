@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sys
+
+from typing import ForwardRef, List, Union
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError, RuntimeTypingNameError
+from runtime_typing.utils import cached_type_hints, resolve_forward_ref
+
+
+@typed
+def identity_of_number(x: "Union[int, float]") -> "Union[int, float]":
+    return x
+
+
+@typed
+def expect_list_of_later_defined_class(x: List[LaterDefinedClass]):
+    pass
+
+
+class LaterDefinedClass:
+    pass
+
+
+@typed
+def expect_not_yet_importable_class(x: NotYetImportableClass):
+    pass
+
+
+class TestStringAnnotations(TestCase):
+    def test_string_annotations(self):
+        identity_of_number(1)
+        identity_of_number(1.0)
+
+        with self.assertRaises(RuntimeTypingError):
+            identity_of_number("not a number")
+
+    def test_future_annotations(self):
+        expect_list_of_later_defined_class([LaterDefinedClass()])
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_list_of_later_defined_class([1])
+
+    def test_annotations_are_resolved_once(self):
+        identity_of_number(1)
+
+        hints = cached_type_hints(identity_of_number.__wrapped__)
+
+        self.assertIs(cached_type_hints(identity_of_number.__wrapped__), hints)
+        if sys.version_info >= (3, 9):
+            # Python 3.8 leaves the doubly quoted annotation a forward reference.
+            self.assertEqual(hints["x"], Union[int, float])
+
+    def test_unresolvable_annotations_are_retried(self):
+        with self.assertRaises(RuntimeTypingNameError):
+            expect_not_yet_importable_class(1)
+
+        globals()["NotYetImportableClass"] = LaterDefinedClass
+        try:
+            expect_not_yet_importable_class(LaterDefinedClass())
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_not_yet_importable_class(1)
+        finally:
+            del globals()["NotYetImportableClass"]
+
+    def test_unresolvable_forward_references(self):
+        with self.assertRaises(RuntimeTypingNameError):
+            resolve_forward_ref(
+                ForwardRef("NotYetImportableClass"), identity_of_number
+            )
+
+    def test_forward_references_are_resolved_in_the_globals_of_functions(self):
+        # functions created with `exec` share the `__module__`, but not the
+        # namespace their annotations are resolved in
+        source = "def function(x: 'Element'): pass"
+        namespaces = [
+            {"__name__": __name__, "Element": int},
+            {"__name__": __name__, "Element": str},
+        ]
+        for namespace in namespaces:
+            exec(source, namespace)
+
+        self.assertEqual(
+            [
+                resolve_forward_ref(ForwardRef("Element"), namespace["function"])
+                for namespace in namespaces
+            ],
+            [int, str],
+        )
@@ -0,0 +1,150 @@
+import sys
+
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    Collection,
+    Container,
+    List,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+    AbstractSet,
+)
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError
+
+
+@typed
+def expect_sequence(a: Sequence):
+    pass
+
+
+@typed
+def expect_sequence_of_ints(a: Sequence[int]):
+    pass
+
+
+@typed(mode="return")
+def expect_sequence_of_floats_return_mode(a: Sequence[float]):
+    pass
+
+
+@typed
+def expect_mutable_sequence_of_ints(a: MutableSequence[int]):
+    pass
+
+
+@typed
+def expect_collection_of_strs(a: Collection[str]):
+    pass
+
+
+@typed
+def expect_abstract_set_of_strs(a: AbstractSet[str]):
+    pass
+
+
+@typed
+def expect_container_of_ints(a: Container[int]):
+    pass
+
+
+@typed
+def expect_mapping(a: Mapping[str, List[int]]):
+    pass
+
+
+@typed
+def expect_mutable_mapping(a: MutableMapping[str, int]):
+    pass
+
+
+class TestAbstractCollections(TestCase):
+    def test_expect_sequence(self):
+        expect_sequence([1, "s"])
+        expect_sequence("s")
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_sequence({1, 2})
+
+    def test_expect_sequence_of_ints(self):
+        expect_sequence_of_ints([1, 2])
+        expect_sequence_of_ints((1, 2))
+        expect_sequence_of_ints(range(10**9))
+        expect_sequence_of_ints(range(0))
+        expect_sequence_of_ints(b"bytes")
+        if sys.version_info >= (3, 10):
+            # `array` is a registered `Sequence` since Python 3.10.
+            expect_sequence_of_ints(array("q", [1, 2, 3]))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_sequence_of_ints([1, "s"])
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_sequence_of_ints(array("d", [1.0]))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_sequence_of_ints({1, 2})
+
+    def test_violation_of_homogeneous_sequence(self):
+        _, violations = expect_sequence_of_floats_return_mode(range(10**9))
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0].got, int)
+        self.assertEqual(violations[0].path, ("a", 0))
+
+    def test_expect_mutable_sequence_of_ints(self):
+        expect_mutable_sequence_of_ints([1, 2])
+        expect_mutable_sequence_of_ints(bytearray(b"bytes"))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_mutable_sequence_of_ints((1, 2))
+
+    def test_expect_collection_of_strs(self):
+        expect_collection_of_strs(["a", "b"])
+        expect_collection_of_strs({"a": 1}.keys())
+        expect_collection_of_strs(frozenset({"a"}))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_collection_of_strs({"a": 1}.values())
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_collection_of_strs(iter(["a"]))
+
+    def test_expect_abstract_set_of_strs(self):
+        expect_abstract_set_of_strs({"a", "b"})
+        expect_abstract_set_of_strs({"a": 1}.keys())
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_abstract_set_of_strs(["a"])
+
+    def test_expect_container_of_ints(self):
+        expect_container_of_ints([1])
+        expect_container_of_ints(range(3))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_container_of_ints(1)
+
+    def test_expect_mapping(self):
+        expect_mapping({"a": [1]})
+        expect_mapping(MappingProxyType({"a": [1]}))
+        expect_mapping(OrderedDict(a=[1, 2]))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_mapping(MappingProxyType({"a": ["not an int"]}))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_mapping(MappingProxyType({1: [1]}))
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_mapping([("a", [1])])
+
+    def test_expect_mutable_mapping(self):
+        expect_mutable_mapping({"a": 1})
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_mutable_mapping(MappingProxyType({"a": 1}))
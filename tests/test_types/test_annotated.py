@@ -0,0 +1,140 @@
+import pickle
+import sys
+
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import (
+    typed,
+    Ge,
+    Gt,
+    Le,
+    Lt,
+    MaxLen,
+    MinLen,
+    Regex,
+    RuntimeTypingError,
+)
+from runtime_typing.constraints import compile_constraints
+
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+
+    @typed
+    def expect_percentage(a: Annotated[int, Ge(0), Le(100)]):
+        pass
+
+    @typed
+    def expect_identifier(a: Annotated[str, MaxLen(8), Regex(r"^[a-z_]+$")]):
+        pass
+
+    @typed(mode="return")
+    def expect_non_empty_list_of_floats(a: Annotated[List[float], MinLen(1)]):
+        pass
+
+    @typed(mode="return")
+    def expect_list_of_positive_floats(a: List[Annotated[float, Gt(0)]]):
+        pass
+
+    @typed
+    def expect_non_negative(a: Annotated[int, Ge(0)]):
+        pass
+
+    @typed
+    def expect_at_least_100(a: Annotated[int, Ge(100)]):
+        pass
+
+    @typed
+    def expect_plain_metadata(a: Annotated[int, "some metadata"]):
+        pass
+
+    class TestAnnotated(TestCase):
+        def test_expect_percentage(self):
+            expect_percentage(0)
+            expect_percentage(100)
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_percentage(-1)
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_percentage(101)
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_percentage(50.0)
+
+        def test_expect_identifier(self):
+            expect_identifier("some_id")
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_identifier("too_long_id")
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_identifier("Some_Id")
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_identifier(1)
+
+        def test_expect_non_empty_list_of_floats(self):
+            _, violations = expect_non_empty_list_of_floats([1.0])
+            self.assertEqual(violations, [])
+
+            _, violations = expect_non_empty_list_of_floats([])
+            self.assertTrue(violations)
+            self.assertEqual(violations[0].expected, MinLen(1))
+
+            _, violations = expect_non_empty_list_of_floats(["s"])
+            self.assertTrue(violations)
+
+        def test_constraints_of_elements(self):
+            _, violations = expect_list_of_positive_floats([1.0, 0.0, "s"])
+
+            self.assertEqual(
+                [(v.path, v.expected) for v in violations],
+                [(("a", 1), Gt(0)), (("a", 2), float)],
+            )
+
+        def test_plain_metadata_is_ignored(self):
+            expect_plain_metadata(1)
+
+            with self.assertRaises(RuntimeTypingError):
+                expect_plain_metadata("s")
+
+        def test_bounds_are_folded(self):
+            constraints = compile_constraints((Ge(0), Gt(0), Le(10), Lt(5)))
+
+            self.assertEqual(constraints.bounds, (Gt(0), Lt(5)))
+            self.assertIsNone(constraints.violated_value_constraint(1))
+            self.assertEqual(constraints.violated_value_constraint(0), Gt(0))
+            self.assertEqual(constraints.violated_value_constraint(5), Lt(5))
+
+        def test_constraints_are_compiled_once(self):
+            metadata = (Ge(0), Regex("a"))
+
+            self.assertIs(compile_constraints(metadata), compile_constraints(metadata))
+
+        def test_constraints_are_compiled_with_the_plan(self):
+            expect_list_of_positive_floats([1.0])
+
+            with patch(
+                "runtime_typing.typed_function.compile_constraints"
+            ) as compile_per_value:
+                violations = expect_list_of_positive_floats([1.0, -1.0, 2.0])
+
+            compile_per_value.assert_not_called()
+            self.assertTrue(violations)
+
+        def test_bounds_of_the_same_class(self):
+            self.assertNotEqual(Ge(0), Ge(100))
+            self.assertEqual(repr(Ge(5)), "Ge(5)")
+
+            expect_non_negative(5)
+            with self.assertRaises(RuntimeTypingError):
+                expect_at_least_100(5)
+
+        def test_regex_can_be_pickled(self):
+            regex = pickle.loads(pickle.dumps(Regex("^a+$")))
+
+            self.assertEqual(regex, Regex("^a+$"))
+            self.assertTrue(regex("aaa"))
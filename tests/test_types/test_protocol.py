@@ -0,0 +1,93 @@
+from abc import ABC
+from collections.abc import Iterable
+from typing import Protocol, runtime_checkable
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError
+from runtime_typing.profiling import Exemplar
+from runtime_typing.utils import cached_isinstance, _verdicts
+
+
+@runtime_checkable
+class SupportsClose(Protocol):
+    def close(self) -> None:
+        ...
+
+
+@runtime_checkable
+class HasName(Protocol):
+    name: str
+
+
+class Closable:
+    def close(self) -> None:
+        pass
+
+
+class SomeABC(ABC):
+    pass
+
+
+class Unrelated:
+    pass
+
+
+@typed
+def expect_closable(a: SupportsClose):
+    pass
+
+
+@typed
+def expect_named(a: HasName):
+    pass
+
+
+@typed
+def expect_some_abc(a: SomeABC):
+    pass
+
+
+class TestProtocol(TestCase):
+    def test_expect_closable(self):
+        expect_closable(Closable())
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_closable(Unrelated())
+
+        self.assertTrue(_verdicts[(Closable, SupportsClose)])
+        self.assertFalse(_verdicts[(Unrelated, SupportsClose)])
+
+    def test_protocols_with_data_members_are_not_cached(self):
+        named = Unrelated()
+        named.name = "some name"
+        expect_named(named)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_named(Unrelated())
+
+        self.assertNotIn((Unrelated, HasName), _verdicts)
+
+    def test_cache_is_invalidated_by_register(self):
+        class Registered:
+            pass
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_some_abc(Registered())
+
+        SomeABC.register(Registered)
+
+        expect_some_abc(Registered())
+
+    def test_abc(self):
+        self.assertTrue(cached_isinstance([], Iterable))
+        self.assertFalse(cached_isinstance(1, Iterable))
+        self.assertTrue(cached_isinstance([], Iterable))
+        self.assertIn((list, Iterable), _verdicts)
+
+    def test_proxies_are_not_cached(self):
+        class Subclass(SomeABC):
+            pass
+
+        self.assertTrue(cached_isinstance(Exemplar(Subclass), SomeABC))
+        self.assertFalse(cached_isinstance(Exemplar(Unrelated), SomeABC))
+        self.assertNotIn((Exemplar, SomeABC), _verdicts)
@@ -0,0 +1,65 @@
+from typing import Dict, List, Union
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError
+
+
+JSON = Union[None, bool, int, float, str, List["JSON"], Dict[str, "JSON"]]
+Tree = Dict[str, Union[int, "Tree"]]
+
+
+@typed
+def expect_json(document: JSON):
+    pass
+
+
+@typed(mode="return")
+def expect_json_return_mode(document: JSON):
+    pass
+
+
+@typed
+def expect_tree(tree: Tree):
+    pass
+
+
+class TestRecursiveAlias(TestCase):
+    def test_expect_json(self):
+        expect_json(None)
+        expect_json(1)
+        expect_json("s")
+        expect_json([1, "s", None, [1.0, {"a": [True]}]])
+        expect_json({"a": {"b": {"c": [1, 2, {"d": None}]}}})
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_json({1})
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_json({"a": [1, {"b": {1, 2}}]})
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_json({1: "non-string key"})
+
+    def test_deeply_nested_document(self):
+        expect_json([[[[[[[[[[[[[[[[[[[[1]]]]]]]]]]]]]]]]]]]])
+        expect_json_return_mode({"key": [[["value"]]] * 10})
+
+    def test_cyclic_value(self):
+        cyclic_list = [1, "s"]
+        cyclic_list.append(cyclic_list)
+        expect_json(cyclic_list)
+
+        cyclic_dict = {"a": 1}
+        cyclic_dict["self"] = cyclic_dict
+        expect_json(cyclic_dict)
+
+        invalid_cyclic_dict = {"a": object()}
+        invalid_cyclic_dict["self"] = invalid_cyclic_dict
+        _, violations = expect_json_return_mode(invalid_cyclic_dict)
+        self.assertTrue(violations)
+
+    def test_expect_tree(self):
+        expect_tree({"leaf": 1, "node": {"leaf": 2, "node": {}}})
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_tree({"leaf": 1, "node": {"leaf": "not an int"}})
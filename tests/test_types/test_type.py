@@ -1,5 +1,6 @@
+from abc import ABC, abstractmethod
 from unittest import TestCase
-from typing import Type, TypeVar, Union
+from typing import Protocol, Type, TypeVar, Union, runtime_checkable
 
 from runtime_typing import typed
 from runtime_typing.violations import RuntimeTypingError
@@ -110,3 +111,104 @@ class TestType(TestCase):
         expect_type_of_union_str_int(int)
         expect_type_of_union_str_int(CustomIntSubclass)
         expect_type_of_union_str_int(str)
+
+
+class PluginMeta(type):
+    pass
+
+
+class Plugin(metaclass=PluginMeta):
+    pass
+
+
+class AudioPlugin(Plugin):
+    pass
+
+
+class AbstractPlugin(ABC):
+    @abstractmethod
+    def run(self):
+        pass
+
+
+class ConcretePlugin(AbstractPlugin):
+    def run(self):
+        pass
+
+
+@typed
+def expect_plugin_class(a: Type[Plugin]):
+    pass
+
+
+@typed
+def expect_abstract_plugin_class(a: Type[AbstractPlugin]):
+    pass
+
+
+@typed(mode="return")
+def lenient_type_int(a: Type[int]):
+    pass
+
+
+@runtime_checkable
+class Named(Protocol):
+    name: str
+
+
+class NamedPlugin(Plugin):
+    name: str
+
+
+@typed
+def expect_named_class(a: Type[Named]):
+    pass
+
+
+@typed
+def expect_type_of_union_with_abc(a: Type[Union[Plugin, AbstractPlugin]]):
+    pass
+
+
+class TestTypeWithMetaclasses(TestCase):
+    def test_custom_metaclass(self):
+        expect_type(Plugin)
+        expect_plugin_class(Plugin)
+        expect_plugin_class(AudioPlugin)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_plugin_class(CustomClass)
+
+    def test_abc_metaclass(self):
+        expect_type(AbstractPlugin)
+        expect_abstract_plugin_class(ConcretePlugin)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_abstract_plugin_class(Plugin)
+
+    def test_registration_invalidates_cache(self):
+        class Registered:
+            pass
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_abstract_plugin_class(Registered)
+
+        AbstractPlugin.register(Registered)
+        expect_abstract_plugin_class(Registered)
+
+    def test_union_of_metaclass_instances(self):
+        expect_type_of_union_with_abc(AudioPlugin)
+        expect_type_of_union_with_abc(ConcretePlugin)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_type_of_union_with_abc(CustomClass)
+
+    def test_non_class_is_reported_once(self):
+        _, violations = lenient_type_int(1)
+        self.assertEqual(len(violations), 1)
+
+    def test_protocol_with_data_members(self):
+        expect_named_class(NamedPlugin)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_named_class(AudioPlugin)
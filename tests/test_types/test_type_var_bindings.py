@@ -0,0 +1,107 @@
+from numbers import Number
+from typing import List, Tuple, TypeVar, Union
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError
+from runtime_typing.type_vars import TypeVarBindings
+
+
+class Animal:
+    pass
+
+
+class Dog(Animal):
+    pass
+
+
+class Cat(Animal):
+    pass
+
+
+A = TypeVar("A", bound=Animal)
+N = TypeVar("N", bound=Number)
+S = TypeVar("S", str, bytes)
+T = TypeVar("T")
+
+
+@typed
+def pair_of_animals(a: A, b: A) -> A:
+    return b
+
+
+@typed
+def first_animal(animals: List[A]) -> A:
+    return animals[0]
+
+
+@typed
+def total(a: N, b: N) -> N:
+    return a + b
+
+
+@typed
+def concat(a: S, b: S) -> S:
+    return a + b
+
+
+@typed
+def union_then_type_var(x: Union[Tuple[T, int], T], y: T):
+    pass
+
+
+class TestBoundTypeVar(TestCase):
+    def test_bound_is_enforced(self):
+        with self.assertRaises(RuntimeTypingError):
+            pair_of_animals(1, 2)
+
+    def test_values_are_joined_within_bound(self):
+        self.assertIsInstance(pair_of_animals(Dog(), Cat()), Cat)
+        first_animal([Dog(), Cat(), Animal()])
+        self.assertEqual(total(1, 2.5), 3.5)
+
+    def test_join(self):
+        bindings = TypeVarBindings({A: 0})
+        self.assertIsNone(bindings.bind(A, Dog))
+        self.assertIsNone(bindings.bind(A, Cat))
+        self.assertIs(bindings.bound_type(A), Animal)
+        self.assertIs(bindings.bind(A, int), Animal)
+
+
+class TestConstrainedTypeVar(TestCase):
+    def test_constraints(self):
+        self.assertEqual(concat("a", "b"), "ab")
+        self.assertEqual(concat(b"a", b"b"), b"ab")
+
+        with self.assertRaises(RuntimeTypingError):
+            concat(1, 2)
+
+        with self.assertRaises(RuntimeTypingError):
+            concat("a", b"b")
+
+    def test_binds_to_constraint(self):
+        class Text(str):
+            pass
+
+        bindings = TypeVarBindings({})
+        self.assertIsNone(bindings.bind(S, Text))
+        self.assertIs(bindings.bound_type(S), str)
+        self.assertIsNone(bindings.bind(S, str))
+        self.assertEqual(bindings.bind(S, int), (str, bytes))
+
+
+class TestUnionRollback(TestCase):
+    def test_failed_branch_does_not_bind(self):
+        # `Tuple[T, int]` does not match, so `T` must not stay bound to `str`
+        # from validating the first element of the tuple.
+        union_then_type_var(("a", "b"), ("c",))
+        with self.assertRaises(RuntimeTypingError):
+            union_then_type_var(("a", "b"), "c")
+
+    def test_snapshot_and_rollback(self):
+        bindings = TypeVarBindings({T: 0})
+        snapshot = bindings.snapshot()
+        bindings.bind(T, int)
+        bindings.bind(S, str)
+        bindings.rollback(snapshot)
+        self.assertIsNone(bindings.bound_type(T))
+        self.assertIsNone(bindings.bound_type(S))
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import ClassVar, List, Optional, Protocol, runtime_checkable
+from unittest import TestCase
+
+from runtime_typing import typed, RuntimeTypingError, RuntimeTypingWarning
+
+
+@typed(validate_assignment=True)
+class Counter:
+    count: int
+    label: Optional[str]
+    history: List[int]
+    instances: ClassVar[int] = 0
+
+    def __init__(self, count: int):
+        self.count = count
+        self.label = None
+        self.history = []
+
+
+@typed(validate_assignment=True, mode="warn")
+class SlottedCounter:
+    __slots__ = ("count",)
+
+    count: int
+
+
+@typed(validate_assignment=True)
+@dataclass
+class DataCounter:
+    count: int
+
+
+class PositiveMeta(type):
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, int) and instance > 0
+
+
+class Positive(metaclass=PositiveMeta):
+    pass
+
+
+@runtime_checkable
+class HasName(Protocol):
+    name: str
+
+
+class Named:
+    pass
+
+
+@typed(validate_assignment=True)
+class Account:
+    balance: Positive
+    owner: HasName
+
+
+class TestValidateAssignment(TestCase):
+    def test_assignment(self):
+        counter = Counter(1)
+        counter.count = 2
+        counter.label = "s"
+        counter.history = [1, 2]
+        counter.unannotated = "anything"
+        Counter.instances = "class variables are not validated"
+
+        with self.assertRaises(RuntimeTypingError):
+            counter.count = "oops"
+
+        with self.assertRaises(RuntimeTypingError):
+            counter.history = [1, "oops"]
+
+        self.assertEqual(counter.count, 2)
+
+    def test_accepted_types_are_cached(self):
+        counter = Counter(1)
+        counter.count = 3
+
+        plan = Counter.__runtime_typing_attribute_plan__
+        self.assertEqual(plan.attributes["count"][1], {int})
+        self.assertIsNone(plan.attributes["history"][1])
+
+    def test_constructor_is_validated(self):
+        with self.assertRaises(RuntimeTypingError):
+            Counter("oops")
+
+    def test_slots(self):
+        counter = SlottedCounter()
+        counter.count = 1
+
+        with self.assertWarns(RuntimeTypingWarning):
+            counter.count = "oops"
+
+    def test_dataclass(self):
+        counter = DataCounter(1)
+
+        with self.assertRaises(RuntimeTypingError):
+            counter.count = "oops"
+
+        with self.assertRaises(RuntimeTypingError):
+            DataCounter("oops")
+
+    def test_return_mode(self):
+        with self.assertRaises(ValueError):
+
+            @typed(validate_assignment=True, mode="return")
+            class ReturnModeCounter:
+                count: int
+
+    def test_sample(self):
+        @typed(validate_assignment=True, sample=0.0)
+        class SampledCounter:
+            count: int
+
+        counter = SampledCounter()
+        counter.count = "not an int"
+
+    def test_custom_instance_checks_are_not_cached(self):
+        account = Account()
+        account.balance = 1
+
+        self.assertIsNone(
+            Account.__runtime_typing_attribute_plan__.attributes["balance"][1]
+        )
+        with self.assertRaises(RuntimeTypingError):
+            account.balance = -1
+
+    def test_protocols_are_not_cached(self):
+        account = Account()
+        named = Named()
+        named.name = "name"
+        account.owner = named
+
+        with self.assertRaises(RuntimeTypingError):
+            account.owner = Named()
@@ -0,0 +1,59 @@
+import json
+
+from typing import Dict, List, Tuple, TypedDict
+from unittest import TestCase
+
+from runtime_typing import typed
+
+
+Child = TypedDict("Child", {"color": str})
+Parent = TypedDict("Parent", {"children": List[Child]})
+
+
+@typed(mode="return")
+def expect_parent(parent: Parent):
+    pass
+
+
+@typed(mode="return")
+def expect_dict_of_tuples(mapping: Dict[str, Tuple[int, ...]]):
+    pass
+
+
+class TestViolationPaths(TestCase):
+    def test_path_of_nested_typed_dict(self):
+        _, violations = expect_parent(
+            {"children": [{"color": "red"}, {"color": 1}]}
+        )
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0].path, ("parent", "children", 1, "color"))
+        self.assertEqual(
+            violations[0].parameter_name, "parent['children'][1]['color']"
+        )
+
+    def test_path_of_dict_key_and_value(self):
+        _, violations = expect_dict_of_tuples({1: (1,), "a": (1, "2")})
+
+        paths = [v.path for v in violations[0].violations]
+        self.assertEqual(paths, [("mapping", (1,)), ("mapping", "a", 1)])
+
+    def test_to_dict(self):
+        _, violations = expect_parent({"children": [{"color": 1}]})
+
+        record = violations[0].to_dict()
+
+        self.assertEqual(record["function"], f"{__name__}.expect_parent")
+        self.assertEqual(record["parameter"], "parent")
+        self.assertEqual(record["path"], ["parent", "children", 0, "color"])
+        self.assertEqual(record["expected"], "str")
+        self.assertEqual(record["got"], "int")
+        self.assertEqual(json.loads(violations[0].to_json()), record)
+
+    def test_complex_to_dict(self):
+        _, violations = expect_dict_of_tuples({1: ()})
+
+        record = violations[0].to_dict()
+
+        self.assertEqual(record["violations"][0]["path"], ["mapping", {"key": 1}])
+        json.dumps(record)
@@ -0,0 +1,99 @@
+import sys
+import time
+
+from threading import Thread
+from typing import Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+from runtime_typing import (
+    typed,
+    plan_statistics,
+    warmup,
+    warmup_in_background,
+    RuntimeTypingError,
+)
+from runtime_typing.plan import plan_of, ValidationPlan
+from runtime_typing.utils import cached_type_hints
+
+
+@typed
+def expect_int(x: int) -> int:
+    return x
+
+
+@typed
+class SomeClass:
+    def some_method(self, x: "int"):
+        pass
+
+    @staticmethod
+    def some_staticmethod(x: "int"):
+        pass
+
+
+@typed
+def expect_unresolvable(x: "UnresolvableName"):
+    pass
+
+
+class TestWarmup(TestCase):
+    def test_plans_are_compiled_lazily(self):
+        @typed
+        def expect_str(x: str):
+            pass
+
+        plan = plan_of(expect_str)
+        self.assertFalse(plan.compiled)
+
+        expect_str("s")
+        self.assertTrue(plan.compiled)
+
+    def test_warmup(self):
+        warmup(__name__)
+
+        self.assertTrue(plan_of(expect_int).compiled)
+        self.assertTrue(plan_of(SomeClass.some_method).compiled)
+        self.assertTrue(plan_of(SomeClass.some_staticmethod).compiled)
+        self.assertFalse(plan_of(expect_unresolvable).compiled)
+
+        self.assertEqual(warmup(sys.modules[__name__]), 0)
+
+        with self.assertRaises(RuntimeTypingError):
+            expect_int("not an int")
+
+    def test_warmup_in_background(self):
+        warmup_in_background("tests").join()
+
+        self.assertTrue(plan_of(expect_int).compiled)
+
+    def test_plan_statistics(self):
+        statistics = plan_statistics()
+
+        self.assertGreater(statistics["plans"], 0)
+        self.assertGreater(statistics["compiled"], 0)
+        self.assertGreaterEqual(statistics["compile_time"], 0.0)
+
+    def test_concurrent_compilation(self):
+        def expect_ints(*args: int):
+            pass
+
+        def slow_type_hints(func):
+            time.sleep(0.01)
+            return cached_type_hints(func)
+
+        plan = ValidationPlan(expect_ints)
+        seen = []
+        compiled = plan_statistics()["compiled"]
+        with patch("runtime_typing.plan.cached_type_hints", slow_type_hints):
+            threads = [
+                Thread(target=lambda: seen.append(plan.typed_arguments["args"]))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(seen, [Tuple[int, ...]] * 8)
+        self.assertEqual(plan_statistics()["compiled"], compiled + 1)